@@ -1,13 +1,316 @@
 """Extension of the ColumnTransformer class in Sklearn."""
+from collections import defaultdict
+
 import numpy as np
 import pandas as pd
 from scipy import sparse
 from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import FunctionTransformer
 from sklearn.utils import check_array
 
+from foreshadow.utils import is_sparse_frame
+
+
+_COLUMN_GROUP = "column_group"
+
+
+def _group_name(group):
+    """Name the transformer of a group of columns.
+
+    Args:
+        group: the position of the group.
+
+    Returns:
+        str: the name of the transformer in ColumnTransformerWrapper._iter.
+
+    """
+    return "{}_{}".format(_COLUMN_GROUP, group)
+
+
+def _take_columns(X, start, stop):
+    """Take a range of columns of a 2D output.
+
+    Args:
+        X: a numpy array, sparse array or DataFrame
+        start: the first column
+        stop: the column after the last one
+
+    Returns:
+        the columns of X from start to stop.
+
+    """
+    if isinstance(X, pd.DataFrame):
+        return X.iloc[:, start:stop]
+    if sparse.issparse(X):
+        return X.tocsc()[:, start:stop]
+    return X[:, start:stop]
+
+
+def _frame_blocks(X):
+    """Get the dtype, column positions and values of the blocks of a frame.
+
+    The blocks give the dtype and the values of the columns without
+    creating a Series per column, which costs more than the rest of the
+    assembly. They are private to pandas and may change between versions.
+
+    Args:
+        X: DataFrame
+
+    Returns:
+        list of (dtype, column positions, 2D values) tuples, one per block.
+
+    """
+    return [
+        (block.dtype, block.mgr_locs.as_array, block.values)
+        for block in X._data.blocks
+    ]
+
+
+def _assemble_frames(Xs):
+    """Stack DataFrames horizontally into preallocated blocks.
+
+    The width of the output is computed from the frames, and one array is
+    allocated per dtype, where each column is written into its slice. When
+    every column has the same numpy dtype, the output frame is backed by
+    this array without another copy. Otherwise, the frame has one block
+    per dtype instead of one block per column as with pd.concat, so the
+    next steps do not consolidate it.
+
+    Args:
+        Xs: List of DataFrames
+
+    Returns:
+        the stacked DataFrame, or None if the frames do not share the same
+        index, have extension dtypes or no columns, or if the blocks of the
+        frames cannot be read, which pd.concat handles.
+
+    """
+    index = Xs[0].index
+    columns = []
+    columns_by_dtype = defaultdict(list)
+    for X in Xs:
+        if not X.index.equals(index):
+            return None
+        try:
+            blocks = _frame_blocks(X)
+        except AttributeError:  # other pandas internals
+            return None
+        for dtype, locs, block_values in blocks:
+            if not isinstance(dtype, np.dtype):
+                return None
+            for loc, values in zip(locs, block_values):
+                columns_by_dtype[dtype].append((len(columns) + loc, values))
+        columns.extend(X.columns)
+    if not columns:
+        return None
+
+    blocks = []
+    order = []
+    for dtype, arrays in columns_by_dtype.items():
+        # Fortran order makes each column contiguous, which is also the
+        # layout of the block of the output frame.
+        block = np.empty((len(index), len(arrays)), dtype=dtype, order="F")
+        for j, (position, array) in enumerate(arrays):
+            block[:, j] = array
+            order.append(position)
+        blocks.append(pd.DataFrame(block, index=index, copy=False))
+    if len(blocks) == 1:
+        out = blocks[0]
+    else:
+        out = pd.concat(blocks, axis=1, copy=False)
+        out = out.iloc[:, np.argsort(order)]
+    out.columns = columns
+    return out
+
+
+def _has_sparse_columns(X):
+    """Check if an output is a DataFrame with sparse columns.
+
+    Args:
+        X: a numpy array, sparse array or DataFrame
+
+    Returns:
+        bool: True if X is a DataFrame with at least one sparse column.
+
+    """
+    return isinstance(X, pd.DataFrame) and any(
+        isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes
+    )
+
+
+def _is_numeric(X):
+    """Check if all the columns of an output are numeric.
+
+    Args:
+        X: a numpy array, sparse array or DataFrame
+
+    Returns:
+        bool: True if all the columns of X are numeric.
+
+    """
+    if isinstance(X, pd.DataFrame):
+        return all(pd.api.types.is_numeric_dtype(dtype) for dtype in X.dtypes)
+    return pd.api.types.is_numeric_dtype(X.dtype)
+
 
 class ColumnTransformerWrapper(ColumnTransformer):
-    """See the Docstring in parent class."""
+    """See the Docstring in parent class.
+
+    After fit, the columns of fitted transformers that apply the same
+    transformation to each column can be grouped with group_columns, so
+    that transform calls a single transformer on each group of columns
+    instead of each transformer on its column.
+
+    When the transformers keep their sparse outputs as sparse DataFrame
+    columns and all the columns are numeric, the outputs are stacked into a
+    CSR matrix, as with sparse_output_.
+
+    """
+
+    _column_groups = None
+    _sparse_frames_output = None
+
+    def fit_transform(self, X, y=None):
+        """See the Docstring in parent class.
+
+        Args:
+            X: input data
+            y: targets
+
+        Returns:
+            the stacked outputs of the transformers.
+
+        """
+        self._column_groups = None
+        self._sparse_frames_output = None
+        return super().fit_transform(X, y=y)
+
+    def group_columns(self, groups):
+        """Transform the columns of some fitted transformers as blocks.
+
+        Each group replaces the fitted transformers of single columns with
+        one transformer applied to all their columns, in the order of the
+        names of the group, which must return one column per input column
+        in the same order. The grouped transformers are kept in
+        transformers_ and the order of the output columns does not change.
+
+        Args:
+            groups: (names, transformer) pairs, where names are the names of
+                the fitted transformers to group and transformer is either
+                "passthrough" or a fitted transformer.
+
+        """
+        groups = [(list(names), trans) for names, trans in groups]
+        groups = [(names, trans) for names, trans in groups if len(names) > 1]
+        self._column_groups = groups or None
+
+    def group_passthrough(self, names):
+        """Transform the columns of some fitted transformers as one block.
+
+        The transformers must return their single column unchanged.
+
+        Args:
+            names: the names of the fitted transformers to group.
+
+        """
+        self.group_columns([(names, "passthrough")])
+
+    def _iter(self, fitted=False, replace_strings=False):
+        """Generate (name, trans, column, weight) tuples.
+
+        See the Docstring in parent class. The grouped transformers are
+        replaced by a single transformer on the columns of each group, at
+        the position of the first column of the group.
+
+        Args:
+            fitted: whether to use the fitted transformers.
+            replace_strings: whether to replace the "passthrough" and
+                "drop" strings.
+
+        Yields:
+            (name, trans, column, weight) tuples.
+
+        """
+        entries = super()._iter(fitted=fitted, replace_strings=replace_strings)
+        if not (fitted and replace_strings and self._column_groups):
+            yield from entries
+            return
+
+        group_of = self._group_of_names()
+        grouped_columns = [
+            [None] * len(names) for names, _ in self._column_groups
+        ]
+        positions = {}
+        others = []
+        for name, trans, column, weight in entries:
+            if name in group_of:
+                k, j = group_of[name]
+                grouped_columns[k][j] = column
+                positions.setdefault(k, len(others) + len(positions))
+            else:
+                others.append((name, trans, column, weight))
+        for k in sorted(positions, key=positions.get):
+            trans = self._column_groups[k][1]
+            if isinstance(trans, str):
+                trans = FunctionTransformer(
+                    accept_sparse=True, check_inverse=False
+                )
+            others.insert(
+                positions[k], (_group_name(k), trans, grouped_columns[k], None)
+            )
+        yield from others
+
+    def _group_of_names(self):
+        """Locate the grouped transformers.
+
+        Returns:
+            dict: the (group, position in the group) of each grouped
+                transformer name.
+
+        """
+        return {
+            name: (k, j)
+            for k, (names, _) in enumerate(self._column_groups)
+            for j, name in enumerate(names)
+        }
+
+    def _restore_column_order(self, Xs):
+        """Split the grouped outputs back to the position of each column.
+
+        Args:
+            Xs: the outputs of the transformers, in the order of _iter.
+
+        Returns:
+            the outputs in the order of transformers_, where the grouped
+            columns are split into the runs of consecutive columns.
+
+        """
+        names = [
+            name
+            for name, _, _, _ in self._iter(fitted=True, replace_strings=True)
+        ]
+        outputs = dict(zip(names, Xs))
+        group_of = self._group_of_names()
+
+        # Each grouped column extends the run of the previous column when
+        # it follows it in the output of the same group.
+        pieces = []
+        for name, _, _, _ in super()._iter(fitted=True, replace_strings=True):
+            if name not in group_of:
+                pieces.append(outputs[name])
+                continue
+            k, j = group_of[name]
+            run = pieces[-1] if pieces else None
+            if isinstance(run, list) and run[0] == k and run[2] == j:
+                run[2] += 1
+            else:
+                pieces.append([k, j, j + 1])
+        return [
+            _take_columns(outputs[_group_name(piece[0])], *piece[1:])
+            if isinstance(piece, list)
+            else piece
+            for piece in pieces
+        ]
 
     def _hstack(self, Xs):
         """Stacks Xs horizontally. # noqa DAR201
@@ -30,13 +333,27 @@ class ColumnTransformerWrapper(ColumnTransformer):
         """
         # TODO check how adding a text transformer (TFIDF) could affect this
         #  logic.
-        if self.sparse_output_:
+        if self._column_groups:
+            Xs = self._restore_column_order(Xs)
+        if self._sparse_frames_output is None:
+            # Decided when stacking the outputs of fit_transform, so that
+            # transform gives the same kind of output.
+            self._sparse_frames_output = any(
+                _has_sparse_columns(X) for X in Xs
+            ) and all(_is_numeric(X) for X in Xs)
+        if self.sparse_output_ or self._sparse_frames_output:
             try:
                 # since all columns should be numeric before stacking them
                 # in a sparse matrix, `check_array` is used for the
                 # dtype conversion if necessary.
                 converted_Xs = [
-                    check_array(X, accept_sparse=True, force_all_finite=False)
+                    X.sparse.to_coo()
+                    if is_sparse_frame(X)
+                    else sparse.csr_matrix(
+                        check_array(
+                            X, accept_sparse=True, force_all_finite=False
+                        )
+                    )
                     for X in Xs
                 ]
             except ValueError:
@@ -59,10 +376,8 @@ class ColumnTransformerWrapper(ColumnTransformer):
                     Xs[ind] = f.toarray()
 
             if all_df:
-                return pd.concat(Xs, axis=1)
-            else:
-                np.hstack(Xs)
-            # Xs = [f.toarray() if sparse.issparse(f) else f for f in Xs]
-            # if all([isinstance(item, pd.DataFrame) for item in Xs]):
-            #     return pd.concat(Xs, axis=1)
-            # return np.hstack(Xs)
+                out = _assemble_frames(Xs)
+                if out is None:
+                    out = pd.concat(Xs, axis=1)
+                return out
+            return np.hstack(Xs)
@@ -42,6 +42,54 @@ class PrettyDefaultDict(defaultdict):
     __repr__ = dict.__repr__
 
 
+class _JournaledDict(MutableMapping):
+    """View of a nested dict of a CacheManager that journals its writes.
+
+    Params:
+        cache_manager: the CacheManager holding the journal.
+        key: the key of the nested dict.
+
+    """
+
+    def __init__(self, cache_manager, key):
+        self.cache_manager = cache_manager
+        self.key = key
+
+    def _data(self):
+        return self.cache_manager.store[self.key]
+
+    def __getitem__(self, column):
+        return self._data()[column]
+
+    def __setitem__(self, column, value):
+        self.cache_manager[self.key, column] = value
+
+    def __delitem__(self, column):
+        del self.cache_manager[self.key, column]
+
+    def __contains__(self, column):
+        return column in self._data()
+
+    def get(self, column, default=None):
+        return self._data().get(column, default)
+
+    def pop(self, column, *default):
+        if column not in self._data():
+            return self._data().pop(column, *default)
+        value = self._data()[column]
+        del self[column]
+        return value
+
+    def __iter__(self):
+        return iter(self._data())
+
+    def __len__(self):
+        return len(self._data())
+
+    def __repr__(self):
+        return repr(self._data())
+
+
 class CacheManager(MutableMapping):
     """Main cache-class to be used as single-instance to share data.
 
@@ -54,8 +102,15 @@ class CacheManager(MutableMapping):
     .. automethod:: __iter__
     .. automethod:: __len__
 
+    While a journal is started, the writes are also recorded in order, so
+    that the writes made on copies of a CacheManager, such as the ones
+    held by the transformers fitted in other processes, can be merged back
+    with merge_journal.
+
     """
 
+    _journal = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.store = PrettyDefaultDict(get_pretty_default_dict)
@@ -71,6 +126,7 @@ class CacheManager(MutableMapping):
             AcceptedKey.CONFIG: True,
             AcceptedKey.CUSTOMIZED_TRANSFORMERS: True,
             AcceptedKey.SUMMARY: True,
+            AcceptedKey.SAMPLE: True,
         }
         self.__acceptable_keys = PrettyDefaultDict(get_false, acceptable_keys)
         self._initialize_default_config()
@@ -90,7 +146,31 @@ class CacheManager(MutableMapping):
         self[AcceptedKey.CONFIG][
             ConfigKey.SAMPLING_FRACTION
         ] = DefaultConfig.SAMPLING_FRACTION
+        self[AcceptedKey.CONFIG][
+            ConfigKey.SAMPLING_STRATEGY
+        ] = DefaultConfig.SAMPLING_STRATEGY
+        self[AcceptedKey.CONFIG][
+            ConfigKey.SAMPLING_RANDOM_STATE
+        ] = DefaultConfig.SAMPLING_RANDOM_STATE
         self[AcceptedKey.CONFIG][ConfigKey.N_JOBS] = DefaultConfig.N_JOBS
+        self[AcceptedKey.CONFIG][
+            ConfigKey.ENABLE_INTENT_CACHE
+        ] = DefaultConfig.ENABLE_INTENT_CACHE
+        self[AcceptedKey.CONFIG][
+            ConfigKey.INTENT_CACHE_TTL
+        ] = DefaultConfig.INTENT_CACHE_TTL
+        self[AcceptedKey.CONFIG][
+            ConfigKey.INTENT_CACHE_MAX_ENTRIES
+        ] = DefaultConfig.INTENT_CACHE_MAX_ENTRIES
+        self[AcceptedKey.CONFIG][
+            ConfigKey.ENABLE_INCREMENTAL_INTENT_RESOLUTION
+        ] = DefaultConfig.ENABLE_INCREMENTAL_INTENT_RESOLUTION
+        self[AcceptedKey.CONFIG][
+            ConfigKey.INTENT_DRIFT_TOLERANCE
+        ] = DefaultConfig.INTENT_DRIFT_TOLERANCE
+        self[AcceptedKey.CONFIG][
+            ConfigKey.ENABLE_SPARSE_OUTPUT
+        ] = DefaultConfig.ENABLE_SPARSE_OUTPUT
 
     def _initialize_default_customized_transformers(self) -> NoReturn:
         """Initialize the default customized transformers."""
@@ -109,6 +189,43 @@ class CacheManager(MutableMapping):
         """
         return len(self["override"]) > 0
 
+    def start_journal(self):
+        """Start recording the writes made on this object and its copies.
+
+        The journal is copied along with this object, so each copy records
+        its own writes from then on.
+
+        """
+        self._journal = []
+
+    def stop_journal(self):
+        """Stop recording the writes.
+
+        Returns:
+            list: the writes recorded since start_journal, in order, as
+                (operation, key, column, value) tuples where operation is
+                "set" or "del".
+
+        """
+        journal, self._journal = self._journal, None
+        return journal if journal is not None else []
+
+    def merge_journal(self, journal):
+        """Replay the writes recorded by a copy of this object.
+
+        Args:
+            journal: the writes, as returned by stop_journal.
+
+        """
+        for operation, key, column, value in journal:
+            if operation == "del":
+                if column in self.store[key]:
+                    del self[key, column]
+            elif column is None:
+                self[key] = value
+            else:
+                self[key, column] = value
+
     def __getitem__(self, key_list):
         """Override getitem to support multi key accessing simultaneously.
 
@@ -142,6 +259,8 @@ class CacheManager(MutableMapping):
         key_dict = self.store[key]
         if column is not None:  # then get the column if requested
             return key_dict[column]
+        if self._journal is not None:  # so that nested writes are recorded
+            return _JournaledDict(self, key)
         return key_dict  # otherwise return all the columns
 
     def __setitem__(self, key_list, value):
@@ -173,6 +292,8 @@ class CacheManager(MutableMapping):
         """
         key, column = self._convert_key(key_list)
         self.check_key(key)
+        if self._journal is not None:
+            self._journal.append(("set", key, column, value))
         if column is None:  # setting the value for the entire key
             self.store[key] = value
         else:  # setting a particular column's value for a given key.
@@ -239,6 +360,8 @@ class CacheManager(MutableMapping):
                 "pass a key and a column."
             )
         del self.store[key][column]
+        if self._journal is not None:
+            self._journal.append(("del", key, column, None))
 
     def __iter__(self):
         """Will return list of (key, column) tuples ordered by key.
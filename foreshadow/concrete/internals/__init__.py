@@ -46,6 +46,7 @@ __all__ = [
     "DollarFinancialCleaner",
     "DropCleaner",
     "StandardJsonFlattener",
+    "ColumnarJsonFlattener",
     "NoTransform",
     "NaNFiller",
 ] + c_all
@@ -7,6 +7,7 @@ from foreshadow.concrete.internals.cleaners.financial_cleaner import (
     DollarFinancialCleaner,
 )
 from foreshadow.concrete.internals.cleaners.json_flattener import (
+    ColumnarJsonFlattener,
     StandardJsonFlattener,
 )
 
@@ -16,4 +17,5 @@ __all__ = [
     "DropCleaner",
     "DollarFinancialCleaner",
     "StandardJsonFlattener",
+    "ColumnarJsonFlattener",
 ]
@@ -2,6 +2,7 @@
 
 from collections import namedtuple
 
+import numpy as np
 import pandas as pd
 
 from foreshadow.base import BaseEstimator, TransformerMixin
@@ -11,12 +12,75 @@ from foreshadow.metrics import (
     MetricWrapper,
     avg_col_regex,
     calculate_percentage_of_rows_matching_regex,
+    weighted_cleaner_metrics,
 )
 from foreshadow.utils import check_df
 
 
 CleanerReturn = namedtuple("CleanerReturn", ["row", "match_lens"])
 
+# Output schemas a cleaner can declare: a single column, a list of a fixed
+# number of columns per row, or a dict of named columns per row.
+SINGLE_OUTPUT = "single"
+LIST_OUTPUT = "list"
+DICT_OUTPUT = "dict"
+
+
+def series_as_text(series):
+    """Convert each row of a column to text, as str does.
+
+    Args:
+        series: one column of the data, as a pandas Series.
+
+    Returns:
+        An object Series of strings, with the same index.
+
+    """
+    return pd.Series(
+        [str(value) for value in series], index=series.index, dtype=object
+    )
+
+
+def _find_output_schema(rows):
+    """Find the output schema of a cleaner that did not declare it.
+
+    Args:
+        rows: the output of each row, as a numpy array.
+
+    Returns:
+        LIST_OUTPUT if any row is a list or a tuple, otherwise DICT_OUTPUT if
+        any row is a dict, otherwise SINGLE_OUTPUT.
+
+    """
+    types = set(map(type, rows))
+    if any(issubclass(t, (list, tuple)) for t in types):
+        return LIST_OUTPUT
+    if any(issubclass(t, dict) for t in types):
+        return DICT_OUTPUT
+    return SINGLE_OUTPUT
+
+
+def _object_arrays_to_frame(data, columns, index):
+    """Build a DataFrame from object arrays, inferring their types.
+
+    Args:
+        data: one object numpy array per column.
+        columns: the name of each column.
+        index: the index of the DataFrame.
+
+    Returns:
+        :obj:`pandas.DataFrame`: the columns with the types pandas would
+        infer from the values.
+
+    """
+    frame = pd.DataFrame(
+        dict(zip(range(len(columns)), data)),
+        index=index,
+        columns=range(len(columns)),
+    ).infer_objects()
+    frame.columns = columns
+    return frame
+
 
 def return_original_row(x):  # noqa: D401
     """Method that returns the row as is.
@@ -34,6 +98,17 @@ def return_original_row(x):  # noqa: D401
 class BaseCleaner(BaseEstimator, TransformerMixin):
     """Base class for any Cleaner Transformer."""
 
+    # Scores below this threshold are set to 0, so that the cleaner is
+    # never picked.
+    score_threshold = None
+    # Columns whose ratio of distinct values to rows is below this
+    # threshold are cleaned once per distinct value by the default
+    # transform_series. None always cleans each row.
+    unique_ratio_threshold = 0.5
+    # SINGLE_OUTPUT, LIST_OUTPUT or DICT_OUTPUT if every row is cleaned into
+    # the same kind of output. None finds it from the output of the rows.
+    output_schema = None
+
     def __init__(
         self,
         transformations,
@@ -51,7 +126,8 @@ class BaseCleaner(BaseEstimator, TransformerMixin):
             output_columns: If none, any lists returned by the transformations
                 are assumed to be separate columns in the new DataFrame.
                 Otherwise, pass the names for each desired output
-                column to be used.
+                column to be used, or their number. For dicts, the names
+                are the keys to keep.
             confidence_computation: The dict of {metric: weight} for the
                 subclass's metric computation. This implies an OVR model.
             default: Function that returns the default value for a row if
@@ -91,16 +167,47 @@ class BaseCleaner(BaseEstimator, TransformerMixin):
             float: confidence value.
 
         """
-        # TODO can we also do a sampling here?
+        return self._metric_score(X)
+
+    def _metric_score(self, X, matches=None):
+        """Compute the score for this cleaner from its matches, if known.
+
+        Args:
+            X: input DataFrame.
+            matches: the CleanerMatches of the cleaner on X, computed from
+                transform_row if None.
+
+        Returns:
+            float: confidence value.
+
+        """
         logging.debug("Calculating scores....")
-        scores = []
-        for metric_wrapper, weight in self.confidence_computation.items():
-            scores.append(
-                metric_wrapper.calculate(X, cleaner=self.transform_row)
-                * weight
-            )
+        scores = weighted_cleaner_metrics(
+            X, self.transform_row, self.confidence_computation, matches
+        )
         logging.debug("End calculating scores...")
-        return sum(scores)
+        score = sum(scores)
+        if self.score_threshold is not None and score < self.score_threshold:
+            return 0
+        return score
+
+    def max_match_lens(self, text_lens):
+        """Bound the length matched by the transformations on each row.
+
+        The bound lets the Cleaner stop scoring a cleaner that can no longer
+        be picked. Subclasses whose transformations only match substrings of
+        a row should return `text_lens`.
+
+        Args:
+            text_lens: the length of each row converted to text, as a numpy
+                array.
+
+        Returns:
+            An upper bound of the minimum match length of each row, as a
+            numpy array, or None if there is no known bound.
+
+        """
+        return None
 
     def transform_row(self, row_of_feature, return_tuple=True):
         """Perform clean operations on text, that is a row of feature.
@@ -140,6 +247,87 @@ class BaseCleaner(BaseEstimator, TransformerMixin):
         else:
             return row
 
+    def transform_series(self, series):
+        """Clean a whole column at once.
+
+        Subclasses can override this method with a vectorized
+        implementation. By default, each row is cleaned by transform_row,
+        or each distinct value if there are few of them compared to the
+        rows, in which case the rows of a value share its result.
+
+        Args:
+            series: one column of the data, as a pandas Series.
+
+        Returns:
+            tuple: the cleaned values, as a Series, or a DataFrame if there
+            are several output columns, and the minimum number of characters
+            matched by the transformations on each row, as a Series.
+
+        """
+        factorized = self._factorize(series)
+        if factorized is None:
+            return self._transform_rows(series)
+
+        codes, distinct = factorized
+        values, match_lens = self._transform_rows(distinct)
+        # Broadcast the result of each distinct value back to its rows
+        values = values.iloc[codes]
+        match_lens = match_lens.iloc[codes]
+        values.index = match_lens.index = series.index
+        values.name = match_lens.name = series.name
+        return values, match_lens
+
+    def _transform_rows(self, series):
+        results = series.apply(self.transform_row)
+        values = results.apply(lambda result: result.row)
+        match_lens = results.apply(lambda result: min(result.match_lens))
+        return values, match_lens
+
+    def _factorize(self, series):
+        """Encode a column as codes into its distinct values.
+
+        Only columns of strings, integers, booleans and categories are
+        encoded, as distinct values of other types may be equal while
+        having a different text, such as 0.0 and -0.0. Missing values are
+        kept as distinct values of their own, since None and NaN are not
+        cleaned the same way.
+
+        Args:
+            series: one column of the data, as a pandas Series.
+
+        Returns:
+            tuple: the position of the distinct value of each row, as a
+            numpy array, and the distinct values, as an object Series. None
+            if the column should be cleaned row by row.
+
+        """
+        threshold = self.unique_ratio_threshold
+        if threshold is None or len(series) == 0:
+            return None
+        if not (
+            pd.api.types.is_integer_dtype(series)
+            or pd.api.types.is_bool_dtype(series)
+            or pd.api.types.is_categorical_dtype(series)
+            or pd.api.types.infer_dtype(series, skipna=True) == "string"
+        ):
+            return None
+
+        codes, uniques = pd.factorize(series)
+        missing = np.flatnonzero(codes == -1)
+        n_distinct = len(uniques) + len(missing)
+        if n_distinct >= threshold * len(series):
+            return None
+        codes[missing] = np.arange(len(uniques), n_distinct)
+        distinct = pd.Series(
+            uniques.tolist() + series.iloc[missing].tolist(), dtype=object
+        )
+        logging.debug(
+            "Cleaning {} distinct values of {} rows".format(
+                n_distinct, len(series)
+            )
+        )
+        return codes, distinct
+
     def fit(self, X, y=None):
         """Empty fit.
 
@@ -166,6 +354,9 @@ class BaseCleaner(BaseEstimator, TransformerMixin):
         the value is the value for that row in that column. NaNs
         are automatically put into the columns that don't exist for given rows.
 
+        Cleaners that declare their `output_schema` skip looking for lists
+        and dicts in the output.
+
         Args:
             X (:obj:`pandas.Series`): X data
             y: input labels
@@ -174,58 +365,116 @@ class BaseCleaner(BaseEstimator, TransformerMixin):
             :obj:`pandas.DataFrame`: Transformed data
 
         Raises:
-            InvalidDataFrame: If unexpected output returned that was not
-                handled correctly. This happens if the output specified by the
-                child does not match what is actually returned. The child
-                should ensure it's implementation is consistent.
+            ValueError: If the output_schema is unknown.
 
         """
         X = check_df(X, single_column=True)
         logging.info("Starting cleaning rows...")
-        out = X[X.columns[0]].apply(self.transform_row, return_tuple=False)
-        logging.info("Ending cleaning rows...")
         # access single column as series and apply the list of
-        # transformations to each row in the series.
-        if any(
-            [
-                isinstance(out.iloc[i], (list, tuple))
-                for i in range(out.shape[0])
-            ]
-        ):  # out are lists == new columns
-            if not all(
-                [
-                    len(out.iloc[0]) == len(out.iloc[i])
-                    for i in range(len(out.iloc[0]))
-                ]
-            ):
-                raise InvalidDataFrame(
-                    "length of lists: {}, returned not of same value.".format(
-                        [out.iloc[i] for i in range(len(out[0]))]
-                    )
-                )
+        # transformations to the series.
+        out, _ = self.transform_series(X[X.columns[0]])
+        logging.info("Ending cleaning rows...")
+        if isinstance(out, pd.DataFrame):  # vectorized new columns
             columns = self.output_columns
-            if columns is None:
-                # by default, pandas would have given a unique integer to
-                # each column, instead, we keep the previous column name and
-                # add that integer.
-                columns = [
-                    X.columns[0] + str(c) for c in range(len(out.iloc[0]))
-                ]
-            # We need to set the index. Otherwise, the new data frame might
-            # misalign with other columns.
-            X = pd.DataFrame([*out.values], index=out.index, columns=columns)
-        elif any(
-            [isinstance(out.iloc[i], (dict)) for i in range(out.shape[0])]
-        ):  # out are dicts ==  named new columns
-            all_keys = dict()
-            for row in out:
-                all_keys.update({key: True for key in row})  # get all columns
-            columns = list(all_keys.keys())
-            out = pd.DataFrame([*out.values], columns=columns)
-            out.columns = [X.columns[0] + "_" + c for c in columns]
-            X = out
-            # by default, this will create a DataFrame where if a row
-            # contains the value, it will be added, if not NaN is added.
-        else:  # no lists, still 1 column output
-            X[X.columns[0]] = out
+            if not isinstance(columns, list):
+                columns = [X.columns[0] + str(c) for c in range(out.shape[1])]
+            out.columns = columns
+            return out.set_index(X.index)
+
+        schema = self.output_schema
+        if schema is None:
+            schema = _find_output_schema(out.values)
+        if schema == LIST_OUTPUT:  # out are lists == new columns
+            return self._list_output_to_frame(out.values, X)
+        elif schema == DICT_OUTPUT:  # out are dicts ==  named new columns
+            return self._dict_output_to_frame(out.values, X)
+        elif schema != SINGLE_OUTPUT:
+            raise ValueError(
+                "Unknown output schema {}, expected one of {}".format(
+                    schema, (SINGLE_OUTPUT, LIST_OUTPUT, DICT_OUTPUT)
+                )
+            )
+        # no lists, still 1 column output
+        X[X.columns[0]] = out
         return X
+
+    def _list_output_to_frame(self, rows, X):
+        """Build one column per position of the lists of the output.
+
+        Args:
+            rows: the output of each row, as a numpy array of lists.
+            X: the input DataFrame.
+
+        Returns:
+            :obj:`pandas.DataFrame`: the new columns, with the index of X.
+
+        Raises:
+            InvalidDataFrame: If the lists are not all of the expected
+                length, which is either the number of output_columns or the
+                length of the first list.
+
+        """
+        columns = self.output_columns
+        if isinstance(columns, list):
+            width = len(columns)
+        elif isinstance(columns, int):
+            width = columns
+        elif len(rows):
+            width = len(rows[0])
+        else:
+            width = 0
+        if not isinstance(columns, list):
+            # by default, pandas would have given a unique integer to
+            # each column, instead, we keep the previous column name and
+            # add that integer.
+            columns = [X.columns[0] + str(c) for c in range(width)]
+
+        try:
+            lengths = np.fromiter(map(len, rows), dtype=int, count=len(rows))
+        except TypeError:
+            lengths = None
+        if lengths is None or (lengths != width).any():
+            raise InvalidDataFrame(
+                "length of lists: {}, returned not of same value.".format(
+                    rows[:width].tolist()
+                )
+            )
+
+        data = [np.empty(len(rows), dtype=object) for _ in range(width)]
+        for i, row in enumerate(rows):
+            for array, value in zip(data, row):
+                array[i] = value
+        # We need to set the index. Otherwise, the new data frame might
+        # misalign with other columns.
+        return _object_arrays_to_frame(data, columns, X.index)
+
+    def _dict_output_to_frame(self, rows, X):
+        """Build one column per key of the dicts of the output.
+
+        The keys are the output_columns if provided, otherwise the keys found
+        in any row, in the order they are found.
+
+        Args:
+            rows: the output of each row, as a numpy array of dicts.
+            X: the input DataFrame.
+
+        Returns:
+            :obj:`pandas.DataFrame`: the new columns, with the index of X.
+            Rows without a key, or that are not dicts, are NaN in its column.
+
+        """
+        rows = [row if isinstance(row, dict) else {} for row in rows]
+        keys = self.output_columns
+        if not isinstance(keys, list):
+            all_keys = dict()
+            for row in rows:
+                all_keys.update(dict.fromkeys(row))  # get all columns
+            keys = list(all_keys)
+
+        data = {key: np.full(len(rows), np.nan, dtype=object) for key in keys}
+        for i, row in enumerate(rows):
+            for key, value in row.items():
+                if key in data:
+                    data[key][i] = value
+        columns = [X.columns[0] + "_" + str(key) for key in keys]
+        return _object_arrays_to_frame(data.values(), columns, X.index)
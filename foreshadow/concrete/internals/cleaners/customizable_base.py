@@ -2,7 +2,13 @@
 
 from abc import abstractmethod
 
-from .base import BaseCleaner, CleanerReturn
+import numpy as np
+import pandas as pd
+
+from foreshadow.metrics import cleaner_matches_from_match_lens
+from foreshadow.utils import check_df
+
+from .base import BaseCleaner, CleanerReturn, series_as_text
 
 
 class CustomizableBaseCleaner(BaseCleaner):
@@ -82,3 +88,140 @@ class CustomizableBaseCleaner(BaseCleaner):
             return CleanerReturn(transformed_row, matched_lengths)
         else:
             return transformed_row
+
+
+class VectorizedCustomizableBaseCleaner(BaseCleaner):
+    """Base class for user cleaners that transform a whole column at once.
+
+    Unlike CustomizableBaseCleaner, the user provided transformation is
+    called once per column instead of once per row. It receives the column
+    and returns the cleaned values and the number of characters matched on
+    each row, where 0 means the row did not match. Both are array-likes
+    with one element per row. The cleaned values can also be a DataFrame or
+    a 2D array, one column per output column.
+
+    The cleaner is scored from the match lengths of a single call, unless
+    metric_score is overridden.
+
+    Params:
+        transformation: a callable that takes a column and returns its
+            cleaned values and match lengths.
+        input_type: the type of the column passed to the transformation.
+            "series" for a pandas Series, "object" for a numpy object array
+            of the values or "str" for a numpy string array of the values
+            converted to text.
+
+    """
+
+    input_types = ("series", "object", "str")
+
+    def __init__(self, transformation, input_type="series"):
+        """Construct a user supplied vectorized cleaner. # noqa S001
+
+        Args:
+            transformation: a callable that takes a column and returns its
+                cleaned values and match lengths.
+            input_type: "series", "object" or "str".
+
+        Raises:
+            ValueError: If the input_type is unknown.
+
+        """
+        if input_type not in self.input_types:
+            raise ValueError(
+                "input_type {} is not one of {}".format(
+                    input_type, self.input_types
+                )
+            )
+        super().__init__([transformation])
+        self.input_type = input_type
+
+    def metric_score(self, X):
+        """Compute the score from the match lengths of a single call.
+
+        Args:
+            X: a column as a dataframe.
+
+        Returns:
+            float: confidence value.
+
+        """
+        X = check_df(X, single_column=True)
+        if len(X) == 0:
+            return 0
+        _, match_lens = self.transform_series(X[X.columns[0]])
+        return self._metric_score(
+            X, cleaner_matches_from_match_lens(X, match_lens)
+        )
+
+    def transform_series(self, series):
+        """Clean a whole column with the user provided transformation.
+
+        Args:
+            series: one column of the data, as a pandas Series.
+
+        Returns:
+            tuple: the cleaned values, as a Series, or a DataFrame if there
+            are several output columns, and the match length of each row,
+            as a Series.
+
+        Raises:
+            ValueError: If the transformation does not return one value and
+                one match length per row.
+
+        """
+        if self.input_type == "object":
+            column = series.to_numpy(dtype=object)
+        elif self.input_type == "str":
+            column = series_as_text(series).to_numpy(dtype=str)
+        else:
+            column = series
+        (transformation,) = self.transformations
+        values, match_lens = transformation(column)
+        match_lens = np.asarray(match_lens)
+        if len(values) != len(series) or len(match_lens) != len(series):
+            raise ValueError(
+                "{} returned {} values and {} match lengths for {} "
+                "rows.".format(
+                    type(self).__name__,
+                    len(values),
+                    len(match_lens),
+                    len(series),
+                )
+            )
+
+        if isinstance(values, pd.DataFrame):
+            values = values.set_index(series.index)
+        elif np.ndim(values) == 2:
+            values = pd.DataFrame(values, index=series.index)
+        else:
+            if isinstance(values, pd.Series):
+                values = values.values
+            values = pd.Series(values, index=series.index, name=series.name)
+        match_lens = pd.Series(
+            match_lens, index=series.index, name=series.name
+        )
+        return values, match_lens
+
+    def transform_row(self, row_of_feature, return_tuple=True):
+        """Clean a single row, as a column of one row.
+
+        Args:
+            row_of_feature: one row of one column
+            return_tuple: return named_tuple object instead of just the row.
+
+        Returns:
+            See BaseCleaner.transform_row. Rows cleaned into several columns
+            are returned as lists.
+
+        """
+        values, match_lens = self.transform_series(
+            pd.Series([row_of_feature], dtype=object)
+        )
+        row = values.iloc[0]
+        if isinstance(values, pd.DataFrame):
+            row = row.tolist()
+        if return_tuple:
+            return CleanerReturn(row, [match_lens.iloc[0]])
+        else:
+            return row
@@ -1,7 +1,17 @@
 """Transforms for datetime inputs."""
 import re
 
-from .base import BaseCleaner
+import numpy as np
+import pandas as pd
+
+from .base import LIST_OUTPUT, BaseCleaner, series_as_text
+
+
+_DATE_REGEX = r"^.*(([\d]{4})[-/]([\d]{2})[-/]([\d]{2})).*$"
+_DATE_PATTERN = re.compile(_DATE_REGEX)
+_DATE_LEN = 10
+# `$` also matches before a trailing newline, which re.sub keeps.
+_DATE_SERIES_PATTERN = re.compile(_DATE_REGEX[:-1] + r"(\n?)\Z")
 
 
 def _split_to_new_cols(t):
@@ -15,15 +25,14 @@ def _split_to_new_cols(t):
         Otherwise: None, original text.
 
     """
-    delimiters = "[-/]"
-    regex = r"^.*(([\d]{{4}}){delim}([\d]{{2}}){delim}([\d]{{2}})).*$".format(
-        delim=delimiters
-    )
     text = str(t)
-    res = re.search(regex, text)
+    res = _DATE_PATTERN.search(text)
     if res is not None:
-        res = sum([len(range(reg[0], reg[1])) for reg in res.regs[1:2]])
-        texts = [re.sub(regex, r"\{}".format(i), text) for i in range(2, 5)]
+        # The pattern matches the whole text, up to a trailing newline.
+        end = res.end()
+        tail = text[end:]
+        texts = [res.group(i) + tail for i in range(2, 5)]
+        res = len(res.group(1))
     else:
         texts = t
         res = 0
@@ -52,7 +61,51 @@ class YYYYMMDDDateCleaner(BaseCleaner):
 
     """
 
+    output_schema = LIST_OUTPUT
+
     def __init__(self):
         transformations = [_split_to_new_cols]
         default = make_list_of_three
         super().__init__(transformations, default=default)
+
+    def transform_series(self, series):
+        """Split the dates of a whole column into three columns.
+
+        Args:
+            series: one column of the data, as a pandas Series.
+
+        Returns:
+            tuple: the year, month and day of each row as a DataFrame, or
+            make_list_of_three of the row if it is not a date, and the
+            number of characters of each date.
+
+        """
+        groups = series_as_text(series).str.extract(_DATE_SERIES_PATTERN)
+        matched = groups[0].notna()
+        tail = groups[4].fillna("")
+        values = pd.DataFrame(
+            {
+                0: (groups[1] + tail).where(matched, series.astype(object)),
+                1: (groups[2] + tail).where(matched, ""),
+                2: (groups[3] + tail).where(matched, ""),
+            }
+        ).infer_objects()
+        # Dates always have 10 characters, such as 2019-01-31
+        match_lens = pd.Series(
+            np.where(matched, _DATE_LEN, 0),
+            index=series.index,
+            name=series.name,
+        )
+        return values, match_lens
+
+    def max_match_lens(self, text_lens):
+        """Bound the length matched by the transformations on each row.
+
+        Args:
+            text_lens: the length of each row converted to text.
+
+        Returns:
+            `text_lens`, as _split_to_new_cols only matches substrings.
+
+        """
+        return text_lens
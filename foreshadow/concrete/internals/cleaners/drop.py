@@ -8,7 +8,7 @@ from foreshadow.metrics import (
 )
 from foreshadow.utils.validation import check_df
 
-from .base import BaseCleaner
+from .base import SINGLE_OUTPUT, BaseCleaner
 
 
 def drop_transform(text):
@@ -30,6 +30,19 @@ def drop_transform(text):
     return text, res
 
 
+def _empty_rows(series):
+    """Find the rows that drop_transform matches in a whole column.
+
+    Args:
+        series: one column of the data, as a pandas Series.
+
+    Returns:
+        A boolean Series, True for each NaN, None or empty string row.
+
+    """
+    return series.isna() | series.isin([""])
+
+
 class DropCleaner(BaseCleaner):
     """Clean financial data.
 
@@ -37,6 +50,10 @@ class DropCleaner(BaseCleaner):
 
     """
 
+    # only drop a column if 90% of the data is NaN
+    score_threshold = 0.9
+    output_schema = SINGLE_OUTPUT
+
     def __init__(self):
         transformations = [drop_transform]
         super().__init__(
@@ -46,25 +63,38 @@ class DropCleaner(BaseCleaner):
             },
         )
 
-    def metric_score(self, X: pd.DataFrame) -> float:
-        """Compute the score for this cleaner using confidence_computation.
+    def metric_score(self, X):
+        """Compute the ratio of empty rows of the column in one pass.
 
-        confidence_computation is passed through init for each subclass.
-        The confidence determines which cleaner/flattener is picked in an
-        OVR fashion.
+        This is the score the confidence_computation would give, without
+        cleaning each row.
 
         Args:
             X: input DataFrame.
 
         Returns:
-            float: confidence value.
+            float: the ratio of NaN, None or empty string rows, or 0 if it is
+            below the score_threshold.
 
         """
-        score = super().metric_score(X)
-        if score < 0.9:
-            # only drop a column if 90% of the data is NaN
+        X = check_df(X, single_column=True)
+        if len(X) == 0:
             return 0
-        return score
+        score = float(_empty_rows(X[X.columns[0]]).mean())
+        return score if score >= self.score_threshold else 0
+
+    def transform_series(self, series):
+        """Find the empty rows of a whole column.
+
+        Args:
+            series: one column of the data, as a pandas Series.
+
+        Returns:
+            tuple: the column itself and 1 for each NaN, None or empty
+            string row, 0 otherwise.
+
+        """
+        return series, _empty_rows(series).astype(int)
 
     def transform(self, X, y=None):
         """Clean string columns.
@@ -2,7 +2,16 @@
 
 import re
 
-from .base import BaseCleaner
+import numpy as np
+import pandas as pd
+
+from .base import SINGLE_OUTPUT, BaseCleaner, series_as_text
+
+
+_FINANCIAL_REGEX = r"^([\W]*\$)([\d]+[\.]?[\d]*)(.*)$"
+_FINANCIAL_PATTERN = re.compile(_FINANCIAL_REGEX)
+# `$` also matches before a trailing newline, which re.sub keeps.
+_FINANCIAL_SERIES_PATTERN = re.compile(_FINANCIAL_REGEX[:-1] + r"(\n?)\Z")
 
 
 def financial_transform(text):
@@ -16,12 +25,13 @@ def financial_transform(text):
         Otherwise: None, original text.
 
     """
-    regex = r"^([\W]*\$)([\d]+[\.]?[\d]*)(.*)$"
     text = str(text)
-    res = re.search(regex, text)
+    res = _FINANCIAL_PATTERN.search(text)
     if res is not None:
-        res = sum([len(range(reg[0], reg[1])) for reg in res.regs[1:]])
-        text = re.sub(regex, r"\2", text)
+        # The pattern matches the whole text, up to a trailing newline.
+        end = res.end()
+        text = res.group(2) + text[end:]
+        res = sum([len(group) for group in res.groups()])
     else:
         res = 0
     return text, res
@@ -34,6 +44,51 @@ class DollarFinancialCleaner(BaseCleaner):
 
     """
 
+    output_schema = SINGLE_OUTPUT
+
     def __init__(self):
         transformations = [financial_transform]
         super().__init__(transformations)
+
+    def transform_series(self, series):
+        """Extract the amounts of a whole column.
+
+        Args:
+            series: one column of the data, as a pandas Series.
+
+        Returns:
+            tuple: the amount of each row, or the row itself if it is not
+            an amount, and the number of characters matched on each row.
+
+        """
+        text = series_as_text(series)
+        groups = text.str.extract(_FINANCIAL_SERIES_PATTERN)
+        matched = groups[0].notna()
+        tail = groups[3].fillna("")
+        values = (
+            (groups[1] + tail)
+            .where(matched, series.astype(object))
+            .infer_objects()
+            .rename(series.name)
+        )
+        # The groups before the tail cover the whole text
+        text_lens = np.fromiter(map(len, text), dtype=int, count=len(text))
+        tail_lens = np.fromiter(map(len, tail), dtype=int, count=len(tail))
+        match_lens = pd.Series(
+            np.where(matched, text_lens - tail_lens, 0),
+            index=series.index,
+            name=series.name,
+        )
+        return values, match_lens
+
+    def max_match_lens(self, text_lens):
+        """Bound the length matched by the transformations on each row.
+
+        Args:
+            text_lens: the length of each row converted to text.
+
+        Returns:
+            `text_lens`, as financial_transform only matches substrings.
+
+        """
+        return text_lens
@@ -2,9 +2,11 @@
 import json
 
 import numpy as np
-import pandas as pd
 
-from .base import BaseCleaner
+from foreshadow.logging import logging
+from foreshadow.utils import check_df
+
+from .base import DICT_OUTPUT, BaseCleaner, _object_arrays_to_frame
 
 
 # from collections import MutableMapping
@@ -75,6 +77,19 @@ def _is_json_empty(data):
     return False
 
 
+def _is_missing(row):
+    """Check if a parsed row is missing, that is None or NaN.
+
+    Args:
+        row: a parsed row.
+
+    Returns:
+        boolean -- whether the row is missing.
+
+    """
+    return row is None or (isinstance(row, float) and np.isnan(row))
+
+
 class StandardJsonFlattener(BaseCleaner):
     """Clean financial data.
 
@@ -82,28 +97,196 @@ class StandardJsonFlattener(BaseCleaner):
 
     """
 
+    # we want to make sure the whole column is valid JSON. Otherwise
+    # it will fail later steps. The reason we are not fixing the
+    # JSON is because the variety of malformed JSON is unbounded.
+    score_threshold = 1
+
     def __init__(self):
         transformations = [json_flatten]
         super().__init__(transformations)
+        # Parse of each text since the cleaner was scored or fit, so that
+        # the transform of the same column does not parse it again.
+        self._parsed = {}
+
+    def transform_row(self, row_of_feature, return_tuple=True):
+        """Parse a row of feature, reusing the parse of the same text.
+
+        Args:
+            row_of_feature: one row of one column
+            return_tuple: return named_tuple object instead of just the row.
+
+        Returns:
+            See BaseCleaner.transform_row.
+
+        """
+        if not isinstance(row_of_feature, str):
+            return super().transform_row(row_of_feature, return_tuple)
+        result = self._parsed.get(row_of_feature)
+        if result is None:
+            result = super().transform_row(row_of_feature)
+            self._parsed[row_of_feature] = result
+        return result if return_tuple else result.row
+
+    def transform(self, X, y=None):
+        """Flatten the json of a column.
+
+        The parses kept since the cleaner was scored or fit are released
+        once the column is transformed.
+
+        Args:
+            X (:obj:`pandas.DataFrame`): X data
+            y: input labels
+
+        Returns:
+            :obj:`pandas.DataFrame`: Transformed data
+
+        """
+        try:
+            return super().transform(X, y)
+        finally:
+            self._parsed = {}
+
+    def max_match_lens(self, text_lens):
+        """Bound the length matched by the transformations on each row.
+
+        Args:
+            text_lens: the length of each row converted to text.
+
+        Returns:
+            `text_lens`, as json_flatten matches the whole text or nothing.
+
+        """
+        return text_lens
+
+
+class ColumnarJsonFlattener(StandardJsonFlattener):
+    """Flatten json objects into one column per key, as json_normalize.
+
+    Nested objects are flattened into one column per path of keys, named
+    after the column and the keys joined by underscores. The keys are found
+    during fit, so that the same columns are output by every transform. Rows
+    that are not json objects are kept whole in a column named after the
+    input column.
+
+    Each text is parsed once between the scoring of the cleaner, its fit
+    and its transform. The output columns are filled directly from the
+    parsed objects.
+
+    Params:
+        max_depth: the number of levels of nested objects to flatten. Deeper
+            objects are kept whole as values. None flattens every level.
+        max_keys: the maximum number of output columns. Keys found once this
+            many were found are dropped, so that wide json objects do not
+            create more columns than memory allows. None keeps every key.
+
+    """
 
-    def metric_score(self, X: pd.DataFrame) -> float:
-        """Compute the score for this cleaner using confidence_computation.
+    output_schema = DICT_OUTPUT
 
-        confidence_computation is passed through init for each subclass.
-        The confidence determines which cleaner/flattener is picked in an
-        OVR fashion.
+    def __init__(self, max_depth=None, max_keys=100):
+        super().__init__()
+        self.max_depth = max_depth
+        self.max_keys = max_keys
+
+    def _flat_items(self, obj, path=(), depth=1):
+        """Yield the path of keys and the value of each leaf of an object.
+
+        Args:
+            obj: a parsed row.
+            path: the keys leading to obj.
+            depth: the level of obj, where rows are at the first level.
+
+        Yields:
+            tuple: the path of keys of a leaf and its value.
+
+        """
+        if (
+            isinstance(obj, dict)
+            and obj
+            and (self.max_depth is None or depth <= self.max_depth)
+        ):
+            for key, value in obj.items():
+                yield from self._flat_items(value, path + (key,), depth + 1)
+        else:
+            yield path, obj
+
+    def _parse_column(self, X):
+        """Parse the rows of a single column DataFrame.
 
         Args:
             X: input DataFrame.
 
         Returns:
-            float: confidence value.
+            list: the parsed object of each row, or its original value if it
+            is not json, or NaN if it is empty.
 
         """
-        score = super().metric_score(X)
-        if score < 1:
-            # we want to make sure the whole column is valid JSON. Otherwise
-            # it will fail later steps. The reason we are not fixing the
-            # JSON is because the variety of malformed JSON is unbounded.
-            return 0
-        return score
+        return [self.transform_row(row, False) for row in X[X.columns[0]]]
+
+    def fit(self, X, y=None):
+        """Find the paths of keys of the json objects of the column.
+
+        Args:
+            X: input observations
+            y: input labels
+
+        Returns:
+            self
+
+        """
+        X = check_df(X, single_column=True)
+        paths = {}
+        n_dropped = 0
+        for row in self._parse_column(X):
+            if _is_missing(row):
+                continue
+            for path, _ in self._flat_items(row):
+                if path in paths:
+                    continue
+                if self.max_keys is not None and len(paths) >= self.max_keys:
+                    n_dropped += 1
+                    continue
+                paths[path] = True
+        if n_dropped:
+            logging.warning(
+                "Dropped {} values of {} whose keys come after its first "
+                "{} keys.".format(n_dropped, X.columns[0], self.max_keys)
+            )
+        self.paths_ = list(paths)
+        return self
+
+    def transform(self, X, y=None):
+        """Flatten the json objects of the column into the keys found in fit.
+
+        Args:
+            X (:obj:`pandas.DataFrame`): X data
+            y: input labels
+
+        Returns:
+            :obj:`pandas.DataFrame`: one column per path of keys, which is NaN
+            for the rows without that path.
+
+        """
+        X = check_df(X, single_column=True)
+        try:
+            rows = self._parse_column(X)
+        finally:
+            self._parsed = {}
+
+        positions = {path: i for i, path in enumerate(self.paths_)}
+        data = [np.full(len(rows), np.nan, dtype=object) for _ in positions]
+        for i, row in enumerate(rows):
+            if _is_missing(row):
+                continue
+            for path, value in self._flat_items(row):
+                position = positions.get(path)
+                if position is not None:
+                    data[position][i] = value
+
+        name = X.columns[0]
+        columns = [
+            "_".join([name, *[str(key) for key in path]])
+            for path in self.paths_
+        ]
+        return _object_arrays_to_frame(data, columns, X.index)
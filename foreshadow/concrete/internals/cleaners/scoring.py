@@ -0,0 +1,251 @@
+"""Score several cleaners with a single scan of a column."""
+
+import numpy as np
+
+from foreshadow.logging import logging
+from foreshadow.metrics import (
+    avg_col_regex,
+    calculate_percentage_of_rows_matching_regex,
+    distinct_value_counts,
+)
+
+from .base import BaseCleaner
+
+
+# Relative tolerance when comparing the bounds of two scores, so that
+# rounding errors never skip the cleaner that would have been picked.
+_TOLERANCE = 1e-9
+# Number of times the bounds are checked during a scan, as checking them
+# after every value costs more than cleaning it.
+_N_BOUND_CHECKS = 100
+
+
+def _get_row_metrics(cleaner):
+    """Get the metrics of a cleaner if they can be computed value by value.
+
+    Args:
+        cleaner: a cleaner instance.
+
+    Returns:
+        list: (metric function, weight) pairs, or None if the cleaner
+            computes its score another way.
+
+    """
+    if type(cleaner).metric_score is not BaseCleaner.metric_score:
+        return None
+    metrics = []
+    for metric_wrapper, weight in cleaner.confidence_computation.items():
+        if (
+            metric_wrapper.fn
+            not in (calculate_percentage_of_rows_matching_regex, avg_col_regex)
+            or metric_wrapper.invert
+            or weight < 0
+        ):
+            return None
+        metrics.append((metric_wrapper.fn, weight))
+    return metrics
+
+
+class _FusedScore:
+    """Running score of a cleaner during the scan of a column.
+
+    Params:
+        cleaner: the cleaner to score.
+        metrics: the (metric function, weight) pairs of the cleaner.
+        counts: the number of rows of each distinct value of the column.
+        text_lens: the length of each distinct value converted to text.
+
+    """
+
+    def __init__(self, cleaner, metrics, counts, text_lens):
+        self.cleaner = cleaner
+        self.metrics = metrics
+        self.sums = [0] * len(metrics)
+        self.n_rows = int(counts.sum())
+
+        # The most each metric can still gain from the values left to scan,
+        # after each value.
+        max_match_lens = cleaner.max_match_lens(text_lens)
+        if max_match_lens is None:
+            max_match_lens = np.full(len(text_lens), np.inf)
+        self.rest = []
+        for fn, _ in metrics:
+            bound = np.asarray(max_match_lens, dtype=float)
+            if fn is avg_col_regex:
+                bound = bound / np.maximum(text_lens, 1)
+            bound = bound * counts
+            self.rest.append(np.append(np.cumsum(bound[::-1])[::-1], 0)[1:])
+
+    def update(self, match_len, row_len, count):
+        """Add the minimum match length of a distinct value to the metrics.
+
+        Args:
+            match_len: the minimum match length of the value.
+            row_len: the length of the value as text, or 1 if empty.
+            count: the number of rows of the value.
+
+        """
+        for i, (fn, _) in enumerate(self.metrics):
+            if fn is avg_col_regex:
+                self.sums[i] += count * (match_len / row_len)
+            else:
+                self.sums[i] += count * match_len
+
+    def _score(self, sums):
+        return sum(
+            [
+                sums[i] / self.n_rows * weight
+                for i, (_, weight) in enumerate(self.metrics)
+            ]
+        )
+
+    def score(self):
+        """Compute the score as BaseCleaner.metric_score would.
+
+        Returns:
+            float: the score of the rows scanned so far, which is a lower
+                bound of the final score.
+
+        """
+        score = self._score(self.sums)
+        threshold = self.cleaner.score_threshold
+        if threshold is not None and score < threshold:
+            return 0
+        return score
+
+    def upper_bound(self, row):
+        """Bound the final score once `row` has been scanned.
+
+        Args:
+            row: the position of the last distinct value scanned.
+
+        Returns:
+            float: an upper bound of the final score.
+
+        """
+        score = self._score(
+            [self.sums[i] + rest[row] for i, rest in enumerate(self.rest)]
+        )
+        score += _TOLERANCE * max(1.0, abs(score))
+        threshold = self.cleaner.score_threshold
+        if threshold is not None and score < threshold:
+            return 0
+        return score
+
+
+def _prune_running_scores(running, scores, row):
+    """Stop scoring the cleaners that can no longer be picked.
+
+    Args:
+        running: the _FusedScore of each cleaner still scanned, by position.
+        scores: the score of each cleaner, None while it is not known.
+        row: the position of the last distinct value scanned.
+
+    Returns:
+        dict: a lower bound of the score of each cleaner, by position.
+
+    """
+    lower_bounds = {i: score.score() for i, score in running.items()}
+    upper_bounds = {i: score.upper_bound(row) for i, score in running.items()}
+    for i, score in enumerate(scores):
+        if score is not None:
+            lower_bounds[i] = upper_bounds[i] = score
+    for i in list(running):
+        best_other = max(
+            [bound for j, bound in lower_bounds.items() if j != i], default=0
+        )
+        if upper_bounds[i] <= 0 or upper_bounds[i] < best_other:
+            del running[i]
+    return lower_bounds
+
+
+def _is_scan_over(running, scores, lower_bounds):
+    """Check whether the rest of the column can change the picked cleaner.
+
+    Args:
+        running: the _FusedScore of each cleaner still scanned, by position.
+        scores: the score of each cleaner, None while it is not known.
+        lower_bounds: a lower bound of the score of each cleaner.
+
+    Returns:
+        bool: True if no cleaner is left to scan or if the only one left
+            already scores more than every other cleaner.
+
+    """
+    if len(running) != 1:
+        return not running
+    (i,) = running
+    others = [score for score in scores if score is not None]
+    return lower_bounds[i] > max(others, default=0)
+
+
+def fused_metric_scores(X, cleaners):
+    """Compute the metric scores of several cleaners with one scan of X.
+
+    Each distinct value is transformed once per cleaner, instead of each row
+    once per cleaner and per metric. While scanning, the bounds of the scores
+    are used to skip the cleaners that can no longer be picked, that is
+    whose score can no longer be positive and greater than every other
+    score. The scan stops as soon as a single cleaner can still be picked.
+
+    Cleaners that override `metric_score` or use other metrics are scored on
+    their own.
+
+    Args:
+        X: the column to score the cleaners on, as a DataFrame.
+        cleaners: the cleaner instances.
+
+    Returns:
+        list: the score of each cleaner, which is None for the skipped
+            cleaners. The score of a cleaner picked before the end of the
+            scan is a lower bound of its score.
+
+    """
+    if len(X) == 0:
+        return [cleaner.metric_score(X) for cleaner in cleaners]
+
+    value_counts = distinct_value_counts(X)
+    values = value_counts.index
+    counts = value_counts.values
+    text_lens = np.array([len(str(value)) for value in values])
+    row_lens = [max(text_len, 1) for text_len in text_lens.tolist()]
+    row_counts = counts.tolist()
+
+    check_every = max(1, len(values) // _N_BOUND_CHECKS)
+
+    scores = [None] * len(cleaners)
+    running = {}
+    for i, cleaner in enumerate(cleaners):
+        metrics = _get_row_metrics(cleaner)
+        if metrics is None:
+            scores[i] = cleaner.metric_score(X)
+        else:
+            running[i] = _FusedScore(cleaner, metrics, counts, text_lens)
+
+    for row, value in enumerate(values):
+        for i in list(running):
+            try:
+                match_len = min(
+                    running[i].cleaner.transform_row(value).match_lens
+                )
+            except Exception:
+                # Let the metrics handle the failure as they usually do
+                scores[i] = running.pop(i).cleaner.metric_score(X)
+                continue
+            running[i].update(match_len, row_lens[row], row_counts[row])
+        if (row + 1) % check_every != 0:
+            continue
+
+        lower_bounds = _prune_running_scores(running, scores, row)
+        if _is_scan_over(running, scores, lower_bounds):
+            if running:
+                logging.debug(
+                    "Picked a cleaner after {} of {} values".format(
+                        row + 1, len(values)
+                    )
+                )
+            break
+
+    for i, score in running.items():
+        scores[i] = score.score()
+    return scores
@@ -2,7 +2,7 @@
 
 import random
 import warnings
-from typing import List, NoReturn, Union
+from typing import List, NoReturn, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -13,6 +13,7 @@ from foreshadow.base import BaseEstimator
 from foreshadow.cachemanager import CacheManager
 from foreshadow.concrete.internals.cleaners.customizable_base import (
     CustomizableBaseCleaner,
+    VectorizedCustomizableBaseCleaner,
 )
 from foreshadow.estimators.auto import AutoEstimator
 from foreshadow.estimators.estimator_wrapper import EstimatorWrapper
@@ -22,6 +23,7 @@ from foreshadow.preparer import DataPreparer
 from foreshadow.utils import (
     AcceptedKey,
     ConfigKey,
+    DefaultConfig,
     Override,
     ProblemType,
     check_df,
@@ -467,13 +469,22 @@ class Foreshadow(BaseEstimator):
         enable_sampling=True,
         sampling_fraction: float = 0.2,
         replace: bool = False,
+        strategy: str = DefaultConfig.SAMPLING_STRATEGY,
+        random_state: Optional[int] = DefaultConfig.SAMPLING_RANDOM_STATE,
     ) -> NoReturn:  # noqa: S001
         """Configure the sampling criteria.
 
+        A single row sample is drawn per fit and shared by the data cleaning
+        and intent resolving steps.
+
         Args:
             enable_sampling: whether to enable sampling in data cleaning and intent resolving # noqa: E501
             sampling_fraction: whether to use replacement during sampling
             replace: the sampling fraction
+            strategy: how to draw the row sample, one of "uniform",
+                "stratified" (on the labels) and "reservoir" (in chunks)
+            random_state: the seed of the row sample. If None, the global
+                numpy random state is used.
 
         Returns:
 
@@ -487,12 +498,96 @@ class Foreshadow(BaseEstimator):
         self.X_preparer.cache_manager[AcceptedKey.CONFIG][
             ConfigKey.SAMPLING_WITH_REPLACEMENT
         ] = replace
+        self.X_preparer.cache_manager[AcceptedKey.CONFIG][
+            ConfigKey.SAMPLING_STRATEGY
+        ] = strategy
+        self.X_preparer.cache_manager[AcceptedKey.CONFIG][
+            ConfigKey.SAMPLING_RANDOM_STATE
+        ] = random_state
+
+    def configure_intent_cache(
+        self,
+        enable_intent_cache: bool = True,
+        ttl: int = DefaultConfig.INTENT_CACHE_TTL,
+        max_entries: int = DefaultConfig.INTENT_CACHE_MAX_ENTRIES,
+    ) -> NoReturn:
+        """Configure the on disk cache of resolved intents.
+
+        When enabled, the intents resolved for the columns are stored in the
+        foreshadow cache directory and reused by later fits on columns with
+        the same name, dtype and content.
+
+        Args:
+            enable_intent_cache: whether to enable the intent cache
+            ttl: the number of seconds after which a cached intent expires
+            max_entries: the maximum number of cached intents
+
+        """
+        self.X_preparer.cache_manager[AcceptedKey.CONFIG][
+            ConfigKey.ENABLE_INTENT_CACHE
+        ] = enable_intent_cache
+        self.X_preparer.cache_manager[AcceptedKey.CONFIG][
+            ConfigKey.INTENT_CACHE_TTL
+        ] = ttl
+        self.X_preparer.cache_manager[AcceptedKey.CONFIG][
+            ConfigKey.INTENT_CACHE_MAX_ENTRIES
+        ] = max_entries
+
+    def configure_incremental_intent_resolution(
+        self,
+        enable_incremental_intent_resolution: bool = True,
+        drift_tolerance: float = DefaultConfig.INTENT_DRIFT_TOLERANCE,
+    ) -> NoReturn:
+        """Configure the incremental resolution of intents on refit.
+
+        When enabled, refitting Foreshadow keeps the intents resolved by the
+        previous fit for the columns that did not change and only resolves
+        the intents of the new columns and of the columns that drifted. The
+        re-resolved columns are reported in the logs and in the
+        `reresolved_columns_` attribute of the intent step.
+
+        Args:
+            enable_incremental_intent_resolution: whether to enable the
+                incremental resolution
+            drift_tolerance: the maximum change of the NaN rate and of the
+                distinct rate of a column that is considered unchanged
+
+        """
+        self.X_preparer.cache_manager[AcceptedKey.CONFIG][
+            ConfigKey.ENABLE_INCREMENTAL_INTENT_RESOLUTION
+        ] = enable_incremental_intent_resolution
+        self.X_preparer.cache_manager[AcceptedKey.CONFIG][
+            ConfigKey.INTENT_DRIFT_TOLERANCE
+        ] = drift_tolerance
+
+    def configure_sparse_output(
+        self, enable_sparse_output: bool = True
+    ) -> NoReturn:
+        """Configure the sparse outputs of the transformers.
+
+        When enabled, the sparse matrices returned by the transformers, such
+        as the TF-IDF of a text column, are kept as sparse DataFrame columns
+        instead of being converted to dense arrays, and the processed data is
+        given to the estimator as a CSR matrix when all its columns are
+        numeric and some of them are sparse.
+
+        Args:
+            enable_sparse_output: whether to keep the sparse outputs
+
+        """
+        self.X_preparer.cache_manager[AcceptedKey.CONFIG][
+            ConfigKey.ENABLE_SPARSE_OUTPUT
+        ] = enable_sparse_output
 
     def register_customized_data_cleaner(
         self, data_cleaners: List
     ) -> NoReturn:
         """**EXPERIMENTAL** Allow user to register a customized data cleaner.
 
+        Cleaners either transform one row at a time, by extending
+        CustomizableBaseCleaner, or a whole column at once, by extending
+        VectorizedCustomizableBaseCleaner.
+
         Args:
             data_cleaners: customized data cleaners
 
@@ -500,11 +595,16 @@ class Foreshadow(BaseEstimator):
             ValueError: data cleaner must be a child class of the base cleaner.
 
         """
+        base_cleaners = (
+            CustomizableBaseCleaner,
+            VectorizedCustomizableBaseCleaner,
+        )
         for cleaner in data_cleaners:
-            if not issubclass(cleaner, CustomizableBaseCleaner):
+            if not issubclass(cleaner, base_cleaners):
                 raise ValueError(
                     "cleaner {} must be a child class of the {} class.".format(
-                        str(cleaner), CustomizableBaseCleaner.__name__
+                        str(cleaner),
+                        " or ".join(base.__name__ for base in base_cleaners),
                     )
                 )
 
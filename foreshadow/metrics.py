@@ -1,4 +1,5 @@
 """Metrics used across Foreshadow for smart decision making."""
+from collections import namedtuple
 
 import pandas as pd
 from pandas.api.types import is_numeric_dtype, is_string_dtype
@@ -21,7 +22,7 @@ class MetricWrapper:
         self.invert = invert
         self._last_call = None
 
-    def calculate(self, feature, **kwargs):
+    def calculate(self, feature, matches=None, **kwargs):
         """Use the metric function passed at initialization.
 
         Note:
@@ -30,6 +31,9 @@ class MetricWrapper:
 
         Args:
             feature: feature/column of pandas dataset requires it.
+            matches: the CleanerMatches of the cleaner on the feature. If
+                the metric can be computed from them, the cleaner is not
+                called again.
             **kwargs: any keyword arguments to metric function
 
         Returns:
@@ -40,7 +44,10 @@ class MetricWrapper:
 
         """
         try:
-            self._last_call = self.fn(feature, **kwargs)
+            if matches is not None and self.fn in _METRICS_FROM_MATCHES:
+                self._last_call = _METRICS_FROM_MATCHES[self.fn](matches)
+            else:
+                self._last_call = self.fn(feature, **kwargs)
         except Exception as re_raise:
             logging.debug(
                 "There was an exception when calling {}".format(self.fn)
@@ -184,6 +191,162 @@ def avg_col_regex(feature, cleaner, mode=min):
     ) / len(feature)
 
 
+CleanerMatches = namedtuple(
+    "CleanerMatches", ["counts", "match_lens", "row_lens", "n_rows"]
+)
+
+
+def compute_cleaner_matches(feature, cleaner):
+    """Run a cleaner once per distinct value of a feature.
+
+    Distinct values are counted with `value_counts`, so that repeated values
+    are only cleaned once. The matches can be used by every metric of
+    `_METRICS_FROM_MATCHES` instead of cleaning each row again.
+
+    Args:
+        feature: a column of the dataset
+        cleaner: callable that will perform all transformations to row of
+            feature
+
+    Returns:
+        CleanerMatches: the number of rows, the minimum match length and the
+            length as text (at least 1) of each distinct value.
+
+    """
+    counts = distinct_value_counts(feature)
+    match_lens = [min(cleaner(value).match_lens) for value in counts.index]
+    row_lens = [max(len(str(value)), 1) for value in counts.index]
+    return CleanerMatches(counts.tolist(), match_lens, row_lens, len(feature))
+
+
+def cleaner_matches_from_match_lens(feature, match_lens):
+    """Build the CleanerMatches of a cleaner that cleaned a whole feature.
+
+    Args:
+        feature: a column of the dataset
+        match_lens: the minimum match length of each row of the feature.
+
+    Returns:
+        CleanerMatches: the matches of each row, counted once.
+
+    """
+    column = feature.iloc[:, 0]
+    row_lens = [max(len(str(value)), 1) for value in column]
+    return CleanerMatches(
+        [1] * len(column), list(match_lens), row_lens, len(feature)
+    )
+
+
+def distinct_value_counts(feature):
+    """Count the distinct values of the column of a feature, NaNs included.
+
+    Args:
+        feature: a column of the dataset, as a DataFrame.
+
+    Returns:
+        pandas.Series: the count of each distinct value, in order of first
+            appearance. Columns of unhashable values, such as lists, are
+            not deduplicated.
+
+    """
+    column = feature.iloc[:, 0]
+    try:
+        return column.value_counts(dropna=False, sort=False)
+    except TypeError:
+        # unhashable values
+        return pd.Series(1, index=pd.Index(column.tolist(), dtype=object))
+
+
+def _percentage_of_rows_matching_regex_from_matches(matches):
+    """Compute calculate_percentage_of_rows_matching_regex from matches.
+
+    Args:
+        matches: CleanerMatches of the cleaner on the feature.
+
+    Returns:
+        Return percentage of rows matched by regex transformations.
+
+    """
+    return (
+        sum(
+            [
+                count * match_len
+                for count, match_len in zip(matches.counts, matches.match_lens)
+            ]
+        )
+        / matches.n_rows
+    )
+
+
+def _avg_col_regex_from_matches(matches):
+    """Compute avg_col_regex, with the default mode, from matches.
+
+    Args:
+        matches: CleanerMatches of the cleaner on the feature.
+
+    Returns:
+        Average amount of each column transformed.
+
+    """
+    return (
+        sum(
+            [
+                count * (match_len / row_len)
+                for count, match_len, row_len in zip(
+                    matches.counts, matches.match_lens, matches.row_lens
+                )
+            ]
+        )
+        / matches.n_rows
+    )
+
+
+# Metrics that can be computed from the CleanerMatches of a cleaner
+_METRICS_FROM_MATCHES = {
+    calculate_percentage_of_rows_matching_regex: (
+        _percentage_of_rows_matching_regex_from_matches
+    ),
+    avg_col_regex: _avg_col_regex_from_matches,
+}
+
+
+def weighted_cleaner_metrics(
+    feature, cleaner, confidence_computation, matches=None
+):
+    """Compute the weighted metrics of a cleaner, cleaning each value once.
+
+    The cleaner runs once per distinct value of the feature and its match
+    lengths are reused by all the metrics that support it. Other metrics are
+    computed as usual.
+
+    Args:
+        feature: a column of the dataset
+        cleaner: callable that will perform all transformations to row of
+            feature
+        confidence_computation: the dict of {MetricWrapper: weight}.
+        matches: the CleanerMatches of the cleaner on the feature, if they
+            are already known.
+
+    Returns:
+        list: the weighted value of each metric.
+
+    """
+    if matches is None and any(
+        metric_wrapper.fn in _METRICS_FROM_MATCHES
+        for metric_wrapper in confidence_computation
+    ):
+        try:
+            matches = compute_cleaner_matches(feature, cleaner)
+        except Exception:
+            # Each metric handles the failure of the cleaner on its own
+            logging.debug("Could not compute the matches of the cleaner")
+    return [
+        metric_wrapper.calculate(feature, matches=matches, cleaner=cleaner)
+        * weight
+        for metric_wrapper, weight in confidence_computation.items()
+    ]
+
+
 def num_valid(X):
     """Count the number of valid numbers in an input.
 
@@ -11,7 +11,11 @@ from foreshadow.steps import (
     IntentMapper,
     Preprocessor,
 )
-from foreshadow.utils import ConfigureCacheManagerMixin, ProblemType
+from foreshadow.utils import (
+    ConfigureCacheManagerMixin,
+    ProblemType,
+    RowSampler,
+)
 
 
 def _none_to_dict(name, val, cache_manager=None):
@@ -168,6 +172,56 @@ class DataPreparer(Pipeline, ConfigureCacheManagerMixin):
         self.problem_type = problem_type
         super().__init__(steps, **kwargs)
 
+    def fit(self, X, y=None, **fit_params):
+        """Fit the steps of the DataPreparer.
+
+        A row sample is drawn once for this fit and shared by every smart
+        step through the cache manager. It is removed at the end of the fit.
+
+        Args:
+            X: input DataFrame
+            y: input labels
+            **fit_params: fit_params to the steps
+
+        Returns:
+            self
+
+        """
+        row_sampler = self._draw_row_sample(X, y)
+        try:
+            return super().fit(X, y, **fit_params)
+        finally:
+            if row_sampler is not None:
+                row_sampler.clear()
+
+    def fit_transform(self, X, y=None, **fit_params):
+        """Fit the steps of the DataPreparer and transform X.
+
+        See fit for the row sample shared by the steps.
+
+        Args:
+            X: input DataFrame
+            y: input labels
+            **fit_params: fit_params to the steps
+
+        Returns:
+            the transformed X
+
+        """
+        row_sampler = self._draw_row_sample(X, y)
+        try:
+            return super().fit_transform(X, y, **fit_params)
+        finally:
+            if row_sampler is not None:
+                row_sampler.clear()
+
+    def _draw_row_sample(self, X, y):
+        if self.cache_manager is None:
+            return None
+        row_sampler = RowSampler(self.cache_manager)
+        row_sampler.draw(X, y)
+        return row_sampler
+
     def _get_params(self, attr, deep=True):
         # attr will be 'steps' if called from pipeline.get_params()
         out = super()._get_params(attr, deep)
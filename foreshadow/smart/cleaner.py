@@ -1,6 +1,7 @@
 """SmartCleaner for DataPreparer step."""
 
-from foreshadow.concrete.internals import NoTransform
+from foreshadow.concrete.internals import DropCleaner, NoTransform
+from foreshadow.concrete.internals.cleaners.scoring import fused_metric_scores
 from foreshadow.config import config
 from foreshadow.logging import logging
 from foreshadow.utils import AcceptedKey, ConfigKey, DataSamplingMixin
@@ -51,12 +52,27 @@ class Cleaner(SmartTransformer, DataSamplingMixin):
         # score.
         sampled_df = self.sample_data_frame(df=X)
 
-        # TODO if this improvement is not sufficient, we can try using
-        #  multiprocessing to get the scores instead of doing it sequentially.
+        # Columns to drop do not need the other cleaners to be scored, and
+        # finding them only takes a vectorized pass.
+        cleaners = [cleaner() for cleaner in cleaners]
         for cleaner in cleaners:
-            cleaner = cleaner()
-            score = cleaner.metric_score(sampled_df)
-            if score > best_score:
+            if (
+                isinstance(cleaner, DropCleaner)
+                and cleaner.metric_score(sampled_df) > 0
+            ):
+                logging.debug("Picked...")
+                return cleaner
+        cleaners = [
+            cleaner
+            for cleaner in cleaners
+            if not isinstance(cleaner, DropCleaner)
+        ]
+
+        # All the cleaners are scored with a single scan of the sample, which
+        # stops early once the best cleaner is known.
+        scores = fused_metric_scores(sampled_df, cleaners)
+        for cleaner, score in zip(cleaners, scores):
+            if score is not None and score > best_score:
                 best_score = score
                 best_cleaner = cleaner
         if best_cleaner is None:
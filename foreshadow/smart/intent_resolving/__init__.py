@@ -1,5 +1,29 @@
 """Intent resolver definition."""
-from foreshadow.smart.intent_resolving.intentresolver import IntentResolver
+from foreshadow.smart.intent_resolving.intent_cache import (
+    IntentCache,
+    column_fingerprint,
+)
+from foreshadow.smart.intent_resolving.intent_drift import (
+    column_signature,
+    find_drifted_columns,
+    has_drifted,
+)
+from foreshadow.smart.intent_resolving.intentresolver import (
+    IntentResolver,
+    IntentTier,
+    resolve_intents,
+    resolve_intents_by_rules,
+)
 
 
-__all__ = ["IntentResolver"]
+__all__ = [
+    "IntentCache",
+    "IntentResolver",
+    "IntentTier",
+    "column_fingerprint",
+    "column_signature",
+    "find_drifted_columns",
+    "has_drifted",
+    "resolve_intents",
+    "resolve_intents_by_rules",
+]
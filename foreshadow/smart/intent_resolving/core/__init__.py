@@ -1,7 +1,7 @@
 """Module containing the core IntentResolver logic to be used in production."""
-from . import heuristics, io
+from . import heuristics, io, vectorized_heuristics
 from .data_set_parsers import DataFrameDataSetParser
-from .intent_resolver import IntentResolver
+from .intent_resolver import IntentResolver, registry, warm_up
 from .secondary_featurizers import (
     FeaturizerCurator,
     factory as featurizer_factory,
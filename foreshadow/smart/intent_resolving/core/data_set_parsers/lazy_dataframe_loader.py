@@ -1,10 +1,11 @@
 """Class definition for LazyDatarameLoader."""
 import re
-from hashlib import md5
+from hashlib import md5, sha256
 from pathlib import Path
 from string import ascii_letters, digits
-from typing import List, Optional, Pattern, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -17,81 +18,295 @@ class LazyDataFrameLoader:
     RawDataSetFeaturizerViaLambda.__slow_featurize is called with
     multiprocessing.
 
+    Since metafeatures only need a bounded number of rows per column, the
+    loaded columns and rows can be limited. With `sample_rows`, files are
+    streamed in chunks through a reservoir, so that memory is bounded by
+    the sample size and the chunk size instead of the file size.
 
     Attributes:
         df {Optional[pd.DataFrame]}
             -- A raw dataframe. (default: {None})
         csv_path {Optional[Union[str, Path]]}
             -- Path to a dataframe (default: {None})
+        parquet_path {Optional[Union[str, Path]]}
+            -- Path to a dataframe in the Parquet format (default: {None})
+        usecols {Optional[List[str]]}
+            -- Subset of the columns to load (default: {None})
+        dtype {Optional[Dict[str, str]]}
+            -- Data types of (some of) the columns (default: {None})
+        nrows {Optional[int]}
+            -- Number of rows to load from the start (default: {None})
+        sample_rows {Optional[int]}
+            -- Number of rows to sample uniformly (default: {None})
+        random_state {Optional[int]}
+            -- Seed of the row sample (default: {0})
+        chunksize {int}
+            -- Number of rows read at once when sampling CSV files
+               (default: {100000})
 
     Methods:
         __call__ -- Loads a dataframe
+        content_hash -- Hash of the content of the dataframe
     """
 
+    _HASH_BLOCK_SIZE = 1 << 20
+
     def __init__(
         self,
         *,
         df: Optional[pd.DataFrame] = None,
         csv_path: Optional[Union[str, Path]] = None,
+        parquet_path: Optional[Union[str, Path]] = None,
         remove_id_substring: Optional[bool] = False,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, str]] = None,
+        nrows: Optional[int] = None,
+        sample_rows: Optional[int] = None,
+        random_state: Optional[int] = 0,
+        chunksize: int = 100000,
     ):
         """Init function.
 
-        Only `df` or `csv_path` can be specified.
+        Only one of `df`, `csv_path` or `parquet_path` can be specified.
 
         Keyword Arguments:
             df {Optional[pd.DataFrame]}
                 -- A raw dataframe. (default: {None})
             csv_path {Optional[Union[str, Path]]}
                 -- Path to a dataframe (default: {None})
+            parquet_path {Optional[Union[str, Path]]}
+                -- Path to a dataframe in the Parquet format. Requires
+                   pyarrow. (default: {None})
             remove_id_substring {Optional[bool]}
                 -- If True, replaces 'id'-like substrings in column names
                    of dataframes (default: False)
-            pattern {Pattern}
-                -- Compiled regex pattern
+            usecols {Optional[List[str]]}
+                -- Subset of the columns to load, named as in the raw
+                   dataframe. (default: {None})
+            dtype {Optional[Dict[str, str]]}
+                -- Data types of (some of) the columns, which avoids
+                   inferring them. (default: {None})
+            nrows {Optional[int]}
+                -- Number of rows to load from the start of the dataframe.
+                   (default: {None})
+            sample_rows {Optional[int]}
+                -- Number of rows to sample uniformly without replacement,
+                   among the first `nrows` rows if provided. The sampled
+                   rows keep their order. (default: {None})
+            random_state {Optional[int]}
+                -- Seed of the row sample. (default: {0})
+            chunksize {int}
+                -- Number of rows read at once when sampling CSV files.
+                   (default: {100000})
 
         Raises:
-            ValueError: When both `df` and `csv_path` are specified
+            ValueError: When more than one of `df`, `csv_path` and
+                        `parquet_path` are specified
             TypeError: When `df` is not a pd.DataFrame
-            TypeError: When `csv_path` is not a str or a Path
+            TypeError: When `csv_path` or `parquet_path` is not a str or a
+                       Path
             ValueError: When `csv_path` is not a csv file
         """
-        # Ensure only one of two optional keyword arguments is provided
-        if (df is not None) == (csv_path is not None):
-            raise ValueError("Only one of `df` or `csv_path` can be provided.")
+        # Ensure only one of the optional keyword arguments is provided
+        if sum(x is not None for x in (df, csv_path, parquet_path)) != 1:
+            raise ValueError(
+                "Only one of `df`, `csv_path` or `parquet_path` can be "
+                "provided."
+            )
         if (df is not None) and not isinstance(df, pd.DataFrame):
             raise TypeError(
                 "Expecting `df` of type pd.DataFrame. " f"Got type {type(df)}."
             )
-        if csv_path is not None:
-            if not (isinstance(csv_path, str) or isinstance(csv_path, Path)):
+        for name, path in (
+            ("csv_path", csv_path),
+            ("parquet_path", parquet_path),
+        ):
+            if path is not None and not isinstance(path, (str, Path)):
                 raise TypeError(
-                    "Expecting `csv_path` of type str or Path. "
-                    f"Got type {type(csv_path)}."
+                    f"Expecting `{name}` of type str or Path. "
+                    f"Got type {type(path)}."
                 )
-            if str(csv_path)[-3:].lower() != "csv":
-                raise ValueError("A CSV file is expected for `csv_path`.")
+        if csv_path is not None and str(csv_path)[-3:].lower() != "csv":
+            raise ValueError("A CSV file is expected for `csv_path`.")
 
         # Either one of this will have a non-None value
         self.df = df
         self.csv_path = csv_path
+        self.parquet_path = parquet_path
         self.remove_id_substring = remove_id_substring
+        self.usecols = usecols
+        self.dtype = dtype
+        self.nrows = nrows
+        self.sample_rows = sample_rows
+        self.random_state = random_state
+        self.chunksize = chunksize
         self.pattern = re.compile("_?[iI][dD]")
+        self._content_hash: Optional[str] = None
 
     def __call__(self) -> pd.DataFrame:
         """Loads the provided (path to a) dataframe."""
         if self.df is not None:
-            result = self.df
+            result = self._load_df()
+        elif self.parquet_path is not None:
+            result = self._load_parquet()
         else:
-            result = pd.read_csv(
-                self.csv_path, encoding="latin", low_memory=False
-            )
+            result = self._load_csv()
 
         # Optionally clean 'id'-like substrings from column names
         if self.remove_id_substring:
             result.columns = self._replace_id_in_col_name(result)
         return result
 
+    def content_hash(self) -> str:
+        """
+        Hash the content of the (path to a) dataframe.
+
+        A file is hashed as raw bytes, without being parsed. The hash is
+        computed once per instance and also depends on the options that
+        change the loaded dataframe.
+
+        Returns:
+            str -- Hexadecimal sha256 digest.
+        """
+        if self._content_hash is None:
+            options = (
+                self.remove_id_substring,
+                self.usecols,
+                self.dtype,
+                self.nrows,
+                self.sample_rows,
+                self.random_state if self.sample_rows is not None else None,
+            )
+            digest = sha256(repr(options).encode())
+            if self.df is not None:
+                digest.update(repr(list(self.df.columns)).encode())
+                digest.update(
+                    pd.util.hash_pandas_object(self.df, index=True).values
+                )
+            else:
+                path = self.csv_path or self.parquet_path
+                with open(path, "rb") as f:
+                    for block in iter(
+                        lambda: f.read(self._HASH_BLOCK_SIZE), b""
+                    ):
+                        digest.update(block)
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    def _load_df(self) -> pd.DataFrame:
+        result = self.df
+        if self.usecols is not None:
+            result = result[list(self.usecols)]
+        if self.dtype is not None:
+            result = result.astype(self.dtype)
+        if self.nrows is not None:
+            result = result.iloc[: self.nrows]
+        if self.sample_rows is not None:
+            result = self._reservoir_sample([result])
+        return result
+
+    def _load_csv(self) -> pd.DataFrame:
+        kwargs = dict(
+            encoding="latin",
+            usecols=self.usecols,
+            dtype=self.dtype,
+            nrows=self.nrows,
+        )
+        if self.sample_rows is None:
+            return pd.read_csv(self.csv_path, low_memory=False, **kwargs)
+        return self._reservoir_sample(
+            pd.read_csv(self.csv_path, chunksize=self.chunksize, **kwargs)
+        )
+
+    def _load_parquet(self) -> pd.DataFrame:
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(str(self.parquet_path))
+        row_groups = (
+            parquet_file.read_row_group(i, columns=self.usecols)
+            for i in range(parquet_file.num_row_groups)
+        )
+        chunks = self._head(
+            (row_group.to_pandas() for row_group in row_groups), self.nrows
+        )
+        if self.dtype is not None:
+            chunks = (chunk.astype(self.dtype) for chunk in chunks)
+
+        if self.sample_rows is not None:
+            return self._reservoir_sample(chunks)
+        chunks = list(chunks)
+        if not chunks:
+            # Without row groups, reading the whole file is free
+            return parquet_file.read(columns=self.usecols).to_pandas()
+        return pd.concat(chunks, ignore_index=True)
+
+    @staticmethod
+    def _head(
+        chunks: Iterable[pd.DataFrame], nrows: Optional[int]
+    ) -> Iterator[pd.DataFrame]:
+        """Truncate a stream of chunks to its first `nrows` rows."""
+        n_left = nrows
+        for chunk in chunks:
+            if n_left is not None:
+                if n_left <= 0:
+                    return
+                chunk = chunk.iloc[:n_left]
+                n_left -= len(chunk)
+            yield chunk
+
+    def _reservoir_sample(
+        self, chunks: Iterable[pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Sample `sample_rows` rows uniformly from a stream of chunks.
+
+        Implements the reservoir sampling algorithm R, vectorized over each
+        chunk, so that only the reservoir and the current chunk are kept in
+        memory.
+
+        Arguments:
+            chunks {Iterable[pd.DataFrame]} -- Chunks of a dataframe.
+
+        Returns:
+            pd.DataFrame -- The sampled rows, in their original order.
+        """
+        k = self.sample_rows
+        rng = np.random.RandomState(self.random_state)
+        reservoir = None
+        positions = np.empty(0, dtype=np.int64)
+        n_seen = 0
+        for chunk in chunks:
+            length = len(chunk)
+            chunk_positions = np.arange(
+                n_seen, n_seen + length, dtype=np.int64
+            )
+            n_fill = max(0, min(k - n_seen, length))
+
+            # Rows to keep, indexed in the concatenation of the reservoir and
+            # of the chunk. Rows after the first `k` replace a random row of
+            # the reservoir with a probability decreasing with their position.
+            keep = np.arange(len(positions) + n_fill)
+            candidates = np.arange(n_fill, length)
+            if len(candidates):
+                slots = rng.random_sample(len(candidates)) * (
+                    chunk_positions[candidates] + 1
+                )
+                slots = slots.astype(np.int64)
+                replace = slots < k
+                # With repeated slots the last assignment wins, which is
+                # what the sequential algorithm does.
+                keep[slots[replace]] = len(positions) + candidates[replace]
+
+            if reservoir is not None:
+                chunk = pd.concat([reservoir, chunk], ignore_index=True)
+            reservoir = chunk.iloc[keep]
+            positions = np.concatenate([positions, chunk_positions])[keep]
+            n_seen += length
+
+        if reservoir is None:
+            return pd.DataFrame()
+        return reservoir.iloc[np.argsort(positions)].reset_index(drop=True)
+
     def _replace_id_in_col_name(self, columns: List[str]) -> List[str]:
         sub = HashSubstituter()
         replacement = [
@@ -100,9 +315,10 @@ class LazyDataFrameLoader:
 
         # Hard fails if there is a collision post-ID-substitution
         if pd.Series(replacement).nunique() < len(replacement):
+            source = self.csv_path or self.parquet_path
             raise ValueError(
                 "Collision occurred when substituting ID-columns for"
-                f"{self.df.head() if self.df is not None else self.csv_path}\n"
+                f"{self.df.head() if self.df is not None else source}\n"
                 f"Values post-substitution: {replacement}."
             )
         return replacement
@@ -1,16 +1,170 @@
 """Class definition for the RawDataSetParser abstract class."""
 
 from pathlib import Path
-from typing import Callable, Type
+from typing import Type
 
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import RobustScaler
 
-from .. import heuristics as hr
+from .. import vectorized_heuristics as hr
 from .base_data_set_parser import DataSetParser
 
 
+# Number of values converted to strings at once
+_CHUNK_SIZE = 65536
+
+
+class _Moments:
+    """Running count, extrema, mean and sum of squared deviations."""
+
+    def __init__(self):
+        self.n_values = 0
+        self.max = -np.inf
+        self.min = np.inf
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray, weights: np.ndarray = None):
+        """
+        Add values, each repeated `weights` times, to the moments.
+
+        The moments of the values are merged with the running ones as in
+        Chan et al.'s parallel variance algorithm.
+        """
+        if weights is None:
+            weights = np.ones(len(values), dtype=int)
+        n_values = int(weights.sum())
+        if n_values == 0:
+            return
+        mean = np.dot(values, weights) / n_values
+        m2 = np.dot((values - mean) ** 2, weights)
+
+        total = self.n_values + n_values
+        delta = mean - self.mean
+        self.mean += delta * n_values / total
+        self.m2 += m2 + delta ** 2 * self.n_values * n_values / total
+        self.n_values = total
+        self.max = max(self.max, float(values.max()))
+        self.min = min(self.min, float(values.min()))
+
+
+class _ColumnStatistics:
+    """
+    Statistics of the non-NaN values of a column.
+
+    Attributes:
+        num_distincts {int} -- Number of distinct values as strings.
+        samples {list} -- Up to `n_samples` distinct values as strings.
+        moments {_Moments} -- Moments of the numeric values.
+        n_numeral_values {int} -- Number of values made mostly of numerals.
+        any_numeric_string {bool} -- Whether a value parses as a number.
+    """
+
+    def __init__(self):
+        self.num_distincts = 0
+        self.samples = []
+        self.moments = _Moments()
+        self.n_numeral_values = 0
+        self.any_numeric_string = False
+
+    def _update_number_check(self, strings: pd.Series, counts: np.ndarray):
+        """Add distinct strings to the checks of `is_number_as_string`."""
+        self.n_numeral_values += hr.count_values_containing_numbers(
+            strings, counts
+        )
+        if not self.any_numeric_string:
+            self.any_numeric_string = bool(len(hr.convert_to_numeric(strings)))
+
+
+class _NativeColumnStatistics(_ColumnStatistics):
+    """Statistics of a column with a numeric numpy dtype."""
+
+    def __init__(self, values: pd.Series, n_samples: int):
+        super().__init__()
+        counts = values.value_counts(sort=False)
+        distinct = counts.index.values
+        counts = counts.values
+        self.num_distincts = len(distinct)
+        self.samples = _as_strings(
+            np.random.choice(
+                distinct, size=min(n_samples, len(distinct)), replace=False
+            )
+        ).tolist()
+        if len(values):
+            self.moments.update(values.values.astype(float))
+
+        for start in range(0, len(distinct), _CHUNK_SIZE):
+            stop = start + _CHUNK_SIZE
+            self._update_number_check(
+                pd.Series(_as_strings(distinct[start:stop]), dtype="object"),
+                counts[start:stop],
+            )
+
+
+class _StreamedColumnStatistics(_ColumnStatistics):
+    """Statistics of a column of any dtype, streamed in chunks of rows."""
+
+    def __init__(self, values: pd.Series, n_samples: int):
+        super().__init__()
+        self._n_samples = n_samples
+        self._seen = np.empty(0, dtype=np.uint64)
+        # For these dtypes, the strings can be parsed back into the values
+        parse_strings = (
+            isinstance(values.dtype, np.dtype) and values.dtype.kind == "O"
+        )
+        for start in range(0, len(values), _CHUNK_SIZE):
+            stop = start + _CHUNK_SIZE
+            chunk = values.iloc[start:stop]
+            codes, distinct = pd.factorize(_as_strings(chunk.values))
+            counts = np.bincount(codes, minlength=len(distinct))
+            distinct = pd.Series(distinct, dtype="object")
+
+            self._update_distinct(distinct)
+            self._update_number_check(distinct, counts)
+            if parse_strings:
+                numeric = pd.to_numeric(distinct, errors="coerce")
+                is_numeric = numeric.notna().values
+                self.moments.update(
+                    numeric.values[is_numeric].astype(float),
+                    counts[is_numeric],
+                )
+            else:
+                self.moments.update(
+                    hr.convert_to_numeric(chunk).values.astype(float)
+                )
+
+    def _update_distinct(self, distinct: pd.Series):
+        """Count the new distinct strings and add them to the reservoir."""
+        hashes = pd.util.hash_array(distinct.values)
+        # `_seen` is kept sorted, so only the hashes of the chunk are
+        # searched and sorted rather than all the hashes seen so far
+        positions = np.searchsorted(self._seen, hashes)
+        is_new = positions == len(self._seen)
+        is_new[~is_new] = self._seen[positions[~is_new]] != hashes[~is_new]
+        new = distinct.values[is_new]
+        order = np.argsort(hashes[is_new])
+        self._seen = np.insert(
+            self._seen, positions[is_new][order], hashes[is_new][order]
+        )
+
+        # Reservoir sampling of the distinct strings, in the order they are
+        # first seen
+        n_before = self.num_distincts
+        self.num_distincts += len(new)
+        n_filled = max(0, min(len(new), self._n_samples - len(self.samples)))
+        self.samples.extend(new[:n_filled])
+        positions = np.arange(n_before + n_filled, self.num_distincts)
+        replaced = np.random.randint(0, positions + 1)
+        for i in np.flatnonzero(replaced < self._n_samples):
+            self.samples[replaced[i]] = new[n_filled + i]
+
+
+def _as_strings(values: np.ndarray) -> np.ndarray:
+    """Convert values to strings as `astype("object").astype(str)` does."""
+    return pd.Series(values).astype("object").astype(str).values
+
+
 class RawDataSetParser(DataSetParser):
     """
     Abstract class to parse and extract metafeatures from a raw data set.
@@ -47,7 +201,7 @@ class RawDataSetParser(DataSetParser):
         Returns:
             pd.DataFrame -- A dataframe containing the meta-features.
         """
-        DEFAULT_PLACEHOLDER = 0.0
+        N_SAMPLES = 5
         COLUMNS = (
             "attribute_name",
             "total_val",
@@ -59,91 +213,106 @@ class RawDataSetParser(DataSetParser):
             "num_distincts",
         )
 
-        # Find raw feature columns that may be numeric
-        may_be_numeric = raw.apply(hr.is_number_as_string, axis=0)
-
-        def _descriptive_stat_reducer(
-            reduce_fn: Callable
-        ) -> Callable[[pd.Series], pd.Series]:
-            return (
-                lambda series: reduce_fn(hr.convert_to_numeric(series))
-                if may_be_numeric[series.name]
-                else DEFAULT_PLACEHOLDER
+        rows = []
+        for i, attribute_name in enumerate(raw.columns):
+            stats = RawDataSetParser._column_statistics(
+                raw.iloc[:, i], n_samples=N_SAMPLES
             )
-
-        # Create base metafeatures as a data frame
-        df = (
-            pd.DataFrame(columns=COLUMNS, index=raw.columns)
-            .pipe(
-                lambda df: df.assign(
-                    attribute_name=raw.columns,
-                    total_val=[len(raw)] * len(raw.columns),
-                    samples_set=raw.astype("object").apply(
-                        lambda s: set(s.dropna().astype(str).unique())
-                    ),
-                    num_nans=raw.isnull().sum(axis=0),
-                    max=raw.apply(
-                        _descriptive_stat_reducer(max), result_type="expand"
-                    ),
-                    min=raw.apply(
-                        _descriptive_stat_reducer(min), result_type="expand"
-                    ),
-                    mean=raw.apply(
-                        _descriptive_stat_reducer(np.mean),
-                        result_type="expand",
-                    ),
-                    stddev=raw.apply(
-                        _descriptive_stat_reducer(np.std), result_type="expand"
-                    ),
-                )
-            )
-            .pipe(
-                lambda df: df.assign(
-                    num_distincts=df["samples_set"].apply(len)
-                )
+            samples = stats.pop("samples")
+            rows.append(
+                {
+                    "attribute_name": attribute_name,
+                    "total_val": len(raw),
+                    **stats,
+                    **{
+                        f"sample{j + 1}": sample
+                        for j, sample in enumerate(samples)
+                    },
+                }
             )
-        )
 
-        # Get five random samples
-        samples = (
-            df[["samples_set"]]
-            .apply(
-                lambda row: RawDataSetParser._generate_samples(row.values[0]),
-                axis=1,
-                result_type="expand",
-            )
-            .rename(lambda i: f"sample{i + 1}", axis=1)
+        return pd.DataFrame(
+            rows,
+            columns=[*COLUMNS, *(f"sample{j + 1}" for j in range(N_SAMPLES))],
         )
 
-        df = pd.concat([df, samples], sort=False, axis=1).reset_index(
-            drop=True
+    @staticmethod
+    def _column_statistics(series: pd.Series, n_samples: int = 5) -> dict:
+        """
+        Compute the base statistics of a column in a single pass.
+
+        Numeric columns are reduced to their distinct values and counts on
+        their native dtype, and only the distinct values are converted to
+        strings, one chunk at a time. Other columns are streamed in chunks of
+        rows, whose strings are discarded once the chunk is reduced: the
+        distinct values seen so far are only kept as 64-bit hashes, and the
+        samples are drawn with a reservoir. No set of every value is built.
+
+        Arguments:
+            series {pd.Series} -- Raw feature column.
+
+        Keyword Arguments:
+            n_samples {int} -- Number of samples to draw. (default: {5})
+
+        Returns:
+            dict -- Base features {max, min, mean, stddev, num_nans,
+                    num_distincts, samples}.
+        """
+        DEFAULT_PLACEHOLDER = 0.0
+
+        is_nan = series.isna().values
+        values = series[~is_nan]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+            accumulator = _NativeColumnStatistics(values, n_samples)
+        else:
+            accumulator = _StreamedColumnStatistics(values, n_samples)
+
+        stats = {
+            "max": DEFAULT_PLACEHOLDER,
+            "min": DEFAULT_PLACEHOLDER,
+            "mean": DEFAULT_PLACEHOLDER,
+            "stddev": DEFAULT_PLACEHOLDER,
+            "num_nans": int(is_nan.sum()),
+            "num_distincts": accumulator.num_distincts,
+            "samples": RawDataSetParser._generate_samples(
+                accumulator.samples, n=n_samples
+            ),
+        }
+
+        moments = accumulator.moments
+        may_be_numeric = (
+            hr._safe_div(accumulator.n_numeral_values, len(series)) >= 0.5
+            and accumulator.any_numeric_string
         )
+        if may_be_numeric and moments.n_values:
+            stats.update(
+                max=moments.max,
+                min=moments.min,
+                mean=moments.mean,
+                stddev=np.sqrt(moments.m2 / moments.n_values),
+            )
 
-        return df
+        return stats
 
     @staticmethod
-    def _generate_samples(s: set, n: int = 5) -> np.ndarray:
+    def _generate_samples(distinct: np.ndarray, n: int = 5) -> np.ndarray:
         """
-        Generate `n` samples from set `s` without replacement.
+        Generate `n` samples from the `distinct` values without replacement.
 
-        If there are less than `n` samples, than additional values will be sampled
-        with replacement until the set reaches length `n`.
+        If there are less than `n` distinct values, than additional values
+        will be sampled with replacement until there are `n` samples.
         """
-        # Remove NaNs from set. This assumes that, other than NaNs, the set only contains
-        # numeric and text members.
-        without_nans = {x for x in s if x == x}
-
         # Attempt to sample without replacement
-        if len(without_nans) >= n:
-            return np.random.choice(list(without_nans), size=n, replace=False)
-        elif len(without_nans) == 0:
+        if len(distinct) >= n:
+            return np.random.choice(distinct, size=n, replace=False)
+        elif len(distinct) == 0:
             return np.array([np.nan] * n)
         else:
-            # Add all members from set equally before randomly sampling remaining members
-            samples = list(without_nans) * (n // len(without_nans))
+            # Add all values equally before randomly sampling remaining values
+            samples = list(distinct) * (n // len(distinct))
             samples.extend(
                 np.random.choice(
-                    list(without_nans), size=(n - len(samples)), replace=False
+                    distinct, size=(n - len(samples)), replace=False
                 ).tolist()
             )
 
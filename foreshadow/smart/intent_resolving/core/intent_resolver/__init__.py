@@ -1,2 +1,8 @@
 """Module documenting IntentResolver logic."""
+from .component_registry import (
+    DEFAULT_COMPONENTS_PATH,
+    ResolverComponentRegistry,
+    registry,
+    warm_up,
+)
 from .intent_resolver import IntentResolver
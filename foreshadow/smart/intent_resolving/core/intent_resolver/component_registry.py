@@ -0,0 +1,236 @@
+"""Class definition for the ResolverComponentRegistry class."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .. import io
+
+
+def _default_components_path() -> Path:
+    """Prefer the compact archive over the pickle when both are shipped."""
+    npz_path = Path(__file__).with_name("resolver_components.npz")
+    return npz_path if npz_path.is_file() else npz_path.with_suffix(".pkl")
+
+
+DEFAULT_COMPONENTS_PATH = _default_components_path()
+
+
+class ResolverComponentRegistry:
+    """
+    Process-wide cache of deserialized intent resolver components.
+
+    Loading the trained components (model, scaler and featurizer configs)
+    is the dominant fixed cost of an IntentResolver. The registry loads each
+    components file at most once per process and hands the same objects to
+    every IntentResolver instance. Callers must treat the returned
+    components as read-only.
+
+    An entry is invalidated when the file on disk changes, which is detected
+    through its modification time and size. Entries can also be explicitly
+    invalidated. Objects built from the components, such as the secondary
+    featurizers, can be cached with them through `get_derived`.
+
+    The registry is safe to use from multiple threads, and after a fork the
+    child process reuses the components loaded by the parent but gets a
+    fresh lock, since the parent's lock could have been held while forking.
+
+    Attributes:
+        _entries {Dict[Path, Tuple[Tuple[int, int], dict]]}
+            -- Loaded components and the file signature they were loaded from,
+               keyed by resolved file path.
+        _derived {Dict[Tuple[Path, str], Tuple[dict, Any]]}
+            -- Objects built from the components, with the components they
+               were built from, keyed by resolved file path and name.
+        _lock {threading.Lock}
+            -- Guards loading and invalidation.
+        _pid {int}
+            -- Process id that created `_lock`.
+
+    Methods:
+        get -- Get (and lazily load) the components stored at a path.
+        get_derived -- Get (and lazily build) an object from the components.
+        warm_up -- Eagerly load the components stored at a path.
+        invalidate -- Drop one or all cached components.
+        is_loaded -- Whether up-to-date components for a path are cached.
+    """
+
+    def __init__(self):
+        """Init function."""
+        self._entries: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+        self._derived: Dict[Tuple[Path, str], Tuple[dict, Any]] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def get(
+        self, components_path: Union[str, Path] = DEFAULT_COMPONENTS_PATH
+    ) -> dict:
+        """
+        Get the components stored at `components_path`.
+
+        Components are loaded on first access and whenever the file has
+        changed since it was last loaded.
+
+        Keyword Arguments:
+            components_path {Union[str, Path]}
+                -- Path to saved and trained components.
+                   (default: {DEFAULT_COMPONENTS_PATH})
+
+        Raises:
+            FileNotFoundError -- If `components_path` file does not exist.
+
+        Returns:
+            dict -- Deserialized components. Must not be modified.
+        """
+        path = self._resolve(components_path)
+        signature = self._signature(path)
+
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        with self._get_lock():
+            # Another thread may have loaded the file while we were waiting
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                return entry[1]
+
+            components = io.load_components(path)
+            self._entries[path] = (signature, components)
+            return components
+
+    def get_derived(
+        self,
+        name: str,
+        build: Callable[[dict], Any],
+        components_path: Union[str, Path] = DEFAULT_COMPONENTS_PATH,
+    ) -> Any:
+        """
+        Get an object built from the components stored at `components_path`.
+
+        The object is built once per loaded version of the components and
+        is dropped with them. Like the components, it must not be modified.
+
+        Arguments:
+            name {str} -- Name of the object, unique per `build` function.
+            build {Callable[[dict], Any]} -- Builds the object from the
+                                              components.
+
+        Keyword Arguments:
+            components_path {Union[str, Path]}
+                -- Path to saved and trained components.
+                   (default: {DEFAULT_COMPONENTS_PATH})
+
+        Raises:
+            FileNotFoundError -- If `components_path` file does not exist.
+
+        Returns:
+            Any -- The object built from the components.
+        """
+        components = self.get(components_path)
+        key = (self._resolve(components_path), name)
+
+        entry = self._derived.get(key)
+        if entry is not None and entry[0] is components:
+            return entry[1]
+
+        with self._get_lock():
+            entry = self._derived.get(key)
+            if entry is not None and entry[0] is components:
+                return entry[1]
+
+            derived = build(components)
+            self._derived[key] = (components, derived)
+            return derived
+
+    def warm_up(
+        self, components_path: Union[str, Path] = DEFAULT_COMPONENTS_PATH
+    ) -> None:
+        """
+        Eagerly load the components stored at `components_path`.
+
+        Useful before forking worker processes or before the first fit so that
+        the loading cost is not paid by the first resolved column.
+
+        Keyword Arguments:
+            components_path {Union[str, Path]}
+                -- Path to saved and trained components.
+                   (default: {DEFAULT_COMPONENTS_PATH})
+        """
+        self.get(components_path)
+
+    def invalidate(
+        self, components_path: Optional[Union[str, Path]] = None
+    ) -> None:
+        """
+        Drop cached components.
+
+        Keyword Arguments:
+            components_path {Optional[Union[str, Path]]}
+                -- Path of the components to drop. If None, drop all cached
+                   components. (default: {None})
+        """
+        with self._get_lock():
+            if components_path is None:
+                self._entries.clear()
+                self._derived.clear()
+            else:
+                path = self._resolve(components_path)
+                self._entries.pop(path, None)
+                for key in [key for key in self._derived if key[0] == path]:
+                    del self._derived[key]
+
+    def is_loaded(
+        self, components_path: Union[str, Path] = DEFAULT_COMPONENTS_PATH
+    ) -> bool:
+        """Check if up-to-date components for `components_path` are cached."""
+        path = self._resolve(components_path)
+        entry = self._entries.get(path)
+        if entry is None:
+            return False
+        try:
+            return entry[0] == self._signature(path)
+        except FileNotFoundError:
+            return False
+
+    def _get_lock(self) -> threading.Lock:
+        # Used after a fork by the instances other than `registry`, and on
+        # platforms without `os.register_at_fork`
+        if self._pid != os.getpid():
+            self._reset_lock()
+        return self._lock
+
+    def _reset_lock(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @staticmethod
+    def _resolve(components_path: Union[str, Path]) -> Path:
+        return Path(components_path).expanduser().resolve()
+
+    @staticmethod
+    def _signature(path: Path) -> Tuple[int, int]:
+        """
+        Identify the version of the file at `path`.
+
+        Raises:
+            FileNotFoundError -- If `path` does not exist.
+        """
+        stat = os.stat(str(path))
+        return stat.st_mtime_ns, stat.st_size
+
+
+registry = ResolverComponentRegistry()
+
+if hasattr(os, "register_at_fork"):
+    # A single hook for the shared registry, so that no instance is kept
+    # alive by its hook
+    os.register_at_fork(after_in_child=registry._reset_lock)
+
+
+def warm_up(
+    components_path: Union[str, Path] = DEFAULT_COMPONENTS_PATH
+) -> None:
+    """Load the intent resolver components into the process-wide registry."""
+    registry.warm_up(components_path)
@@ -1,17 +1,26 @@
 """Class definition for the IntentResolver class."""
 
+import copy
 import logging
 from pathlib import Path
-from typing import Dict, Union
+from typing import Dict, List, Union
 
 import pandas as pd
 
-from .. import io
 from ..data_set_parsers import DataFrameDataSetParser
 from ..secondary_featurizers import (
     FeaturizerCurator,
     RawDataSetFeaturizerViaLambda,
 )
+from .component_registry import DEFAULT_COMPONENTS_PATH, registry
+
+
+def _build_featurizers(components: dict) -> List:
+    """Build the secondary featurizers described by the components."""
+    return FeaturizerCurator.from_config(
+        func_config=components["function_featurizers_config"],
+        text_config=components["text_featurizer_config"],
+    )
 
 
 class IntentResolver:
@@ -42,9 +51,7 @@ class IntentResolver:
     def __init__(
         self,
         raw: pd.DataFrame,
-        components_path: Path = Path(__file__).with_name(
-            "resolver_components.pkl"
-        ),
+        components_path: Path = DEFAULT_COMPONENTS_PATH,
     ):
         """
         Init function.
@@ -54,7 +61,8 @@ class IntentResolver:
 
         Keyword Arguments:
             components_path {Path} -- Path to saved and trained components.
-                   (default: {Path(__file__).with_name('resolver_components.pkl')})
+                   Either a `.npz` archive or a pickle, see `io`.
+                   (default: {DEFAULT_COMPONENTS_PATH})
 
         Raises:
             FileNotFoundError -- If `components_path` file does not exist.
@@ -73,13 +81,17 @@ class IntentResolver:
         self.parser = DataFrameDataSetParser(raw)
         self.components_path = Path(components_path)
 
-        # Load trained assets
-        components = io.from_pickle(self.components_path)
+        # Trained assets are loaded once per process and shared
+        components = registry.get(self.components_path)
         self.model = components["model"]
         self.scaler = components["scaler"]
-        self.parser.featurizers = FeaturizerCurator.from_config(
-            func_config=components["function_featurizers_config"],
-            text_config=components["text_featurizer_config"],
+        # The featurizers are built once per process too, but they keep the
+        # metafeatures they compute and fit their text embedders, so each
+        # resolver works on its own copy.
+        self.parser.featurizers = copy.deepcopy(
+            registry.get_derived(
+                "featurizers", _build_featurizers, self.components_path
+            )
         )
 
         # Check that `RawDataSetFeaturizerViaLambda` attributes are properly set
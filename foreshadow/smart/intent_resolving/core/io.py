@@ -1,14 +1,365 @@
-"""Module containing IO functionalities."""
-import dill
+"""
+Module containing IO functionalities.
+
+Resolver components can be stored in two formats:
+    -- A dill pickle (`.pkl`), used during research and training.
+    -- A compact archive (`.npz`) holding the numeric parts of the components
+       as plain NumPy arrays and everything else as JSON. Loading it requires
+       neither dill nor unpickling, and its arrays are memory-mapped so that
+       they are only read from disk when used.
+
+Use `export_components` (or `python -m ...core.io SRC DST`) to convert a
+pickle into an archive.
+"""
+import argparse
+import importlib
+import json
+import struct
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
+
+
+COMPONENTS_MEMBER = "components.json"
+_ARRAY_SUFFIX = ".npy"
+
+# Markers of the JSON encoding of the objects that JSON does not support
+_ARRAY = "__ndarray__"
+_OBJECT_ARRAY = "__object_array__"
+_TUPLE = "__tuple__"
+_SET = "__set__"
+_ITEMS = "__items__"
+_TYPE = "__type__"
+_DTYPE = "__dtype__"
+_CALLABLE = "__callable__"
+_ESTIMATOR = "__estimator__"
+_TREE = "__tree__"
+
+# Only classes and functions defined in these packages are imported when
+# loading, along with a few builtin types that are safe to reference.
+_ALLOWED_PACKAGES = ("sklearn", "numpy", "foreshadow")
+_ALLOWED_BUILTINS = {
+    f"builtins:{t.__name__}" for t in (bool, int, float, complex, str, object)
+}
+
+# Layout of a zip local file header, see `zipfile.structFileHeader`
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
 
 
 def to_pickle(items, path: str):
     """Serialize components to a pickle file."""
+    import dill
+
     with open(path, "wb") as file:
         dill.dump(items, file)
 
 
 def from_pickle(path: str):
     """Deserialize components to a pickle file."""
+    import dill
+
     with open(path, "rb") as file:
         return dill.load(file)
+
+
+def to_npz(items: dict, path: Union[str, Path]) -> None:
+    """
+    Serialize components to a compact archive.
+
+    The archive is a valid `.npz` file with an additional JSON member.
+    Arrays are stored uncompressed so that they can be memory-mapped, and
+    their dtypes and shapes are also recorded in the JSON member so that
+    loading does not need to parse each `.npy` header.
+
+    Arguments:
+        items {dict} -- Components to serialize.
+        path {Union[str, Path]} -- Path of the archive.
+
+    Raises:
+        TypeError -- If a component cannot be represented without pickling.
+    """
+    encoder = _Encoder()
+    config = {"components": encoder.encode(items), "arrays": {}}
+
+    with zipfile.ZipFile(str(path), "w", zipfile.ZIP_STORED) as archive:
+        for key, array in encoder.arrays.items():
+            array = np.ascontiguousarray(array)
+            config["arrays"][key] = {
+                "dtype": _encode_dtype(array.dtype),
+                "shape": list(array.shape),
+            }
+            with archive.open(key + _ARRAY_SUFFIX, "w") as file:
+                np.lib.format.write_array(file, array, allow_pickle=False)
+        archive.writestr(COMPONENTS_MEMBER, json.dumps(config))
+
+
+def from_npz(path: Union[str, Path], mmap: bool = True) -> dict:
+    """
+    Deserialize components from a compact archive.
+
+    Arguments:
+        path {Union[str, Path]} -- Path of the archive.
+
+    Keyword Arguments:
+        mmap {bool} -- Memory-map the arrays instead of reading them.
+                       Memory-mapped arrays are read-only. (default: {True})
+
+    Returns:
+        dict -- Deserialized components.
+    """
+    path = str(path)
+    arrays = {}
+    with zipfile.ZipFile(path) as archive:
+        config = json.loads(archive.read(COMPONENTS_MEMBER).decode("utf-8"))
+        # A single mapping of the whole archive backs every array
+        buffer = np.memmap(path, dtype=np.uint8, mode="r") if mmap else None
+        for key, layout in config["arrays"].items():
+            info = archive.getinfo(key + _ARRAY_SUFFIX)
+            dtype = _decode_dtype(layout["dtype"])
+            if buffer is not None and info.compress_type == zipfile.ZIP_STORED:
+                arrays[key] = np.ndarray(
+                    shape=tuple(layout["shape"]),
+                    dtype=dtype,
+                    buffer=buffer,
+                    offset=_array_offset(buffer, info),
+                )
+            else:
+                with archive.open(info) as file:
+                    arrays[key] = np.lib.format.read_array(
+                        file, allow_pickle=False
+                    )
+
+    return _Decoder(arrays).decode(config["components"])
+
+
+def load_components(path: Union[str, Path]) -> dict:
+    """
+    Deserialize components stored in either format, based on the suffix.
+
+    Arguments:
+        path {Union[str, Path]} -- Path of a `.npz` archive or a pickle.
+
+    Returns:
+        dict -- Deserialized components.
+    """
+    if Path(path).suffix == ".npz":
+        return from_npz(path)
+    return from_pickle(path)
+
+
+def export_components(
+    pickle_path: Union[str, Path], npz_path: Union[str, Path]
+) -> None:
+    """
+    Convert components pickled with `to_pickle` into a compact archive.
+
+    Arguments:
+        pickle_path {Union[str, Path]} -- Path of the pickle.
+        npz_path {Union[str, Path]} -- Path of the archive to write.
+    """
+    to_npz(from_pickle(pickle_path), npz_path)
+
+
+def _array_offset(buffer: np.ndarray, info: zipfile.ZipInfo) -> int:
+    """Get the offset of the data of an uncompressed `.npy` zip member."""
+    header = _ZIP_LOCAL_HEADER.unpack_from(buffer, info.header_offset)
+    # Skip the zip local header, the file name and the extra field
+    npy_offset = info.header_offset + _ZIP_LOCAL_HEADER.size
+    npy_offset += header[10] + header[11]
+    # Skip the .npy magic string, version and header
+    major_version = int(buffer[npy_offset + 6])
+    if major_version == 1:
+        (header_len,) = struct.unpack_from("<H", buffer, npy_offset + 8)
+        return npy_offset + 10 + header_len
+    (header_len,) = struct.unpack_from("<I", buffer, npy_offset + 8)
+    return npy_offset + 12 + header_len
+
+
+def _encode_dtype(dtype: np.dtype) -> Union[str, dict]:
+    if dtype.fields is None:
+        return dtype.str
+    return {
+        "names": list(dtype.names),
+        "formats": [_encode_dtype(dtype.fields[n][0]) for n in dtype.names],
+        "offsets": [dtype.fields[n][1] for n in dtype.names],
+        "itemsize": dtype.itemsize,
+    }
+
+
+def _decode_dtype(dtype: Union[str, dict]) -> np.dtype:
+    if isinstance(dtype, str):
+        return np.dtype(dtype)
+    return np.dtype(
+        dict(dtype, formats=[_decode_dtype(f) for f in dtype["formats"]])
+    )
+
+
+def _is_allowed_module(module_name: str) -> bool:
+    return any(
+        module_name == package or module_name.startswith(package + ".")
+        for package in _ALLOWED_PACKAGES
+    )
+
+
+def _check_allowed(name: str) -> str:
+    module_name, _, qualname = name.partition(":")
+    allowed = name in _ALLOWED_BUILTINS or (
+        _is_allowed_module(module_name)
+        and not any(attr.startswith("__") for attr in qualname.split("."))
+    )
+    if not allowed:
+        raise ValueError(f"Refusing to import `{name}` from components.")
+    return name
+
+
+def _qualified_name(obj: Any) -> str:
+    return _check_allowed(f"{obj.__module__}:{obj.__qualname__}")
+
+
+def _import_qualified_name(name: str) -> Any:
+    module_name, qualname = _check_allowed(name).split(":")
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    # An allowed module may expose objects imported from anywhere else
+    if name not in _ALLOWED_BUILTINS and not _is_allowed_module(
+        getattr(obj, "__module__", None) or ""
+    ):
+        raise ValueError(f"Refusing to import `{name}` from components.")
+    return obj
+
+
+class _Encoder:
+    """Encode components into JSON-serializable objects and arrays."""
+
+    def __init__(self):
+        from sklearn.base import BaseEstimator
+        from sklearn.tree._tree import Tree
+
+        self.arrays: Dict[str, np.ndarray] = {}
+        # The first entry matching the type of an object encodes it
+        self._encoders: List[Tuple[Any, Callable[[Any], Any]]] = [
+            ((type(None), bool, int, float, str), lambda x: x),
+            (np.generic, lambda x: x.item()),
+            (np.ndarray, self._encode_array),
+            (list, lambda x: [self.encode(v) for v in x]),
+            (tuple, lambda x: {_TUPLE: self.encode(list(x))}),
+            ((set, frozenset), lambda x: {_SET: self.encode(list(x))}),
+            (dict, self._encode_dict),
+            (np.dtype, lambda x: {_DTYPE: x.str}),
+            (type, lambda x: {_TYPE: _qualified_name(x)}),
+            (Tree, self._encode_tree),
+            (BaseEstimator, self._encode_estimator),
+        ]
+
+    def encode(self, obj: Any) -> Any:
+        for types, encoder in self._encoders:
+            if isinstance(obj, types):
+                return encoder(obj)
+        if callable(obj) and "<" not in getattr(obj, "__qualname__", "<"):
+            return {_CALLABLE: _qualified_name(obj)}
+
+        raise TypeError(
+            f"Cannot export object of type {type(obj)} without pickling. "
+            "Lambdas and local functions should be stored as strings."
+        )
+
+    def _encode_array(self, obj: np.ndarray) -> dict:
+        if obj.dtype.hasobject:
+            return {_OBJECT_ARRAY: self.encode(obj.tolist())}
+        key = f"arr_{len(self.arrays)}"
+        self.arrays[key] = obj
+        return {_ARRAY: key}
+
+    def _encode_dict(self, obj: dict) -> dict:
+        if all(isinstance(k, str) for k in obj):
+            return {k: self.encode(v) for k, v in obj.items()}
+        return {
+            _ITEMS: [[self.encode(k), self.encode(v)] for k, v in obj.items()]
+        }
+
+    def _encode_tree(self, obj: Any) -> dict:
+        _, args, state = obj.__reduce__()
+        return {
+            _TREE: {"args": self.encode(args), "state": self.encode(state)}
+        }
+
+    def _encode_estimator(self, obj: Any) -> dict:
+        params = obj.get_params(deep=False)
+        return {
+            _ESTIMATOR: _qualified_name(type(obj)),
+            "params": self.encode(params),
+            "attributes": self.encode(
+                {k: v for k, v in vars(obj).items() if k not in params}
+            ),
+        }
+
+
+class _Decoder:
+    """Decode the objects encoded by `_Encoder`."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+        self._decoders: Dict[str, Callable[[Any], Any]] = {
+            _ARRAY: lambda key: self.arrays[key],
+            _OBJECT_ARRAY: lambda x: np.array(self.decode(x), dtype=object),
+            _TUPLE: lambda x: tuple(self.decode(x)),
+            _SET: lambda x: set(self.decode(x)),
+            _ITEMS: lambda x: {self.decode(k): self.decode(v) for k, v in x},
+            _DTYPE: np.dtype,
+            _TYPE: _import_qualified_name,
+            _CALLABLE: _import_qualified_name,
+            _TREE: self._decode_tree,
+        }
+
+    def decode(self, obj: Any) -> Any:
+        if isinstance(obj, list):
+            return [self.decode(x) for x in obj]
+        if not isinstance(obj, dict):
+            return obj
+        if _ESTIMATOR in obj:
+            return self._decode_estimator(obj)
+        if len(obj) == 1:
+            marker, value = next(iter(obj.items()))
+            if marker in self._decoders:
+                return self._decoders[marker](value)
+        return {k: self.decode(v) for k, v in obj.items()}
+
+    def _decode_estimator(self, obj: dict) -> Any:
+        from sklearn.base import BaseEstimator
+
+        cls = _import_qualified_name(obj[_ESTIMATOR])
+        # Only estimator classes are called while loading
+        if not (isinstance(cls, type) and issubclass(cls, BaseEstimator)):
+            raise ValueError(
+                f"Refusing to build `{obj[_ESTIMATOR]}` from components: "
+                "it is not a scikit-learn estimator."
+            )
+        estimator = cls(**self.decode(obj["params"]))
+        for name, value in self.decode(obj["attributes"]).items():
+            setattr(estimator, name, value)
+        return estimator
+
+    def _decode_tree(self, obj: dict) -> Any:
+        from sklearn.tree._tree import Tree
+
+        def in_memory(x):
+            # The tree copies its arrays, which must not be memory-mapped
+            return np.array(x) if isinstance(x, np.ndarray) else x
+
+        tree = Tree(*map(in_memory, self.decode(obj["args"])))
+        state = self.decode(obj["state"])
+        tree.__setstate__({k: in_memory(v) for k, v in state.items()})
+        return tree
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert pickled resolver components to a .npz archive."
+    )
+    parser.add_argument("pickle_path", help="Path of the pickled components.")
+    parser.add_argument("npz_path", help="Path of the archive to write.")
+    args = parser.parse_args()
+    export_components(args.pickle_path, args.npz_path)
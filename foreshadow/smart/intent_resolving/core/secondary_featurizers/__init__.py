@@ -5,6 +5,7 @@ Concrete secondary featurizer classes include:
     -- RawDataSetFeaturizerViaLambda
     -- MetaDataSetFeaturizerViaLambda
     -- NGramFeaturizer
+    -- HashedNGramFeaturizer
     -- Chars2VecFeaturizer
 
 This __init__.py file also contains defintions for the followig helper class:
@@ -19,9 +20,14 @@ from typing import List, Optional, Tuple, Union
 
 import pandas as pd
 
-from .. import heuristics as hr  # Required for processing train_configs
+# Required for processing train_configs
+from .. import vectorized_heuristics as hr
 from ..factory import GenericFactory as FeaturizerBuilderFactory
 from .base_featurizer import BaseFeaturizer
+from .hashed_ngram_featurizer import (
+    HashedNGramFeaturizer,
+    HashedNGramFeaturizerBuilder,
+)
 from .meta_data_set_featurizer_via_lambda import (
     MetaDataSetFeaturizerViaLambda,
     MetaDataSetFeaturizerViaLambdaBuilder,
@@ -122,9 +128,13 @@ class FeaturizerCurator:
         # `RawDataSetLambdaTransformer` or a `MetaDataSetFeaturizerViaLambda` instance
         # based the each featurizer's `on_raw` config parameter
         for featurizer_config in function_featurizers_config:
-            featurizer_config["callable_"] = eval(
-                featurizer_config["callable_"]
-            )
+            # Copy the config since it may be shared, e.g. when it comes
+            # from components cached in the ResolverComponentRegistry
+            featurizer_config = dict(featurizer_config)
+            if isinstance(featurizer_config["callable_"], str):
+                featurizer_config["callable_"] = eval(
+                    featurizer_config["callable_"]
+                )
             if featurizer_config["on_raw"]:
                 raw_lambda_transformers.append(
                     factory.create(
@@ -167,3 +177,6 @@ factory.register_builders(
     "meta_numerical", MetaDataSetFeaturizerViaLambdaBuilder()
 )
 factory.register_builders("ngram", NGramFeaturizerBuilder())
+factory.register_builders(
+    HashedNGramFeaturizer.TEXT_MODE, HashedNGramFeaturizerBuilder()
+)
@@ -201,14 +201,17 @@ class BaseTextFeaturizer(BaseFeaturizer):
         Returns:
             List[str] -- A list whose members containing row-wise preprocessed texts.
         """
+        # Strip each column before joining them. Lowering and replacing
+        # characters do not affect the ':' separator so they are done once
+        # on the joined texts.
+        projection = df[cols]
+        texts = None
+        for i in range(projection.shape[1]):
+            column = projection.iloc[:, i].astype(str).str.strip()
+            texts = column if texts is None else texts.str.cat(column, sep=":")
         return (
-            df[cols]
-            .apply(
-                lambda row: ":".join(
-                    str(s).strip().lower().replace("_", " ").replace("-", " ")
-                    for s in row.values
-                ),
-                axis=1,
-            )
-            .values.ravel()
+            texts.str.lower()
+            .str.replace("_", " ", regex=False)
+            .str.replace("-", " ", regex=False)
+            .values
         )
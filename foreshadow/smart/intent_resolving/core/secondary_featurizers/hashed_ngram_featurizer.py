@@ -0,0 +1,241 @@
+"""
+Definitions for classes related to hashed n-gram featurization.
+
+This includes class definitions for:
+    -- HashedNGramEmbedder
+    -- HashedNGramFeaturizer
+    -- HashedNGramFeaturizerBuilder
+
+Unlike their NGram counterparts, these classes do not learn a vocabulary.
+Character n-grams are hashed into a fixed number of features, so memory
+usage and featurization time do not grow with the number of n-grams seen
+during training.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from .base_embedder import BaseEmbedder
+from .base_text_featurizer import BaseTextFeaturizer
+
+
+class HashedNGramEmbedder(BaseEmbedder):
+    """
+    Concrete class to wrap sklearn's HashingVectorizer Implementation.
+
+    Is a component to HashedNGramFeaturizer. The embedder is stateless, so
+    fitting it is a no-op and an unfitted embedder can transform texts.
+
+    Attributes:
+        embedder
+            -- sklearn's HashingVectorizer
+        ngram_range {Tuple[int, int]}
+            -- Lower and upper bound of character tokens to use in featurization,
+               inclusive. For example, (2, 3) correspond to character-level
+               bigrams and trigrams.
+        n_features {int}
+            -- Number of hash buckets, i.e. the size of the embeddings.
+
+    Method:
+        load -- Load the embedder
+        fit -- Fit the embedder to the training data
+        transform -- Transfrom text to embeddings
+    """
+
+    def __init__(self, ngram_range: Tuple[int, int], n_features: int):
+        """
+        Init function.
+
+        Arguments:
+            ngram_range {Tuple[int, int]}
+                -- Lower and upper bound of character tokens to use in featurization,
+                   inclusive. For example, (2, 3) correspond to character-level
+                   bigrams and trigrams.
+            n_features {int}
+                -- Number of hash buckets, i.e. the size of the embeddings.
+        """
+        self.ngram_range = tuple(ngram_range)
+        self.n_features = n_features
+        self.embedder = self.load()
+
+    def load(self) -> HashingVectorizer:
+        """Load an sklearn HashingVectorizer instance."""
+        return HashingVectorizer(
+            analyzer="char",
+            strip_accents="unicode",
+            ngram_range=self.ngram_range,
+            n_features=self.n_features,
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float32,
+        )
+
+    def fit(self, vals: List[str]):
+        """Fit the embedder to `vals`. No-op since hashing is stateless."""
+        return self.embedder
+
+    def transform(self, vals: List[str]) -> pd.DataFrame:
+        """Transform a list of words into embeddings."""
+        # Extracting n-grams dominates the cost and the texts, especially
+        # the samples, repeat a lot. Hash each distinct text once and
+        # broadcast the embeddings into a preallocated matrix that the
+        # DataFrame wraps without copying.
+        codes, uniques = pd.factorize(np.asarray(vals, dtype=object))
+        counts = self.embedder.transform(uniques).toarray()
+        embeddings = np.empty((len(codes), self.n_features), np.float32)
+        np.take(counts, codes, axis=0, out=embeddings)
+        return pd.DataFrame(embeddings, copy=False)
+
+    def serialize(self) -> dict:
+        """
+        Return a serializable represenation of a HashedNGramEmbedder.
+
+        Returns:
+            dict -- Object attributes.
+        """
+        return {"ngram_range": self.ngram_range, "n_features": self.n_features}
+
+    @staticmethod
+    def deserialize(serialization: dict) -> "HashedNGramEmbedder":
+        """Instantiate a HashedNGramEmbedder from a serialization."""
+        return HashedNGramEmbedder(
+            ngram_range=serialization["ngram_range"],
+            n_features=serialization["n_features"],
+        )
+
+
+class HashedNGramFeaturizer(BaseTextFeaturizer):
+    """
+    Concrete class to featurize text using hashed n-grams.
+
+    Is a component of DataSetParser concrete subclasses. Can replace
+    NGramFeaturizer by retraining the intent resolver components with the
+    'hashed_ngram' text mode.
+
+    Attributes:
+        target_text {str}
+            -- Metafeature columns to perform text featurization on.
+               Valid values are {'attr', 'all'}.
+               'all' corresponds to the attribute column and sample columns.
+        normalizable {bool}
+            -- Whether the generated feature should be normalized. (default: {False})
+        attribute_embedder {HashedNGramEmbedder}
+            -- Embedder for the metafeature attribute column
+        samples_embedder {Optional[HashedNGramEmbedder]}
+            -- Optional embedder for the metafeature sample columns
+
+        Refer to superclass for additional attributes.
+
+    Methods:
+        featurize -- Create secondary text metafeatures
+    """
+
+    TEXT_MODE = "hashed_ngram"
+
+    def __init__(
+        self,
+        target_text: str,
+        ngram_range: Tuple[int, int] = (2, 3),
+        n_features: int = 2 ** 8,
+        normalizable: bool = False,
+    ):
+        """
+        Init function.
+
+        Arguments:
+            target_text {str}
+                -- Metafeature columns to perform text featurization on.
+                   Valid values are {'attr', 'all'}. 'all' corresponds to the
+                   attribute column and sample columns.
+
+        Keyword Arguments:
+            ngram_range {Tuple[int, int]}
+                -- Lower and upper bound of character tokens to use in featurization,
+                   inclusive. For example, (2, 3) correspond to character-level
+                   bigrams and trigrams.
+            n_features {int}
+                -- Number of hash buckets of each embedder. (default: {256})
+            normalizable {bool}
+                -- Whether the generated feature should be normalized. (default: {False})
+
+        Raises:
+            ValueError -- If invalid `target_text` is specified.
+        """
+        super().__init__(target_text=target_text, normalizable=normalizable)
+
+        self.attribute_embedder = HashedNGramEmbedder(
+            ngram_range=ngram_range, n_features=n_features
+        )
+        if self.samples_column:
+            self.samples_embedder = HashedNGramEmbedder(
+                ngram_range=ngram_range, n_features=n_features
+            )
+
+    def _update_feature_names(self):
+        """
+        Set `sec_feature_names` attribute with relevant feature names.
+
+        Feature column corresponding to each column of secondary metafeature generated.
+        Also marks whether a secondary metafeature column is not normalizable or
+        not based on the `normalizable` attribute.
+        """
+        names = super()._mark_nonnormalizable(
+            [
+                f"hashed_ngrams_attr_{i}"
+                for i in range(self.attribute_embedder.n_features)
+            ],
+            normalizable=self.normalizable,
+        )
+        if self.samples_embedder:
+            names += super()._mark_nonnormalizable(
+                [
+                    f"hashed_ngrams_samples_{i}"
+                    for i in range(self.samples_embedder.n_features)
+                ],
+                normalizable=self.normalizable,
+            )
+
+        self.sec_feature_names = names
+
+    def serialize(self) -> dict:
+        """Return a serializable representation."""
+        serialization = super().serialize()
+        serialization["text_mode"] = self.TEXT_MODE
+        serialization["ngram_range"] = serialization[
+            "attribute_embedder_config"
+        ]["ngram_range"]
+        serialization["n_features"] = serialization[
+            "attribute_embedder_config"
+        ]["n_features"]
+        return serialization
+
+
+class HashedNGramFeaturizerBuilder:
+    """Builder class for HashedNGramFeaturizer."""
+
+    def __call__(
+        self,
+        target_text: str,
+        ngram_range: Tuple[int, int] = (2, 3),
+        n_features: int = 2 ** 8,
+        normalizable: bool = False,
+        sec_feature_names: Optional[List[str]] = None,
+        **_ignore,
+    ):
+        """Build a HashedNGramFeaturizer based on supplied keyword arguments.
+
+        The embedders are stateless, so their serialized configs are not
+        needed to rebuild them.
+        """
+        featurizer = HashedNGramFeaturizer(
+            target_text=target_text,
+            ngram_range=ngram_range,
+            n_features=n_features,
+            normalizable=normalizable,
+        )
+        featurizer.sec_feature_names = sec_feature_names
+
+        return featurizer
@@ -11,10 +11,24 @@ Class defintions included here are for:
     -- RawDataSetFeaturizerViaLambdaBuilder
 """
 
+import os
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor
 from functools import partial
-from multiprocessing import Pool, cpu_count
+from hashlib import sha256
+from multiprocessing import cpu_count
 from pathlib import Path
-from typing import Callable, Generator, List, Optional, Tuple, Type
+from typing import (
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import pandas as pd
 from tqdm import tqdm
@@ -95,6 +109,72 @@ def _featurize_raw_dataframe(
     return metafeatures
 
 
+def _featurize_raw_dataframe_memoized(
+    data: Tuple[str, Callable[[], pd.DataFrame]],
+    featurizers: List[Type[RawDataSetLambdaTransformer]],
+    cache_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    Applies RawDataSetLambdaTransformers, reusing results from `cache_dir`.
+
+    The metafeatures of each raw data set are cached in their own file,
+    keyed by the content hash of the raw data set and by the methods of the
+    featurizers. A file is written as soon as its data set is featurized,
+    so an interrupted run resumes where it stopped and adding a data set
+    only featurizes that data set.
+
+    Raw dataframe functions without a `content_hash` method are not cached.
+
+    Arguments:
+        data {Tuple[str, Callable[[], pd.DataFrame]]}
+            -- A dataset identifier string and a raw dataframe function from which
+                metafeatures are extracted from.
+        featurizers {List[Type[RawDataSetLambdaTransformer]]}
+            -- RawDataSetLambdaTransformers to apply to the raw data set.
+
+    Keyword Arguments:
+        cache_dir {Optional[Path]}
+            -- Directory of the cached metafeatures. (default: {None})
+
+    Returns:
+        pd.DataFrame -- Extracted metafeatures from raw dataframe.
+    """
+    dataset, loader = data
+    if cache_dir is None or not hasattr(loader, "content_hash"):
+        return _featurize_raw_dataframe(data, featurizers)
+
+    key = sha256(loader.content_hash().encode())
+    for f in featurizers:
+        key.update(b"\0" + f.method.encode())
+    path = Path(cache_dir) / f"{key.hexdigest()}.pkl"
+
+    if path.is_file():
+        try:
+            metafeatures = io.from_pickle(path)
+        except Exception:
+            # Partially written or corrupted file, featurize again
+            pass
+        else:
+            # The same content may be registered under another identifier
+            metafeatures["dataset"] = dataset
+            return metafeatures
+
+    metafeatures = _featurize_raw_dataframe(data, featurizers)
+
+    # Write to a temporary file first so that an interrupted run never
+    # leaves a partially written file behind.
+    fd, tmp_path = tempfile.mkstemp(dir=str(cache_dir), suffix=".tmp")
+    os.close(fd)
+    try:
+        io.to_pickle(metafeatures, tmp_path)
+        os.replace(tmp_path, str(path))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return metafeatures
+
+
 class RawDataSetFeaturizerViaLambda:
     """
     Extract (multiple) metafeatures from a raw data set.
@@ -122,6 +202,20 @@ class RawDataSetFeaturizerViaLambda:
                 -- Directory to save or load computed secondary metafeatures.
                    Must be a pickle file. Required if `fast_load` is True.
                    (default: {None})
+        cache_dir {Optional[Path]}
+                -- Directory to cache the metafeatures of each raw data set,
+                   keyed by its content. (default: {None})
+        n_jobs {Optional[int]}
+                -- Number of processes used when multiprocessing.
+                   (default: {None}, one less than the number of CPUs)
+        chunksize {int}
+                -- Number of raw data sets dispatched at once to a process.
+                   (default: {1})
+        executor {Optional[Executor]}
+                -- Executor used when multiprocessing, instead of a process
+                   pool of `n_jobs` processes. (default: {None})
+        progress {bool}
+                -- Whether to show a progress bar. (default: {True})
 
     Methods:
         featurize -- Extract secondary metafeatures from the raw data set(s).
@@ -133,6 +227,11 @@ class RawDataSetFeaturizerViaLambda:
         fast_load: bool = False,
         n_rows: Optional[Tuple[Optional[int], Optional[int]]] = None,
         save_dir: Optional[Path] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        n_jobs: Optional[int] = None,
+        chunksize: int = 1,
+        executor: Optional[Executor] = None,
+        progress: bool = True,
     ):
         """
         Init function.
@@ -166,6 +265,20 @@ class RawDataSetFeaturizerViaLambda:
                 -- Directory to save or load computed secondary metafeatures.
                    Must be a pickle file. Required if `fast_load` is True.
                    (default: {None})
+            cache_dir {Optional[Union[str, Path]]}
+                -- Directory to cache the metafeatures of each raw data set,
+                   keyed by its content. (default: {None})
+            n_jobs {Optional[int]}
+                -- Number of processes used when multiprocessing.
+                   (default: {None}, one less than the number of CPUs)
+            chunksize {int}
+                -- Number of raw data sets dispatched at once to a process.
+                   (default: {1})
+            executor {Optional[Executor]}
+                -- Executor used when multiprocessing, instead of a process
+                   pool of `n_jobs` processes. (default: {None})
+            progress {bool}
+                -- Whether to show a progress bar. (default: {True})
 
         Raises:
             ValueError -- If `save_dir` does not point to a pickle file.
@@ -182,6 +295,15 @@ class RawDataSetFeaturizerViaLambda:
         self.n_rows = n_rows
         self.fast_load = fast_load
 
+        self.cache_dir = None
+        if cache_dir is not None:
+            self.cache_dir = Path(cache_dir)
+            self.cache_dir.mkdir(exist_ok=True, parents=True)
+        self.n_jobs = n_jobs
+        self.chunksize = chunksize
+        self.executor = executor
+        self.progress = progress
+
         if save_dir is not None:
             save_dir = Path(save_dir)
 
@@ -305,29 +427,22 @@ class RawDataSetFeaturizerViaLambda:
             None
         """
 
-        if multiprocess:
-            with Pool(cpu_count() - 1) as p:
-                func = partial(
-                    _featurize_raw_dataframe, featurizers=self.featurizers
-                )
-
-                # Process in parallel
-                results = list(
-                    tqdm(
-                        p.imap(func, raw_gen),
-                        desc="Analyzing raw dataset (parallel)",
-                        leave=False,
-                    )
-                )
-        else:
-            results = []
-            # Loops through raw datasets provided by `raw_gen`
-            for dataset, df in tqdm(
-                raw_gen, desc="Analyzing raw dataset", leave=False
-            ):
-                results.append(
-                    _featurize_raw_dataframe((dataset, df), self.featurizers)
-                )
+        func = partial(
+            _featurize_raw_dataframe_memoized,
+            featurizers=self.featurizers,
+            cache_dir=self.cache_dir,
+        )
+        results = list(
+            tqdm(
+                self.__map_in_parallel(func, raw_gen)
+                if multiprocess
+                else map(func, raw_gen),
+                desc="Analyzing raw dataset"
+                + (" (parallel)" if multiprocess else ""),
+                leave=False,
+                disable=not self.progress,
+            )
+        )
 
         # Combine all intermediary results into a master dataframe
         results = pd.concat(results, axis=0, ignore_index=True)
@@ -348,6 +463,25 @@ class RawDataSetFeaturizerViaLambda:
         if self.save_dir:
             self.__serialize_features()
 
+    def __map_in_parallel(
+        self, func: Callable, raw_gen: Iterable
+    ) -> Iterator[pd.DataFrame]:
+        """Map `func` over `raw_gen` with the configured executor, in order."""
+        if self.executor is not None:
+            yield from self.executor.map(
+                func, raw_gen, chunksize=self.chunksize
+            )
+            return
+
+        n_jobs = (
+            self.n_jobs if self.n_jobs is not None else max(1, cpu_count() - 1)
+        )
+        if n_jobs == 1:
+            yield from map(func, raw_gen)
+            return
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            yield from executor.map(func, raw_gen, chunksize=self.chunksize)
+
     def __map_features_to_feature_columns(
         self, keys: pd.DataFrame, results: List[pd.DataFrame]
     ) -> pd.Series:
@@ -473,6 +607,10 @@ class RawDataSetFeaturizerViaLambdaBuilder:
         fast_load: bool = False,
         n_rows: Optional[Tuple[Optional[int], Optional[int]]] = None,
         save_dir: Optional[Path] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        n_jobs: Optional[int] = None,
+        chunksize: int = 1,
+        progress: bool = True,
         **_ignored,
     ):
         """Build a RawDataSetFeaturizerViaLambda based on supplied keyword arguments."""
@@ -481,4 +619,8 @@ class RawDataSetFeaturizerViaLambdaBuilder:
             fast_load=fast_load,
             n_rows=n_rows,
             save_dir=save_dir,
+            cache_dir=cache_dir,
+            n_jobs=n_jobs,
+            chunksize=chunksize,
+            progress=progress,
         )
@@ -0,0 +1,351 @@
+"""
+Vectorized implementations of the heuristics used to generate metafeatures.
+
+Functions here produce the same metafeatures as their counterparts in
+`heuristics.py`, which remain the reference implementations. Instead of
+running a Python lambda with `re.search` / `str(x)` on every value, each
+column is converted to strings once, reduced to its distinct strings with
+their counts, and the distinct strings are matched with precompiled patterns
+through the pandas `.str` accessor.
+
+Heuristics that are already vectorized are re-exported unchanged so that this
+module can be used as a drop-in replacement of `heuristics.py`.
+"""
+
+import re
+import sys
+from functools import lru_cache
+from typing import Pattern, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .heuristics import (  # noqa: F401
+    _raise_if_not_pd_series,
+    _safe_div,
+    castable_as_numeric,
+    convert_to_numeric,
+    has_zero_in_leading_decimals,
+    is_bool_dtype,
+    is_category_dtype,
+    is_datetime_dtype,
+    is_float_dtype,
+    is_int_dtype,
+    is_string_dtype,
+    is_timedelta_dtype,
+    maybe_real_as_categorical,
+    nan_rate,
+    normalized_distinct_rate,
+)
+
+
+_DIGIT_PATTERN = re.compile(r"\d")
+_CAD_ZIPCODE_PATTERN = re.compile(r"\w\d\w\s?\d\w\d")
+# [TODO] Include '|' and '/', '\'
+_STRUCTURE_PATTERN = re.compile(r"[,;\[\]\{\}\(\)]")
+# Union of the time-like and date-like patterns of `heuristics.maybe_datetime`
+_DATETIME_PATTERN = re.compile(
+    # One / two digits, followed either (' ',  '-' or ':') and two digits
+    r"(?:^|\D)\d{1,2}(?:\s|[-:])\d{2}(?:$|\D)"
+    # Digit, with optional whitespace, followed by AM/PM (case-insensitive)
+    r"|(?i:(?:^|\D)\d+\s?(?:AM|PM)(?:$|\W))"
+    # One / two / four digits followed by either (' ', ', ', '-' or '/') and
+    # four digits
+    r"|(?:^|\D)(?:\d{1,2}|\d{4})(?:,?\s|[-/])\d{4}(?:$|\D)"
+    # Four digits followed by either (' ', '-' or '/') and one / two / four
+    # digits
+    r"|(?:^|\D)\d{4}(?:,?\s|[-/])(?:\d{1,2}|\d{4})(?:$|\D)"
+)
+
+
+@lru_cache(maxsize=None)
+def _any_digit_pattern() -> Pattern:
+    """
+    Match any character for which `str.isdigit` is True.
+
+    `\\d` only matches decimal characters, while `str.isdigit` also accepts
+    digits such as superscripts. The extra characters are looked up once.
+    """
+    extra_digits = "".join(
+        char
+        for char in map(chr, range(sys.maxunicode + 1))
+        if char.isdigit() and not char.isdecimal()
+    )
+    return re.compile(r"[\d{}]".format(re.escape(extra_digits)))
+
+
+def _as_str(series: pd.Series) -> pd.Series:
+    """Convert every value with `str`, the same way as `str(x)` does."""
+    if pd.api.types.infer_dtype(series, skipna=False) == "string":
+        return series
+    return series.astype("object").map(str)
+
+
+def _distinct_with_counts(strings: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+    """
+    Reduce a series of strings to its distinct values and their counts.
+
+    Arguments:
+        strings {pd.Series} -- Series of str values without NaNs.
+
+    Returns:
+        Tuple[pd.Series, np.ndarray] -- (distinct values, counts)
+    """
+    codes, uniques = pd.factorize(strings)
+    counts = np.bincount(codes, minlength=len(uniques))
+    return pd.Series(uniques, dtype="object"), counts
+
+
+def _weighted_sum(mask: pd.Series, counts: np.ndarray) -> int:
+    return int(np.dot(np.asarray(mask, dtype=bool), counts))
+
+
+def is_number_as_string(
+    series: pd.Series, shrinkage_threshold: float = 0.7
+) -> bool:
+    """
+    Check if string can be numerical.
+
+    Vectorized version of `heuristics.is_number_as_string`.
+    """
+    uniques, counts = _distinct_with_counts(series.astype(str))
+    return is_number_as_string_from_counts(
+        uniques, counts, len(series), shrinkage_threshold
+    )
+
+
+def count_values_containing_numbers(
+    uniques: pd.Series, counts: np.ndarray, shrinkage_threshold: float = 0.7
+) -> int:
+    """
+    Count the values made mostly of numerals from the distinct strings.
+
+    Arguments:
+        uniques {pd.Series} -- Distinct string values.
+        counts {np.ndarray} -- Number of occurrences of each distinct value.
+
+    Keyword Arguments:
+        shrinkage_threshold {float}
+            -- Refer to `heuristics.is_number_as_string`. (default: {0.7})
+
+    Returns:
+        int -- Number of values whose relative length of numerals is above
+               `shrinkage_threshold`.
+    """
+    rel_post_shrinkage_len = _safe_div(
+        uniques.str.count(_DIGIT_PATTERN), uniques.str.len()
+    )
+    return _weighted_sum(rel_post_shrinkage_len > shrinkage_threshold, counts)
+
+
+def is_number_as_string_from_counts(
+    uniques: pd.Series,
+    counts: np.ndarray,
+    n_values: int,
+    shrinkage_threshold: float = 0.7,
+) -> bool:
+    """
+    Check if string can be numerical from the distinct strings of a column.
+
+    Values of the column which are not among `uniques` (e.g. NaNs) are
+    considered to contain no numerals.
+
+    Arguments:
+        uniques {pd.Series} -- Distinct string values of the column.
+        counts {np.ndarray} -- Number of occurrences of each distinct value.
+        n_values {int} -- Total number of values in the column.
+
+    Keyword Arguments:
+        shrinkage_threshold {float}
+            -- Refer to `heuristics.is_number_as_string`. (default: {0.7})
+
+    Returns:
+        bool -- Same as `heuristics.is_number_as_string`.
+    """
+    most_values_contain_numbers = (
+        _safe_div(
+            count_values_containing_numbers(
+                uniques, counts, shrinkage_threshold
+            ),
+            n_values,
+        )
+        >= 0.5
+    )
+
+    at_least_one_value_remaining = bool(len(convert_to_numeric(uniques)))
+
+    return most_values_contain_numbers and at_least_one_value_remaining
+
+
+def numeric_extractable(series: pd.Series, threshold: float = 0.95) -> bool:
+    """
+    Check if numbers can be extracted from series values.
+
+    Vectorized version of `heuristics.numeric_extractable`.
+    """
+    # Columns which are already of numeric dtype are considered not extractable
+    if series.dtype in ["float", "int"]:
+        return False
+
+    series = series.dropna()
+    uniques, counts = _distinct_with_counts(series.astype(str))
+    n_contains_digits = _weighted_sum(
+        uniques.str.contains(_any_digit_pattern()), counts
+    )
+
+    return _safe_div(n_contains_digits, len(series)) >= threshold
+
+
+def _str_lengths(series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the lengths of the `str(x)` values of a series and their counts.
+
+    Values of a non-object dtype share a single type, so equal values always
+    share the same string and the series is reduced to its distinct values
+    before converting. Object columns may hold values which compare equal but
+    print differently (e.g. 1, 1.0 and True) and are measured value by value.
+
+    Arguments:
+        series {pd.Series} -- Series without NaNs.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- (lengths, counts)
+    """
+    if series.dtype == "object":
+        values = series.values
+        if pd.api.types.infer_dtype(values, skipna=False) != "string":
+            values = map(str, values)
+        lengths = np.fromiter(map(len, values), dtype=int, count=len(series))
+        return lengths, np.ones(len(series), dtype=int)
+
+    codes, uniques = pd.factorize(series)
+    counts = np.bincount(codes, minlength=len(uniques))
+    lengths = np.fromiter(
+        map(len, map(str, np.asarray(uniques, dtype="object"))),
+        dtype=int,
+        count=len(uniques),
+    )
+    return lengths, counts
+
+
+def avg_val_len(raw: pd.DataFrame) -> pd.Series:
+    """
+    Get the average length values in the feature column.
+
+    Vectorized version of `heuristics.avg_val_len`.
+    """
+    result = []
+    for col in raw:
+        series = raw[col].dropna()
+
+        if not len(series):
+            result.append(-1)
+            continue
+
+        lengths, counts = _str_lengths(series)
+        result.append(_safe_div(np.dot(lengths, counts), len(series)))
+
+    return pd.Series(result, index=raw.columns)
+
+
+def stddev_val_len(raw: pd.DataFrame) -> pd.Series:
+    """
+    Get the standard deviation of length values in the feature column.
+
+    Vectorized version of `heuristics.stddev_val_len`.
+    """
+    result = []
+    for col in raw:
+        series = raw[col].dropna()
+
+        if not len(series):
+            result.append(-1)
+            continue
+
+        lengths, counts = _str_lengths(series)
+        mean = np.dot(lengths, counts) / len(series)
+        result.append(
+            np.sqrt(np.dot((lengths - mean) ** 2, counts) / len(series))
+        )
+
+    return pd.Series(result, index=raw.columns)
+
+
+def maybe_zipcode(raw: pd.DataFrame, threshold: float = 0.95) -> pd.Series:
+    """
+    Infer if DataFrame might be a zipcode.
+
+    Vectorized version of `heuristics.maybe_zipcode`.
+    """
+    return raw.apply(_maybe_zipcode)
+
+
+def _maybe_zipcode(raw_s: pd.Series, threshold: float = 0.95) -> int:
+    """
+    Infer if series might be a zipcode.
+
+    Vectorized version of `heuristics._maybe_zipcode`.
+    """
+    _raise_if_not_pd_series(raw_s)
+
+    points = 0
+
+    # Criterion 1
+    if "zip" in str(raw_s.name):
+        points += 1
+
+    uniques, counts = _distinct_with_counts(_as_str(raw_s))
+
+    # Criterion 2
+    at_least_5_digits = (uniques.str.len() == 5) & uniques.str.isnumeric()
+    if (
+        _safe_div(_weighted_sum(at_least_5_digits, counts), len(raw_s))
+        >= threshold
+    ):
+        points += 1
+
+    # Criterion 3
+    is_cad_zip = uniques.str.contains(_CAD_ZIPCODE_PATTERN)
+    if _safe_div(_weighted_sum(is_cad_zip, counts), len(raw_s)) >= threshold:
+        points += 1
+
+    return points
+
+
+def contains_structure(
+    raw: pd.DataFrame, threshold: float = 0.05
+) -> pd.Series:
+    """
+    Check if elements of column contain notions of structure.
+
+    Vectorized version of `heuristics.contains_structure`.
+    """
+    result = []
+    for col in raw.columns:
+        series = raw[col].dropna()
+        uniques, counts = _distinct_with_counts(series.astype(str))
+        matches = _weighted_sum(
+            uniques.str.contains(_STRUCTURE_PATTERN), counts
+        )
+        result.append(_safe_div(matches, len(series)) >= threshold)
+    return pd.Series(result, index=raw.columns)
+
+
+def maybe_datetime(df: pd.DataFrame) -> pd.Series:
+    """
+    Check `samples` to see if col may be datetime.
+
+    Vectorized version of `heuristics.maybe_datetime`.
+    """
+    # Pick out sample columns, while ignoring other metafeatures including `samples_set`
+    samples = df[
+        [col for col in df.columns if "sample" in col and "samples" not in col]
+    ]
+    is_datetime_like = pd.DataFrame(
+        {
+            col: _as_str(samples[col]).str.contains(_DATETIME_PATTERN).values
+            for col in samples.columns
+        },
+        index=samples.index,
+    )
+    return is_datetime_like.any(axis=1)
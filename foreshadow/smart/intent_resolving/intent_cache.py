@@ -0,0 +1,247 @@
+"""Persistent cache of resolved intents shared across fits."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from foreshadow.logging import logging
+from foreshadow.utils import (
+    AcceptedKey,
+    ConfigKey,
+    DefaultConfig,
+    get_cache_path,
+)
+
+
+# Bump to invalidate every existing entry when the fingerprint or the entry
+# format changes.
+INTENT_CACHE_VERSION = 2
+INTENT_CACHE_DIR = "intents"
+_ENTRY_SUFFIX = ".json"
+
+
+def column_fingerprint(series, sketch_size=128):
+    """Compute a stable fingerprint of a column for the intent cache.
+
+    The fingerprint combines the column name, its dtype, its length, its
+    number of NaNs, its number of distinct values and a content sketch made
+    of the `sketch_size` smallest hashes of its distinct values, so that a
+    frequent value cannot fill the whole sketch. The sketch does not depend
+    on the order of the rows or on the random sampling used during intent
+    resolution, so the same column gets the same fingerprint on every fit.
+
+    Args:
+        series: the column to fingerprint.
+        sketch_size: the number of value hashes kept in the content sketch.
+
+    Returns:
+        str: the hexadecimal fingerprint.
+
+    """
+    try:
+        hashes = pd.util.hash_pandas_object(series, index=False).values
+    except TypeError:
+        # Unhashable values, e.g. lists left by a cleaner
+        hashes = pd.util.hash_pandas_object(
+            series.astype(str), index=False
+        ).values
+    hashes = np.unique(hashes)
+    n_distinct = len(hashes)
+    # np.unique sorts the hashes, so the smallest ones come first
+    hashes = hashes[:sketch_size]
+
+    header = [
+        INTENT_CACHE_VERSION,
+        str(series.name),
+        str(series.dtype),
+        len(series),
+        int(series.isnull().sum()),
+        n_distinct,
+    ]
+    digest = hashlib.sha256(json.dumps(header).encode("utf-8"))
+    digest.update(hashes.tobytes())
+    return digest.hexdigest()
+
+
+class IntentCache:
+    """On disk cache of the intents resolved for column fingerprints.
+
+    Each entry is stored in its own small file so that concurrent fits can
+    read and write the cache safely. Entries older than `ttl` seconds are
+    ignored. evict removes them and the oldest entries above `max_entries`,
+    and is called once per fit rather than after every write. The cache
+    directory is created with the first entry written.
+
+    Params:
+        cache_dir: the directory of the cache. Defaults to a directory in
+            the foreshadow cache path.
+        ttl: the time to live of an entry in seconds.
+        max_entries: the maximum number of entries kept in the cache.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir=None,
+        ttl=DefaultConfig.INTENT_CACHE_TTL,
+        max_entries=DefaultConfig.INTENT_CACHE_MAX_ENTRIES,
+    ):
+        self.cache_dir = (
+            os.path.join(get_cache_path(), INTENT_CACHE_DIR)
+            if cache_dir is None
+            else cache_dir
+        )
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    @classmethod
+    def from_cache_manager(cls, cache_manager):
+        """Create the intent cache configured in a cache manager.
+
+        Args:
+            cache_manager: the cache manager holding the configuration.
+
+        Returns:
+            IntentCache: the intent cache, or None if it is not enabled.
+
+        """
+        config = cache_manager[AcceptedKey.CONFIG]
+        if not config[ConfigKey.ENABLE_INTENT_CACHE]:
+            return None
+        return cls(
+            ttl=config[ConfigKey.INTENT_CACHE_TTL],
+            max_entries=config[ConfigKey.INTENT_CACHE_MAX_ENTRIES],
+        )
+
+    def get(self, fingerprint):
+        """Get the cached intent of a column fingerprint.
+
+        Args:
+            fingerprint: the fingerprint of the column.
+
+        Returns:
+            str: the intent class name, or None if it is not cached or has
+                expired.
+
+        """
+        path = self._entry_path(fingerprint)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                self._remove(path)
+                return None
+            with open(path, "r") as fopen:
+                return json.load(fopen)["intent"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logging.debug(
+                "Ignoring unreadable intent cache entry {}: {}".format(path, e)
+            )
+            return None
+
+    def put(self, fingerprint, intent):
+        """Cache the intent of a column fingerprint.
+
+        Args:
+            fingerprint: the fingerprint of the column.
+            intent: the intent class name.
+
+        """
+        self.update({fingerprint: intent})
+
+    def update(self, intents):
+        """Cache the intents of several column fingerprints.
+
+        Args:
+            intents: a dict of intent class names keyed by fingerprint.
+
+        """
+        for fingerprint, intent in intents.items():
+            self._write(fingerprint, intent)
+
+    def evict(self):
+        """Remove the expired entries and the oldest entries above the limit.
+
+        Returns:
+            int: the number of removed entries.
+
+        """
+        now = time.time()
+        entries = []
+        for entry in self._scan():
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                continue
+
+        # Newest first, so the expired entries are at the end
+        entries.sort(reverse=True)
+        expired = [path for mtime, path in entries if now - mtime > self.ttl]
+        n_fresh = len(entries) - len(expired)
+        max_entries = self.max_entries
+        overflow = [path for _, path in entries[max_entries:n_fresh]]
+        for path in expired + overflow:
+            self._remove(path)
+        return len(expired) + len(overflow)
+
+    def clear(self):
+        """Remove every entry of the cache."""
+        for entry in self._scan():
+            self._remove(entry.path)
+
+    def __len__(self):
+        """Get the number of entries in the cache.
+
+        Returns:
+            int: the number of entries, including the expired ones.
+
+        """
+        return len(self._scan())
+
+    def _scan(self):
+        try:
+            return [
+                entry
+                for entry in os.scandir(self.cache_dir)
+                if entry.name.endswith(_ENTRY_SUFFIX)
+            ]
+        except FileNotFoundError:  # nothing was written yet
+            return []
+
+    def _entry_path(self, fingerprint):
+        return os.path.join(self.cache_dir, fingerprint + _ENTRY_SUFFIX)
+
+    def _write(self, fingerprint, intent):
+        # Write to a temporary file first so that readers never see a
+        # partially written entry.
+        try:
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.cache_dir, suffix=".tmp"
+                )
+            except FileNotFoundError:  # the first entry written
+                os.makedirs(self.cache_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.cache_dir, suffix=".tmp"
+                )
+            with os.fdopen(fd, "w") as fopen:
+                json.dump({"intent": intent}, fopen)
+            os.replace(tmp_path, self._entry_path(fingerprint))
+        except OSError as e:
+            logging.warning(
+                "Unable to write the intent cache entry {}: {}".format(
+                    fingerprint, e
+                )
+            )
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
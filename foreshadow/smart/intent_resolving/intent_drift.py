@@ -0,0 +1,83 @@
+"""Cheap column signatures to detect when a resolved intent may be stale."""
+
+
+def column_signature(series):
+    """Compute a cheap statistical signature of a column.
+
+    The signature holds the statistics the intent of a column mostly
+    depends on: its dtype, its rate of NaNs and its rate of distinct
+    values. It is computed in a single pass over the column and is small
+    enough to be kept in the CacheManager.
+
+    Args:
+        series: the column to summarize.
+
+    Returns:
+        dict: the signature of the column.
+
+    """
+    n_values = len(series)
+    n_nans = int(series.isnull().sum())
+    try:
+        n_distincts = series.nunique()
+    except TypeError:
+        # Unhashable values, e.g. lists left by a cleaner
+        n_distincts = series.astype(str).nunique()
+    return {
+        "dtype": str(series.dtype),
+        "nan_rate": n_nans / n_values if n_values else 0.0,
+        "distinct_rate": (
+            n_distincts / (n_values - n_nans) if n_values > n_nans else 0.0
+        ),
+    }
+
+
+def has_drifted(previous, current, tolerance):
+    """Check whether a column drifted enough to resolve its intent again.
+
+    Args:
+        previous: the signature of the column when its intent was resolved,
+            or None if it was not recorded.
+        current: the current signature of the column.
+        tolerance: the maximum absolute change of the NaN rate and of the
+            distinct rate of a column that did not drift.
+
+    Returns:
+        bool: whether the column drifted.
+
+    """
+    if previous is None or previous["dtype"] != current["dtype"]:
+        return True
+    return any(
+        abs(previous[key] - current[key]) > tolerance
+        for key in ("nan_rate", "distinct_rate")
+    )
+
+
+def find_drifted_columns(X, signatures, tolerance):
+    """Split the columns of a data frame by how they changed since a fit.
+
+    Args:
+        X: the data frame to be processed.
+        signatures: the signatures recorded during the previous fit, keyed
+            by column name.
+        tolerance: see `has_drifted`.
+
+    Returns:
+        tuple: the lists of unchanged, drifted and new columns, and the
+            current signature of each column.
+
+    """
+    unchanged, drifted, new = [], [], []
+    current_signatures = {}
+    for column in X.columns:
+        current = column_signature(X[column])
+        current_signatures[column] = current
+        previous = signatures.get(column)
+        if previous is None:
+            new.append(column)
+        elif has_drifted(previous, current, tolerance):
+            drifted.append(column)
+        else:
+            unchanged.append(column)
+    return unchanged, drifted, new, current_signatures
@@ -1,9 +1,16 @@
 """SmartResolver for ResolverMapper step."""
 
+import pandas as pd
+
 from foreshadow.intents import Categorical, Droppable, Numeric, Text
 from foreshadow.logging import logging
 from foreshadow.smart.intent_resolving.core import (
     IntentResolver as AutoIntentResolver,
+    heuristics,
+)
+from foreshadow.smart.intent_resolving.intent_cache import (
+    IntentCache,
+    column_fingerprint,
 )
 from foreshadow.smart.smart import SmartTransformer
 from foreshadow.utils import (
@@ -31,20 +38,137 @@ def _temporary_naming_convert(auto_ml_intent_name):
         )
 
 
+# Minimum confidence for a rule to settle the intent of a column without
+# calling the intent model.
+RULE_CONFIDENCE_THRESHOLD = 0.9
+# Number of values from which a float column with only distinct values is
+# considered numeric with full confidence.
+_MIN_VALUES_FOR_FULL_CONFIDENCE = 100
+
+
+class IntentTier:
+    """Ways the intent of a column can be resolved."""
+
+    OVERRIDE = "override"
+    RULE = "rule"
+    CACHE = "cache"
+    MODEL = "model"
+    UNCHANGED = "unchanged"
+
+
+def resolve_intents_by_rules(X, threshold=RULE_CONFIDENCE_THRESHOLD):
+    """Resolve the intents of the unambiguous columns with cheap rules.
+
+    The rules only look at the dtypes and at the distinct rate of the
+    columns:
+
+    - columns with only NaNs are Droppable;
+    - bool columns are Categorical;
+    - datetime and timedelta columns are Text;
+    - float columns with decimals and mostly distinct values are Numeric.
+
+    Args:
+        X: the data frame to be processed.
+        threshold: the minimum confidence for a rule to settle a column.
+
+    Returns:
+        dict: the (intent class name, confidence) of each settled column,
+            keyed by column name.
+
+    """
+    is_null = X.isnull().all(axis=0).values
+    is_bool = heuristics.is_bool_dtype(X).values
+    is_datetime = (
+        heuristics.is_datetime_dtype(X).values
+        | heuristics.is_timedelta_dtype(X).values
+    )
+    is_float = heuristics.is_float_dtype(X).values
+    has_leading_zeros = heuristics.has_zero_in_leading_decimals(X).values
+    is_real = is_float & ~has_leading_zeros.astype(bool)
+
+    resolved = {}
+    for i, column in enumerate(X.columns):
+        if is_null[i]:
+            intent, confidence = Droppable.__name__, 1.0
+        elif is_bool[i]:
+            intent, confidence = Categorical.__name__, 0.95
+        elif is_datetime[i]:
+            intent, confidence = Text.__name__, 0.95
+        elif is_real[i]:
+            series = X.iloc[:, i]
+            n_values = series.count()
+            distinct_rate = heuristics.normalized_distinct_rate(
+                pd.Series(
+                    {
+                        "num_distincts": series.nunique(),
+                        "total_val": len(series),
+                        "num_nans": len(series) - n_values,
+                    }
+                )
+            )
+            intent = Numeric.__name__
+            confidence = distinct_rate * min(
+                1.0, n_values / _MIN_VALUES_FOR_FULL_CONFIDENCE
+            )
+        else:
+            continue
+
+        if confidence >= threshold:
+            resolved[column] = (intent, confidence)
+    return resolved
+
+
+def resolve_intents(X):
+    """Resolve the intents of all the columns in a data frame at once.
+
+    All the columns are featurized together and the intent model is called
+    once, which avoids paying the fixed resolution cost for every column.
+
+    Args:
+        X: the data frame to be processed. None of its columns may contain
+            only NaNs.
+
+    Returns:
+        dict: the intent class name of each column, keyed by column name.
+
+    """
+    auto_intent_resolver = AutoIntentResolver(X)
+    intent_pd_series = auto_intent_resolver.predict()
+    return {
+        column: _temporary_naming_convert(intent)
+        for column, intent in intent_pd_series.items()
+    }
+
+
 class IntentResolver(SmartTransformer, DataSamplingMixin):
     """Determine the intent for a particular column.
 
+    The intent is resolved by the first of these tiers that applies: the
+    user override, the cheap rules of `resolve_intents_by_rules`, the intent
+    cache if enabled, and finally the intent model. The tier used is stored
+    in `resolution_tier`.
+
     Params:
+        column: the column to resolve the intent of.
+        predicted_intent: the intent class name already predicted for the
+            column, e.g. by a batched resolution in the IntentMapper. If
+            set, the intent model is not called for this column.
+        predicted_tier: the IntentTier that produced `predicted_intent`.
         **kwargs: kwargs to pass to individual intent constructors
 
     """
 
     validate_wrapped = False
 
-    def __init__(self, column=None, **kwargs):
+    def __init__(
+        self, column=None, predicted_intent=None, predicted_tier=None, **kwargs
+    ):
         super().__init__(**kwargs)
         self.column = column
+        self.predicted_intent = predicted_intent
+        self.predicted_tier = predicted_tier
         self.column_intent = None
+        self.resolution_tier = None
         # self.cache_manager = cache_manager
 
     def _resolve_intent(self, X, y=None):
@@ -108,7 +232,45 @@ class IntentResolver(SmartTransformer, DataSamplingMixin):
                 override_key
             ]
             intent_class = get_transformer(intent_override)
+            self.resolution_tier = IntentTier.OVERRIDE
+        elif self.predicted_intent is not None:
+            intent_class = get_transformer(self.predicted_intent)
+            self.resolution_tier = (
+                IntentTier.MODEL
+                if self.predicted_tier is None
+                else self.predicted_tier
+            )
         else:
-            intent_class = get_transformer(self._resolve_intent(X, y=y))
+            intent, self.resolution_tier = self._tiered_resolve_intent(X, y=y)
+            intent_class = get_transformer(intent)
 
         return intent_class()
+
+    def _tiered_resolve_intent(self, X, y=None):
+        """Resolve the intent with the cheapest tier that applies.
+
+        Args:
+            X: the data frame to be processed.
+            y: None
+
+        Returns:
+            tuple: the intent class name that best matches the input data
+                and the IntentTier that resolved it.
+
+        """
+        resolved_by_rules = resolve_intents_by_rules(X)
+        if X.columns[0] in resolved_by_rules:
+            return resolved_by_rules[X.columns[0]][0], IntentTier.RULE
+
+        intent_cache = IntentCache.from_cache_manager(self.cache_manager)
+        if intent_cache is None:
+            return self._resolve_intent(X, y=y), IntentTier.MODEL
+
+        fingerprint = column_fingerprint(X.iloc[:, 0])
+        intent = intent_cache.get(fingerprint)
+        if intent is not None:
+            return intent, IntentTier.CACHE
+
+        intent = self._resolve_intent(X, y=y)
+        intent_cache.put(fingerprint, intent)
+        return intent, IntentTier.MODEL
@@ -7,12 +7,15 @@ from sklearn.pipeline import Pipeline
 from foreshadow.base import BaseEstimator, TransformerMixin
 from foreshadow.logging import logging
 from foreshadow.utils import (
+    AcceptedKey,
+    ConfigKey,
     UserOverrideMixin,
     check_df,
     get_transformer,
     is_transformer,
     is_wrapped,
 )
+from foreshadow.wrapper import keep_sparse_outputs
 
 
 class SmartTransformer(
@@ -180,6 +183,13 @@ class SmartTransformer(
             if getattr(self.transformer, "name", None) is None:
                 self.transformer.name = self.name
             self.transformer.keep_columns = self.keep_columns
+            if (
+                self.cache_manager is not None
+                and self.cache_manager[AcceptedKey.CONFIG][
+                    ConfigKey.ENABLE_SPARSE_OUTPUT
+                ]
+            ):
+                keep_sparse_outputs(self.transformer)
 
         # reset should_resolve
         self.should_resolve = False
@@ -21,8 +21,8 @@ class CleanerMapper(PreparerStep):
         self._empty_columns = None
         super().__init__(**kwargs)
 
-    def fit(self, X, *args, **kwargs):
-        """Fit this step.
+    def fit_transform(self, X, *args, **kwargs):
+        """Fit this step and clean the dataframe.
 
         calls underlying parallel process.
 
@@ -32,16 +32,23 @@ class CleanerMapper(PreparerStep):
             **kwargs: kwargs to _fit
 
         Returns:
-            transformed data handled by Pipeline._fit
+            A transformed dataframe.
 
         """
         list_of_tuples = self._construct_column_transformer_tuples(X=X)
         self._prepare_feature_processor(list_of_tuples=list_of_tuples)
-        self.feature_processor.fit(X=X)
+        Xt = self._fit_feature_processor(X)
         self._empty_columns = self._check_empty_columns(
             original_columns=X.columns
         )
-        return self
+        # The columns to drop are not cleaned on transform.
+        self.feature_processor.transformers_ = [
+            (name, "drop", column)
+            if column in self._empty_columns
+            else (name, cleaner, column)
+            for name, cleaner, column in self.feature_processor.transformers_
+        ]
+        return Xt.drop(columns=self._empty_columns, errors="ignore")
 
     def transform(self, X, *args, **kwargs):
         """Clean the dataframe.
@@ -62,7 +69,9 @@ class CleanerMapper(PreparerStep):
             raise ValueError("Cleaner has not been fitted yet.")
 
         Xt = self.feature_processor.transform(X=X)
-        return Xt.drop(columns=self._empty_columns)
+        # Steps fitted before the columns to drop were skipped still clean
+        # and return them.
+        return Xt.drop(columns=self._empty_columns, errors="ignore")
 
     def _construct_column_transformer_tuples(self, X):
         columns = X.columns
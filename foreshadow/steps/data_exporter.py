@@ -1,4 +1,7 @@
 """PrepareStep that exports the processed data before sending to Estimator."""
+import pandas as pd
+from scipy import sparse
+
 from foreshadow.logging import logging
 from foreshadow.utils import AcceptedKey, ConfigKey, DefaultConfig
 
@@ -74,6 +77,8 @@ class DataExporterMapper(PreparerStep):
 
     def _export_data(self, X, is_train=True):
         data_path = self._determine_export_path(is_train)
+        if sparse.issparse(X):  # the sparse output of the Preprocessor
+            X = pd.DataFrame.sparse.from_spmatrix(X)
         X.to_csv(data_path, index=False)
         logging.info("Exported processed data to {}".format(data_path))
 
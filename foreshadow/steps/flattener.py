@@ -18,8 +18,8 @@ class FlattenMapper(PreparerStep):
         self._empty_columns = None
         super().__init__(**kwargs)
 
-    def fit(self, X, *args, **kwargs):
-        """Fit the flatten step.
+    def fit_transform(self, X, *args, **kwargs):
+        """Fit the flatten step and flatten the dataframe.
 
         Calls underlying feature processor. It will flatten columns with
         JSON like data but will not touch other columns.
@@ -30,13 +30,12 @@ class FlattenMapper(PreparerStep):
             **kwargs: kwargs to _fit
 
         Returns:
-            transformed data handled by Pipeline._fit
+            the flattened dataframe.
 
         """
         list_of_tuples = self._construct_column_transformer_tuples(X=X)
         self._prepare_feature_processor(list_of_tuples=list_of_tuples)
-        self.feature_processor.fit(X=X)
-        return self
+        return self._fit_feature_processor(X)
 
     def _construct_column_transformer_tuples(self, X):
         columns = X.columns
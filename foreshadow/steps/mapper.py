@@ -1,25 +1,58 @@
 """Resolver module that computes the intents for input data."""
 
-from foreshadow.smart.intent_resolving import IntentResolver
-from foreshadow.utils import AcceptedKey
+from collections import Counter
+
+from foreshadow.logging import logging
+from foreshadow.smart.intent_resolving import (
+    IntentCache,
+    IntentResolver,
+    IntentTier,
+    column_fingerprint,
+    find_drifted_columns,
+    resolve_intents,
+    resolve_intents_by_rules,
+)
+from foreshadow.utils import (
+    AcceptedKey,
+    ConfigKey,
+    DataSamplingMixin,
+    Override,
+)
 
 from .preparerstep import PreparerStep
 
 
-class IntentMapper(PreparerStep):
+class IntentMapper(PreparerStep, DataSamplingMixin):
     """Apply intent resolution to each column.
 
     Params:
+        batch_resolve: whether to resolve the intents of all the columns
+            with a single call to the intent model before fitting the per
+            column IntentResolvers. Columns with a user override and columns
+            that cannot be resolved in a batch are still resolved one by
+            one.
         *args: args to PreparerStep constructor.
         **kwargs: kwargs to PreparerStep constructor.
 
+    When incremental intent resolution is enabled in the cache manager, a
+    refit keeps the intents resolved by the previous fit for the columns
+    whose signature did not drift and only resolves the new and drifted
+    columns.
+
+    Attributes:
+        tier_counts_: the number of columns resolved by each IntentTier
+            during the last fit.
+        reresolved_columns_: the columns whose intent was resolved during
+            the last fit, as opposed to kept from the previous fit.
+
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, batch_resolve=True, **kwargs):
+        self.batch_resolve = batch_resolve
         super().__init__(**kwargs)
 
-    def fit(self, X, *args, **kwargs):
-        """Fit this step.
+    def fit_transform(self, X, *args, **kwargs):
+        """Fit this step and transform the dataframe.
 
         calls underlying parallel process.
 
@@ -29,34 +62,195 @@ class IntentMapper(PreparerStep):
             **kwargs: kwargs to _fit
 
         Returns:
-            transformed data handled by Pipeline._fit
+            A transformed dataframe.
 
         """
-        list_of_tuples = self._construct_column_transformer_tuples(X=X)
+        predicted_intents = self._keep_unchanged_intents(X)
+        if self.batch_resolve:
+            predicted_intents.update(
+                self._batch_resolve_intents(X, exclude=predicted_intents)
+            )
+        list_of_tuples = self._construct_column_transformer_tuples(
+            X=X, predicted_intents=predicted_intents
+        )
         self._prepare_feature_processor(list_of_tuples=list_of_tuples)
-        self.feature_processor.fit(X=X)
+        Xt = self._fit_feature_processor(X)
         self._update_cache_manager_with_intents()
+        intent_cache = IntentCache.from_cache_manager(self.cache_manager)
+        if intent_cache is not None:  # once per fit, not on every write
+            intent_cache.evict()
 
-        return self
+        return Xt
 
     def _update_cache_manager_with_intents(self):
+        self.tier_counts_ = Counter()
         for intent_resolver_tuple in self.feature_processor.transformers_:
             intent_resolver = intent_resolver_tuple[1]
             column_name = intent_resolver_tuple[2]
             self.cache_manager[AcceptedKey.INTENT][
                 column_name
             ] = intent_resolver.column_intent
+            self.tier_counts_[intent_resolver.resolution_tier] += 1
+        # The signatures of the kept intents are not updated, so that slow
+        # drifts over several fits are still detected.
+        for column in self.reresolved_columns_:
+            if column in self._signatures:
+                self.cache_manager[AcceptedKey.METASTAT][
+                    column
+                ] = self._signatures[column]
+        logging.info(
+            "Number of columns resolved by each intent tier: {}".format(
+                ", ".join(
+                    "{}={}".format(tier, count)
+                    for tier, count in sorted(self.tier_counts_.items())
+                )
+            )
+        )
+
+    def _incremental_resolution_enabled(self):
+        return self.cache_manager[AcceptedKey.CONFIG][
+            ConfigKey.ENABLE_INCREMENTAL_INTENT_RESOLUTION
+        ]
+
+    def _keep_unchanged_intents(self, X):
+        """Keep the intents of the columns unchanged since the last fit.
+
+        The signature of each column is compared with the one recorded in
+        the cache manager when its intent was resolved. Columns with a user
+        override are always resolved again so that the override applies.
 
-    def _construct_column_transformer_tuples(self, X):
-        columns = X.columns
-        list_of_tuples = [
-            (
-                column + "_" + IntentMapper.__class__.__name__,
-                IntentResolver(
-                    column=column, cache_manager=self.cache_manager
-                ),
-                column,
+        Args:
+            X: input DataFrame
+
+        Returns:
+            dict: the (intent, IntentTier) of each unchanged column.
+
+        """
+        self._signatures = {}
+        self.reresolved_columns_ = list(X.columns)
+        if not self._incremental_resolution_enabled():
+            return {}
+
+        unchanged, drifted, new, self._signatures = find_drifted_columns(
+            X,
+            self.cache_manager[AcceptedKey.METASTAT],
+            self.cache_manager[AcceptedKey.CONFIG][
+                ConfigKey.INTENT_DRIFT_TOLERANCE
+            ],
+        )
+        intents = self.cache_manager[AcceptedKey.INTENT]
+        kept = {
+            column: (intents[column], IntentTier.UNCHANGED)
+            for column in unchanged
+            if intents.get(column) is not None
+            and "_".join([Override.INTENT, column])
+            not in self.cache_manager[AcceptedKey.OVERRIDE]
+        }
+        self.reresolved_columns_ = [
+            column for column in X.columns if column not in kept
+        ]
+        logging.info(
+            "Kept the intents of {} unchanged columns. Resolving the intents "
+            "of new columns {} and drifted columns {}.".format(
+                len(kept), new, drifted
             )
-            for column in columns
+        )
+        return kept
+
+    def _batch_resolve_intents(self, X, exclude=()):
+        """Resolve the intents of the columns without an override at once.
+
+        The unambiguous columns are settled by cheap rules first. If the
+        intent cache is enabled, the columns whose intent is cached are not
+        resolved again and the new intents are added to the cache. The
+        remaining columns go through the intent model together.
+
+        Args:
+            X: input DataFrame
+            exclude: the columns that should not be resolved.
+
+        Returns:
+            dict: the (intent, IntentTier) of each batch resolved column.
+
+        """
+        columns = [
+            column
+            for column in X.columns
+            if column not in exclude
+            and "_".join([Override.INTENT, column])
+            not in self.cache_manager[AcceptedKey.OVERRIDE]
         ]
+        if len(columns) == 0 or len(X) == 0:
+            return {}
+
+        resolved = {
+            column: (intent, IntentTier.RULE)
+            for column, (intent, _) in resolve_intents_by_rules(
+                X[columns]
+            ).items()
+        }
+        columns = [column for column in columns if column not in resolved]
+
+        intent_cache = IntentCache.from_cache_manager(self.cache_manager)
+        if intent_cache is not None:
+            fingerprints = {
+                column: column_fingerprint(X[column]) for column in columns
+            }
+            for column in columns:
+                intent = intent_cache.get(fingerprints[column])
+                if intent is not None:
+                    resolved[column] = (intent, IntentTier.CACHE)
+            columns = [column for column in columns if column not in resolved]
+        if len(columns) == 0:
+            return resolved
+
+        X_sampled = self.sample_data_frame(df=X[columns])
+        # The intent model rejects columns with only NaNs. Leave them to
+        # their own IntentResolver so the behavior is unchanged.
+        null_columns = X_sampled.isnull().all(axis=0)
+        X_sampled = X_sampled.loc[:, ~null_columns.values]
+        if X_sampled.shape[1] == 0:
+            return resolved
+
+        # The intent resolver casts some columns in place.
+        predicted_intents = resolve_intents(X_sampled.copy())
+        logging.info(
+            "Resolved the intents of {} columns in a single batch.".format(
+                len(predicted_intents)
+            )
+        )
+        if intent_cache is not None:
+            intent_cache.update(
+                {
+                    fingerprints[column]: intent
+                    for column, intent in predicted_intents.items()
+                }
+            )
+        resolved.update(
+            (column, (intent, IntentTier.MODEL))
+            for column, intent in predicted_intents.items()
+        )
+        return resolved
+
+    def _construct_column_transformer_tuples(self, X, predicted_intents=None):
+        predicted_intents = (
+            {} if predicted_intents is None else predicted_intents
+        )
+        list_of_tuples = []
+        for column in X.columns:
+            predicted_intent, predicted_tier = predicted_intents.get(
+                column, (None, None)
+            )
+            list_of_tuples.append(
+                (
+                    column + "_" + IntentMapper.__class__.__name__,
+                    IntentResolver(
+                        column=column,
+                        predicted_intent=predicted_intent,
+                        predicted_tier=predicted_tier,
+                        cache_manager=self.cache_manager,
+                    ),
+                    column,
+                )
+            )
         return list_of_tuples
@@ -1,10 +1,24 @@
 """General base classes used across Foreshadow."""
+import copy
+from collections import defaultdict
 from typing import List, Tuple, Union
 
-from sklearn.pipeline import Pipeline
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator as SklearnBaseEstimator
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.preprocessing import (
+    MaxAbsScaler,
+    MinMaxScaler,
+    PowerTransformer,
+    RobustScaler,
+    StandardScaler,
+)
 
 from foreshadow.base import BaseEstimator, TransformerMixin
 from foreshadow.ColumnTransformerWrapper import ColumnTransformerWrapper
+from foreshadow.concrete import NoTransform
 from foreshadow.smart import SmartTransformer
 from foreshadow.utils import AcceptedKey, ConfigKey
 from foreshadow.utils.common import ConfigureCacheManagerMixin
@@ -12,6 +26,208 @@ from foreshadow.utils.common import ConfigureCacheManagerMixin
 from ..cachemanager import CacheManager
 
 
+# Estimators that transform each column on its own and whose fitted arrays
+# hold one value per column, so that the ones fitted on single columns can
+# be merged into one estimator on all of these columns.
+_COLUMN_WISE_ESTIMATORS = (
+    MaxAbsScaler,
+    MinMaxScaler,
+    PowerTransformer,
+    RobustScaler,
+    SimpleImputer,
+    StandardScaler,
+)
+
+
+def _find_cache_manager_holders(obj, holders, seen):
+    """Find the estimators holding a CacheManager, depth first.
+
+    Args:
+        obj: an estimator, or a list or tuple of estimators.
+        holders: the list the holders are appended to.
+        seen: the ids of the objects already visited.
+
+    """
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+    if isinstance(obj, (list, tuple)):
+        children = obj
+    elif isinstance(obj, SklearnBaseEstimator):
+        if isinstance(getattr(obj, "cache_manager", None), CacheManager):
+            holders.append(obj)
+        children = vars(obj).values()
+    else:
+        return
+    for child in children:
+        _find_cache_manager_holders(child, holders, seen)
+
+
+def _column_wise_steps(transformer):
+    """List the column wise estimators a fitted transformer applies.
+
+    Args:
+        transformer: a fitted transformer, or a string of ColumnTransformer.
+
+    Returns:
+        list: the estimators applied in turn to the column, which is empty
+            for NoTransform, "passthrough", and SmartTransformers and
+            Pipelines that only pass their input through, or None if the
+            transformer is not made of column wise estimators.
+
+    """
+    if isinstance(transformer, str) or transformer is None:
+        return [] if transformer in ("passthrough", None) else None
+    if getattr(transformer, "keep_columns", False):
+        return None
+    if isinstance(transformer, SmartTransformer):
+        return _column_wise_steps(transformer.transformer)
+    if isinstance(transformer, Pipeline):
+        steps = []
+        for _, step in transformer.steps:
+            step_steps = _column_wise_steps(step)
+            if step_steps is None:
+                return None
+            steps.extend(step_steps)
+        return steps
+    if isinstance(transformer, NoTransform):
+        return []
+    if not isinstance(transformer, _COLUMN_WISE_ESTIMATORS):
+        return None
+    if isinstance(transformer, SimpleImputer) and (
+        transformer.add_indicator or pd.isnull(transformer.statistics_).any()
+    ):
+        # The indicator adds columns and the columns without a statistic
+        # are dropped.
+        return None
+    return [transformer]
+
+
+def _same_value(a, b):
+    """Check if two attributes of fitted estimators are equal.
+
+    Args:
+        a: an attribute value.
+        b: another attribute value.
+
+    Returns:
+        bool: True if the values are equal.
+
+    """
+    if a is b:
+        return True
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return (
+            isinstance(a, np.ndarray)
+            and isinstance(b, np.ndarray)
+            and a.dtype == b.dtype
+            and np.array_equal(a, b)
+        )
+    try:
+        return type(a) is type(b) and bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+def _merge_column_estimators(estimators):
+    """Merge the estimators fitted on single columns into one.
+
+    The arrays with one value per column are concatenated if they have the
+    same dtype, the nested estimators are merged the same way and the other
+    attributes must be equal.
+
+    Args:
+        estimators: fitted estimators of the same class and params, one
+            per column.
+
+    Returns:
+        the estimator of all the columns, or None if they cannot be merged.
+
+    """
+    first = estimators[0]
+    if any(type(estimator) is not type(first) for estimator in estimators):
+        return None
+    merged = copy.copy(first)
+    for name, value in vars(first).items():
+        values = [vars(estimator).get(name) for estimator in estimators]
+        if isinstance(value, SklearnBaseEstimator):
+            value = _merge_column_estimators(values)
+            if value is None:
+                return None
+        elif isinstance(value, np.ndarray) and value.shape == (1,):
+            if not all(
+                isinstance(other, np.ndarray)
+                and other.shape == (1,)
+                and other.dtype == value.dtype
+                for other in values
+            ):
+                return None
+            value = np.concatenate(values)
+        elif not all(_same_value(value, other) for other in values[1:]):
+            return None
+        setattr(merged, name, value)
+    return merged
+
+
+def _group_key(steps):
+    """Identify the transformation made by column wise estimators.
+
+    Args:
+        steps: the column wise estimators applied in turn to a column.
+
+    Returns:
+        tuple: the class and params of each estimator.
+
+    """
+    return tuple(
+        (type(step), repr(sorted(step.get_params(deep=False).items())))
+        for step in steps
+    )
+
+
+def _group_columns(transformers):
+    """Group the columns transformed the same way.
+
+    The columns whose fitted transformers apply column wise estimators of
+    the same classes with the same params, such as a StandardScaler, are
+    grouped, and the estimators of each group are merged into a single
+    estimator on all its columns. The columns passed through unchanged are
+    grouped together.
+
+    Args:
+        transformers: the fitted transformers_ of a ColumnTransformer.
+
+    Returns:
+        list: the (names, transformer) of each group of several columns,
+            where transformer is "passthrough" or the merged estimators.
+
+    """
+    groups = defaultdict(list)
+    for name, trans, column in transformers:
+        steps = _column_wise_steps(trans) if np.isscalar(column) else None
+        if steps is not None:
+            groups[_group_key(steps)].append((name, steps))
+
+    column_groups = []
+    for key, members in groups.items():
+        names = [name for name, _ in members]
+        if len(names) < 2:
+            continue
+        if not key:
+            column_groups.append((names, "passthrough"))
+            continue
+        merged = [
+            _merge_column_estimators([steps[i] for _, steps in members])
+            for i in range(len(key))
+        ]
+        if any(step is None for step in merged):
+            continue
+        column_groups.append(
+            (names, merged[0] if len(merged) == 1 else make_pipeline(*merged))
+        )
+    return column_groups
+
+
 class PreparerStep(
     BaseEstimator, TransformerMixin, ConfigureCacheManagerMixin
 ):
@@ -75,7 +291,9 @@ class PreparerStep(
     def fit(self, X, *args, **kwargs):
         """Fit this step.
 
-        calls underlying parallel process.
+        calls underlying parallel process. Subclasses implement fit_transform,
+        which fits the step and gives the transformed X in the same pass, so
+        that a Pipeline does not transform the training data a second time.
 
         Args:
             X: input DataFrame
@@ -162,6 +380,55 @@ class PreparerStep(
             params += ["_parallel_process"]
         return params
 
+    def _fit_feature_processor(self, X):
+        """Fit the feature processor and merge the cache writes it made.
+
+        The feature processor is fitted with fit_transform, which already
+        transforms X while fitting, and its output is returned.
+
+        The transformers are fitted on copies of the cache manager, either
+        cloned or sent to other processes when n_jobs is not 1. The writes
+        made on each copy are merged in the order of the transformers, so
+        that a parallel fit leaves the cache manager in the same state as
+        a serial fit. The fitted transformers then share the cache manager
+        of this step again.
+
+        The columns whose fitted transformers apply the same transformation,
+        such as the columns that need no cleaning or the columns scaled by a
+        StandardScaler, are then transformed as blocks.
+
+        Args:
+            X: input DataFrame
+
+        Returns:
+            the output of the fitted feature processor on X.
+
+        """
+        self.cache_manager.start_journal()
+        try:
+            Xt = self.feature_processor.fit_transform(X=X)
+        finally:
+            self.cache_manager.stop_journal()
+
+        holders = []
+        _find_cache_manager_holders(
+            [trans for _, trans, _ in self.feature_processor.transformers_],
+            holders,
+            seen=set(),
+        )
+        merged = {id(self.cache_manager)}
+        for holder in holders:
+            cache_manager = holder.cache_manager
+            if id(cache_manager) not in merged:
+                merged.add(id(cache_manager))
+                self.cache_manager.merge_journal(cache_manager.stop_journal())
+            holder.cache_manager = self.cache_manager
+
+        self.feature_processor.group_columns(
+            _group_columns(self.feature_processor.transformers_)
+        )
+        return Xt
+
     def _prepare_feature_processor(
         self,
         list_of_tuples: List[
@@ -33,8 +33,8 @@ class Preprocessor(PreparerStep, AutoIntentMixin):
         super().__init__(**kwargs)
         self.pipeline_by_intent = self._load_transformation_pipelines()
 
-    def fit(self, X, *args, **kwargs):
-        """Fit this step.
+    def fit_transform(self, X, *args, **kwargs):
+        """Fit this step and preprocess the dataframe.
 
         calls underlying parallel process.
 
@@ -44,14 +44,13 @@ class Preprocessor(PreparerStep, AutoIntentMixin):
             **kwargs: kwargs to _fit
 
         Returns:
-            transformed data handled by Pipeline._fit
+            A transformed dataframe.
 
         """
         self.check_resolve(X)
         list_of_tuples = self._construct_column_transformer_tuples(X=X)
         self._prepare_feature_processor(list_of_tuples=list_of_tuples)
-        self.feature_processor.fit(X=X)
-        return self
+        return self._fit_feature_processor(X)
 
     def transform(self, X, *args, **kwargs):
         """Clean the dataframe.
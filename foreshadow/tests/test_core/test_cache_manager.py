@@ -294,3 +294,29 @@ def test_cache_manager_has_or_has_no_override():
 
     cs2 = CacheManager()
     assert not cs2.has_override()
+
+
+def test_cache_manager_merge_journal():
+    """Test that the writes made on a copy are merged back in order."""
+    import copy
+
+    from foreshadow.cachemanager import CacheManager
+
+    cs = CacheManager()
+    cs["domain", "col1"] = "kept"
+    cs["domain", "col2"] = "removed"
+    cs.start_journal()
+    cs_copy = copy.deepcopy(cs)
+    cs.stop_journal()
+
+    cs_copy["domain", "col1"] = "first"
+    cs_copy["domain"]["col1"] = "second"
+    del cs_copy["domain"]["col2"]
+    cs_copy["graph", "col1"] = ["col1"]
+    assert "col2" not in cs_copy["domain"]
+    cs.merge_journal(cs_copy.stop_journal())
+
+    assert dict(cs["domain"]) == {"col1": "second"}
+    assert dict(cs["graph"]) == {"col1": ["col1"]}
+    assert cs_copy.stop_journal() == []
+    assert isinstance(cs["domain"], dict)
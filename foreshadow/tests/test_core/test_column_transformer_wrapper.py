@@ -0,0 +1,96 @@
+"""Test ColumnTransformerWrapper.py."""
+import pytest
+
+
+def _make_wrapper():
+    from foreshadow.ColumnTransformerWrapper import ColumnTransformerWrapper
+
+    wrapper = ColumnTransformerWrapper([])
+    wrapper.sparse_output_ = False
+    return wrapper
+
+
+@pytest.mark.parametrize("dtype", ["float64", "object", "datetime64[ns]"])
+def test_hstack_dataframes(dtype):
+    import pandas as pd
+
+    frame = pd.DataFrame(
+        {"a": [1.0, 2.0], "b": [3.0, 4.0], "c": [5, 6]}, index=[3, 4]
+    )
+    frame["c"] = frame["c"].astype(dtype)
+    Xs = [frame[["a"]], frame[["b", "c"]], frame[["a"]]]
+    expected = pd.concat(Xs, axis=1)
+
+    stacked = _make_wrapper()._hstack(list(Xs))
+
+    assert stacked.equals(expected)
+    assert list(stacked.columns) == ["a", "b", "c", "a"]
+    assert (stacked.dtypes == expected.dtypes).all()
+    assert stacked._data.nblocks == len(set(frame.dtypes))
+
+
+@pytest.mark.parametrize("kind", ["category", "index", "internals"])
+def test_hstack_dataframes_falls_back_to_concat(mocker, kind):
+    import pandas as pd
+
+    frame = pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]})
+    Xs = [frame[["a"]], frame[["b"]]]
+    if kind == "category":
+        Xs[1] = Xs[1].astype("category")
+    elif kind == "index":
+        Xs[1] = Xs[1].set_index(pd.Index([1, 2]))
+    else:
+        # A pandas version without the blocks read by _assemble_frames
+        frame_blocks = mocker.patch(
+            "foreshadow.ColumnTransformerWrapper._frame_blocks",
+            side_effect=AttributeError,
+        )
+    expected = pd.concat(Xs, axis=1)
+
+    stacked = _make_wrapper()._hstack(list(Xs))
+
+    assert stacked.equals(expected)
+    if kind == "internals":
+        assert frame_blocks.call_count == 1
+
+
+def test_hstack_arrays():
+    import numpy as np
+    import pandas as pd
+    from scipy import sparse
+
+    Xs = [
+        np.array([[1.0], [2.0]]),
+        pd.DataFrame({"a": [3.0, 4.0]}),
+        sparse.csr_matrix([[5.0], [6.0]]),
+    ]
+
+    stacked = _make_wrapper()._hstack(Xs)
+
+    assert isinstance(stacked, np.ndarray)
+    np.testing.assert_array_equal(stacked, [[1.0, 3.0, 5.0], [2.0, 4.0, 6.0]])
+
+
+@pytest.mark.parametrize("numeric", [True, False])
+def test_hstack_sparse_frames(numeric):
+    import pandas as pd
+    from scipy import sparse
+
+    sparse_frame = pd.DataFrame.sparse.from_spmatrix(
+        sparse.csr_matrix([[0.0, 1.0], [2.0, 0.0]]), columns=["a", "b"]
+    )
+    dense_frame = pd.DataFrame({"c": [3.0, 4.0] if numeric else ["x", "y"]})
+    wrapper = _make_wrapper()
+
+    stacked = wrapper._hstack([sparse_frame, dense_frame])
+    # transform gives the same kind of output as fit_transform
+    dense_stacked = wrapper._hstack([dense_frame, dense_frame])
+
+    if numeric:
+        assert sparse.isspmatrix_csr(stacked)
+        assert (stacked.toarray() == [[0, 1, 3], [2, 0, 4]]).all()
+        assert sparse.isspmatrix_csr(dense_stacked)
+    else:
+        assert isinstance(stacked, pd.DataFrame)
+        assert list(stacked.columns) == ["a", "b", "c"]
+        assert isinstance(dense_stacked, pd.DataFrame)
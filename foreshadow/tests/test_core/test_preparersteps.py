@@ -38,3 +38,176 @@ def test_init_cachemanager(step, cache_manager):
         cs = dynamic_import("CacheManager", "foreshadow.cachemanager")()
     step = step(cache_manager=cs)
     assert step.cache_manager is not None
+
+
+def test_parallel_fit_merges_cache_writes():
+    """Test that a parallel fit gives the same cache state as a serial fit."""
+    import pandas as pd
+
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.steps import CleanerMapper
+    from foreshadow.utils import AcceptedKey, ConfigKey
+
+    X = pd.DataFrame(
+        {
+            "financial": ["$1.00", "$2.00"] * 5,
+            "text": ["a", "b"] * 5,
+            "date": ["2019-01-01", "2019-02-15"] * 5,
+        }
+    )
+
+    states = []
+    for n_jobs in [1, 2]:
+        cs = CacheManager()
+        cs[AcceptedKey.CONFIG][ConfigKey.N_JOBS] = n_jobs
+        step = CleanerMapper(cache_manager=cs)
+        step.fit(X)
+        for _, cleaner, _ in step.feature_processor.transformers_:
+            assert cleaner.cache_manager is cs
+        states.append(dict(cs[AcceptedKey.DOMAIN]))
+
+    assert states[0] == states[1]
+    assert states[0] == {
+        "financial": "DollarFinancialCleaner",
+        "text": "NoTransform",
+        "date": "YYYYMMDDDateCleaner",
+    }
+
+
+def test_fit_groups_passthrough_columns(mocker):
+    """Test that the columns passed through are transformed as one block."""
+    import pandas as pd
+
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.concrete import NoTransform
+    from foreshadow.steps import CleanerMapper
+
+    X = pd.DataFrame(
+        {
+            "text1": ["a", "b"] * 5,
+            "financial1": ["$1.00", "$2.00"] * 5,
+            "text2": ["c", "d"] * 5,
+            "text3": [1, 2] * 5,
+            "financial2": ["$3.00", "$4.00"] * 5,
+        }
+    )
+    step = CleanerMapper(cache_manager=CacheManager())
+    step.fit(X)
+    no_transform = mocker.spy(NoTransform, "transform")
+    grouped = step.transform(X)
+
+    assert no_transform.call_count == 0
+    assert len(step.feature_processor.transformers_) == len(X.columns)
+    assert list(grouped.columns) == list(X.columns)
+
+    step.feature_processor.group_passthrough([])
+    expected = step.transform(X)
+
+    assert no_transform.call_count == 3
+    assert grouped.equals(expected)
+
+
+def test_fit_groups_columns_scaled_the_same_way(mocker):
+    """Test that the columns scaled the same way are scaled as one block."""
+    import numpy as np
+    import pandas as pd
+
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.concrete import StandardScaler
+    from foreshadow.intents import IntentType
+    from foreshadow.steps import Preprocessor
+    from foreshadow.utils import AcceptedKey
+
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame(
+        {
+            "normal1": rng.randn(500),
+            "uniform": rng.rand(500),
+            "normal2": rng.randn(500) * 10 + 3,
+            "normal3": rng.randn(500) - 5,
+        }
+    )
+    cs = CacheManager()
+    for column in X.columns:
+        cs[AcceptedKey.INTENT, column] = IntentType.NUMERIC
+    step = Preprocessor(cache_manager=cs)
+    step.fit(X)
+    scale = mocker.spy(StandardScaler, "transform")
+    grouped = step.transform(X)
+
+    assert scale.call_count == 1
+    assert len(step.feature_processor.transformers_) == len(X.columns)
+    assert list(grouped.columns) == list(X.columns)
+
+    step.feature_processor.group_columns([])
+    expected = step.transform(X)
+
+    assert scale.call_count == 1 + 3
+    assert grouped.equals(expected)
+
+
+def test_merge_column_estimators_requires_same_dtype():
+    """Test that the column estimators with other dtypes are not merged."""
+    import numpy as np
+    import pandas as pd
+    from sklearn.impute import SimpleImputer
+
+    from foreshadow.steps.preparerstep import _merge_column_estimators
+
+    X = pd.DataFrame(
+        {
+            "floats": [1.5, np.nan, 1.5, 2.0],
+            "more_floats": [np.nan, 3.0, 3.0, 4.0],
+            "strings": ["a", np.nan, "a", "b"],
+        }
+    )
+    imputers = {
+        column: SimpleImputer(strategy="most_frequent").fit(X[[column]])
+        for column in X.columns
+    }
+
+    merged = _merge_column_estimators(
+        [imputers["floats"], imputers["more_floats"]]
+    )
+    np.testing.assert_array_equal(merged.statistics_, [1.5, 3.0])
+    assert (
+        _merge_column_estimators([imputers["floats"], imputers["strings"]])
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    "step_name", ["FlattenMapper", "CleanerMapper", "Preprocessor"]
+)
+def test_fit_transform_in_one_pass(mocker, step_name):
+    """Test that fit_transform gives the output of transform after fit."""
+    import pandas as pd
+
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.ColumnTransformerWrapper import ColumnTransformerWrapper
+    from foreshadow.intents import IntentType
+    from foreshadow.utils import AcceptedKey
+
+    X = pd.DataFrame(
+        {
+            "financial": ["$1.00", "$2.00", "$3.50"] * 4,
+            "numeric": [1.0, 2.0, 4.0] * 4,
+            "categorical": ["a", "b", "c"] * 4,
+        }
+    )
+    if step_name == "Preprocessor":
+        X["financial"] = [1.0, 2.0, 3.5] * 4
+    cs = CacheManager()
+    for column, intent in [
+        ("financial", IntentType.NUMERIC),
+        ("numeric", IntentType.NUMERIC),
+        ("categorical", IntentType.CATEGORICAL),
+    ]:
+        cs[AcceptedKey.INTENT, column] = intent
+    step = dynamic_import(step_name, "foreshadow.steps")(cache_manager=cs)
+    transform = mocker.spy(ColumnTransformerWrapper, "transform")
+
+    fitted = step.fit_transform(X)
+
+    assert transform.call_count == 0
+    assert fitted.equals(step.transform(X))
@@ -15,3 +15,181 @@ def test_resolver_overall():
     ir = IntentMapper(cache_manager=cs)
     ir.fit(data)
     assert cs["intent", "financials"] == "Droppable"
+
+
+def test_resolver_batch_matches_per_column():
+    """Batched intent resolution gives the same intents as per column."""
+
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.steps import IntentMapper
+
+    data = pd.DataFrame(
+        {
+            "numbers": np.random.randn(100),
+            "categories": np.random.choice(["a", "b", "c"], 100),
+            "ids": np.arange(100),
+        }
+    )
+    batched_cs = CacheManager()
+    IntentMapper(cache_manager=batched_cs).fit(data)
+    per_column_cs = CacheManager()
+    IntentMapper(cache_manager=per_column_cs, batch_resolve=False).fit(data)
+
+    for column in data.columns:
+        assert batched_cs["intent", column] == per_column_cs["intent", column]
+
+
+def test_resolver_batch_calls_model_once(mocker):
+    """The intent model is only invoked once for all the columns."""
+
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.smart.intent_resolving import intentresolver
+    from foreshadow.steps import IntentMapper
+
+    auto_intent_resolver = mocker.patch.object(
+        intentresolver,
+        "AutoIntentResolver",
+        wraps=intentresolver.AutoIntentResolver,
+    )
+    data = pd.DataFrame({str(i): np.arange(100) + i for i in range(5)})
+    cs = CacheManager()
+    IntentMapper(cache_manager=cs).fit(data)
+
+    assert auto_intent_resolver.call_count == 1
+    assert all(cs["intent", column] is not None for column in data.columns)
+
+
+def test_resolver_batch_skips_overridden_columns():
+    """Overridden columns keep their intent and are not batch resolved."""
+
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.steps import IntentMapper
+    from foreshadow.utils import AcceptedKey, Override
+
+    data = pd.DataFrame({"a": np.arange(100), "b": np.arange(100)})
+    cs = CacheManager()
+    cs[AcceptedKey.OVERRIDE]["_".join([Override.INTENT, "a"])] = "Numeric"
+    mapper = IntentMapper(cache_manager=cs)
+
+    assert "a" not in mapper._batch_resolve_intents(data)
+    mapper.fit(data)
+    assert cs["intent", "a"] == "Numeric"
+
+
+def test_resolver_rules_settle_unambiguous_columns(mocker):
+    """Unambiguous columns are resolved by rules, without the model."""
+
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.smart.intent_resolving import IntentTier, intentresolver
+    from foreshadow.steps import IntentMapper
+
+    auto_intent_resolver = mocker.patch.object(
+        intentresolver,
+        "AutoIntentResolver",
+        wraps=intentresolver.AutoIntentResolver,
+    )
+    data = pd.DataFrame(
+        {
+            "flags": np.random.choice([True, False], 200),
+            "dates": pd.date_range("2020-01-01", periods=200),
+            "reals": np.random.randn(200),
+            "empty": [np.nan] * 200,
+        }
+    )
+    for batch_resolve in [True, False]:
+        cs = CacheManager()
+        mapper = IntentMapper(cache_manager=cs, batch_resolve=batch_resolve)
+        mapper.fit(data)
+
+        assert cs["intent", "flags"] == "Categorical"
+        assert cs["intent", "dates"] == "Text"
+        assert cs["intent", "reals"] == "Numeric"
+        assert cs["intent", "empty"] == "Droppable"
+        assert mapper.tier_counts_ == {IntentTier.RULE: 4}
+    assert auto_intent_resolver.call_count == 0
+
+
+def test_resolver_rules_leave_ambiguous_columns():
+    """Columns without an obvious intent are left to the model."""
+
+    import numpy as np
+    import pandas as pd
+    from foreshadow.smart.intent_resolving import resolve_intents_by_rules
+
+    data = pd.DataFrame(
+        {
+            "int_like_floats": np.arange(200, dtype=float),
+            "ints": np.arange(200),
+            "strings": ["a"] * 200,
+        }
+    )
+    few_reals = pd.DataFrame({"few_reals": np.random.randn(10)})
+
+    assert resolve_intents_by_rules(data) == {}
+    assert resolve_intents_by_rules(few_reals) == {}
+
+
+def test_resolver_incremental_refit(mocker):
+    """A refit only resolves the intents of new and drifted columns."""
+
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.smart.intent_resolving import IntentTier
+    from foreshadow.steps import IntentMapper, mapper
+    from foreshadow.utils import ConfigKey
+
+    data = pd.DataFrame(
+        {
+            "ints": np.arange(200) % 7,
+            "strings": np.random.choice(["a", "b", "c"], 200),
+            "drifting": np.arange(200) % 5,
+        }
+    )
+    cs = CacheManager()
+    cs["config"][ConfigKey.ENABLE_INCREMENTAL_INTENT_RESOLUTION] = True
+    IntentMapper(cache_manager=cs).fit(data)
+    first_intents = {column: cs["intent", column] for column in data}
+
+    resolve_intents = mocker.patch.object(
+        mapper, "resolve_intents", wraps=mapper.resolve_intents
+    )
+    refit_data = data.assign(drifting=np.arange(200), new=np.arange(200) % 3)
+    intent_mapper = IntentMapper(cache_manager=cs)
+    intent_mapper.fit(refit_data)
+
+    assert intent_mapper.reresolved_columns_ == ["drifting", "new"]
+    assert intent_mapper.tier_counts_[IntentTier.UNCHANGED] == 2
+    assert set(resolve_intents.call_args[0][0].columns) == {"drifting", "new"}
+    for column in ["ints", "strings"]:
+        assert cs["intent", column] == first_intents[column]
+    assert cs["intent", "new"] is not None
+
+
+def test_column_signature_drift():
+    import numpy as np
+    import pandas as pd
+    from foreshadow.smart.intent_resolving import column_signature, has_drifted
+
+    series = pd.Series(np.arange(100) % 10)
+    signature = column_signature(series)
+
+    assert signature == {
+        "dtype": "int64",
+        "nan_rate": 0.0,
+        "distinct_rate": 0.1,
+    }
+    assert not has_drifted(signature, column_signature(series[:90]), 0.1)
+    assert has_drifted(signature, column_signature(series.astype(str)), 0.1)
+    assert has_drifted(
+        signature, column_signature(pd.Series(np.arange(100))), 0.1
+    )
+    assert has_drifted(None, signature, 0.1)
@@ -66,3 +66,70 @@ def test_transformer_wrapper_empty_input():
         StandardScaler().fit(df)
     with pytest.raises(ValueError):
         CustomScaler().fit(df)
+
+
+def test_transformer_wrapper_keep_sparse_outputs():
+    import numpy as np
+    import pandas as pd
+    from sklearn.pipeline import Pipeline
+    from foreshadow.concrete import TfidfTransformer
+    from foreshadow.utils import TruncatedSVDWrapper, is_sparse_frame
+    from foreshadow.wrapper import keep_sparse_outputs
+
+    counts = pd.DataFrame(
+        np.random.RandomState(0).poisson(0.5, (20, 6)), columns=list("abcdef")
+    )
+    dense = TfidfTransformer().fit_transform(counts)
+
+    tfidf = TfidfTransformer()
+    keep_sparse_outputs(Pipeline([("tfidf", tfidf)]))
+    out = tfidf.fit_transform(counts)
+
+    assert not is_sparse_frame(dense)
+    assert is_sparse_frame(out)
+    assert list(out.columns) == list(dense.columns)
+    assert out.index.equals(counts.index)
+    np.testing.assert_allclose(out.sparse.to_dense().values, dense.values)
+    np.testing.assert_allclose(
+        tfidf.transform(counts).sparse.to_dense().values, dense.values
+    )
+
+    svd = TruncatedSVDWrapper(n_components=2, random_state=0)
+    dense_svd = TruncatedSVDWrapper(n_components=2, random_state=0)
+    np.testing.assert_allclose(
+        np.abs(svd.fit_transform(out)),
+        np.abs(dense_svd.fit_transform(dense.values)),
+    )
+    np.testing.assert_allclose(
+        np.abs(svd.transform(out)), np.abs(dense_svd.transform(dense.values))
+    )
+
+
+@pytest.mark.parametrize("accept_sparse", [True, False])
+def test_transformer_wrapper_sparse_inputs(accept_sparse):
+    import pandas as pd
+    from scipy import sparse
+    from foreshadow.base import BaseEstimator, TransformerMixin
+    from foreshadow.wrapper import pandas_wrap
+
+    class Recorder(BaseEstimator, TransformerMixin):
+        def fit(self, X, y=None):
+            if sparse.issparse(X) and not accept_sparse:
+                raise TypeError("A sparse matrix was passed")
+            self.fit_input_ = X
+            return self
+
+        def transform(self, X):
+            return X
+
+    X = pd.DataFrame.sparse.from_spmatrix(
+        sparse.csr_matrix([[0.0, 1.0], [2.0, 0.0]]), columns=["a", "b"]
+    )
+
+    recorder = pandas_wrap(Recorder)()
+    recorder.keep_sparse = True
+    out = recorder.fit_transform(X)
+
+    assert sparse.issparse(recorder.fit_input_) == accept_sparse
+    assert list(out.columns) == ["a", "b"]
+    assert out.sparse.to_dense().equals(X.sparse.to_dense())
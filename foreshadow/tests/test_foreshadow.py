@@ -1283,3 +1283,27 @@ def test_text_classification_foreshadow():
 #     docs_test = twenty_test.data
 #     predicted = text_clf.predict(docs_test)
 #     print(np.mean(predicted == twenty_test.target))
+
+
+def test_register_customized_data_cleaner_validation():
+    from foreshadow.foreshadow import Foreshadow
+    from foreshadow.concrete import DollarFinancialCleaner
+    from foreshadow.concrete.internals.cleaners.customizable_base import (
+        VectorizedCustomizableBaseCleaner,
+    )
+    from foreshadow.utils import AcceptedKey, ConfigKey
+
+    class IdentityCleaner(VectorizedCustomizableBaseCleaner):
+        def __init__(self):
+            super().__init__(lambda column: (column, [1] * len(column)))
+
+    shadow = Foreshadow(problem_type=ProblemType.CLASSIFICATION)
+    shadow.register_customized_data_cleaner(data_cleaners=[IdentityCleaner])
+    assert shadow.X_preparer.cache_manager[
+        AcceptedKey.CUSTOMIZED_TRANSFORMERS
+    ][ConfigKey.CUSTOMIZED_CLEANERS] == [IdentityCleaner]
+
+    with pytest.raises(ValueError):
+        shadow.register_customized_data_cleaner(
+            data_cleaners=[DollarFinancialCleaner]
+        )
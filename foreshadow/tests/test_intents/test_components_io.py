@@ -0,0 +1,132 @@
+"""Test the compact export format of the intent resolver components."""
+import pytest
+
+
+def _make_components():
+    import numpy as np
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.preprocessing import RobustScaler
+
+    rng = np.random.RandomState(0)
+    X = rng.randn(200, 5)
+    y = rng.randint(0, 3, 200)
+    forest = RandomForestClassifier(n_estimators=5, random_state=0)
+    components = {
+        "model": forest.fit(X, y),
+        "lr": LogisticRegression().fit(X, y),
+        "scaler": RobustScaler().fit(X),
+        "function_featurizers_config": [
+            {
+                "callable_": "lambda df: hr.avg_val_len(df)",
+                "feature_name": "avg_val_len",
+                "on_raw": True,
+                "normalizable": True,
+            }
+        ],
+        "classes": ("Numeric", "Categorical"),
+    }
+    return components, X
+
+
+def test_npz_roundtrip(tmpdir):
+    import numpy as np
+    from foreshadow.smart.intent_resolving.core import io
+
+    components, X = _make_components()
+    path = str(tmpdir.join("components.npz"))
+    io.to_npz(components, path)
+    loaded = io.from_npz(path)
+
+    np.testing.assert_array_equal(
+        components["model"].predict_proba(X), loaded["model"].predict_proba(X)
+    )
+    np.testing.assert_array_equal(
+        components["lr"].predict_proba(X), loaded["lr"].predict_proba(X)
+    )
+    np.testing.assert_allclose(
+        components["scaler"].transform(X), loaded["scaler"].transform(X)
+    )
+    assert (
+        loaded["function_featurizers_config"]
+        == components["function_featurizers_config"]
+    )
+    assert loaded["classes"] == components["classes"]
+    assert isinstance(loaded["scaler"].center_.base, np.memmap)
+    assert not loaded["scaler"].center_.flags.writeable
+
+
+def test_npz_is_loadable_by_numpy(tmpdir):
+    import numpy as np
+    from foreshadow.smart.intent_resolving.core import io
+
+    components, _ = _make_components()
+    path = str(tmpdir.join("components.npz"))
+    io.to_npz(components, path)
+
+    with np.load(path) as archive:
+        assert len(archive.files) > 0
+
+
+def test_npz_rejects_lambdas(tmpdir):
+    from foreshadow.smart.intent_resolving.core import io
+
+    with pytest.raises(TypeError):
+        io.to_npz({"f": lambda x: x}, str(tmpdir.join("components.npz")))
+
+
+@pytest.mark.parametrize(
+    "components",
+    [
+        {"__estimator__": "numpy:load", "params": {}, "attributes": {}},
+        {
+            "__estimator__": "sklearn.base:clone",
+            "params": {},
+            "attributes": {},
+        },
+        {"__callable__": "builtins:open"},
+        {"__callable__": "numpyx:load"},
+        {"__callable__": "sklearn.base:np.load.__globals__"},
+        {"__callable__": "foreshadow.config:os.system"},
+    ],
+)
+def test_npz_refuses_unsafe_references(tmpdir, components):
+    import json
+    import zipfile
+    from foreshadow.smart.intent_resolving.core import io
+
+    path = str(tmpdir.join("components.npz"))
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            io.COMPONENTS_MEMBER,
+            json.dumps({"components": components, "arrays": {}}),
+        )
+
+    with pytest.raises(ValueError):
+        io.from_npz(path)
+
+
+def test_npz_rejects_unsafe_callables(tmpdir):
+    from foreshadow.smart.intent_resolving.core import io
+
+    with pytest.raises(ValueError):
+        io.to_npz({"f": open}, str(tmpdir.join("components.npz")))
+
+
+def test_load_components_dispatch(tmpdir, mocker):
+    from foreshadow.smart.intent_resolving.core import io
+
+    components, _ = _make_components()
+    pickle_path = str(tmpdir.join("components.pkl"))
+    npz_path = str(tmpdir.join("components.npz"))
+    io.to_pickle(components, pickle_path)
+    io.export_components(pickle_path, npz_path)
+    from_pickle = mocker.spy(io, "from_pickle")
+    from_npz = mocker.spy(io, "from_npz")
+
+    io.load_components(npz_path)
+    assert from_npz.call_count == 1
+    assert from_pickle.call_count == 0
+
+    io.load_components(pickle_path)
+    assert from_pickle.call_count == 1
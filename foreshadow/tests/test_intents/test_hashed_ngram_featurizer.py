@@ -0,0 +1,83 @@
+"""Test the hashed n-gram text featurizer of the intent resolver."""
+
+
+def _make_meta_df():
+    import numpy as np
+    import pandas as pd
+
+    return pd.DataFrame(
+        {
+            "attribute_name": ["Zip_Code", " first-name ", "AGE", "price"],
+            "sample1": ["12345", "Bob", 32, np.nan],
+            "sample2": ["02139", "alice ", 41, 1.5],
+            "sample3": ["Über", None, 18, 2.25],
+            "sample4": ["a_b", "c-d", 0, 3.0],
+            "sample5": ["", " ", 1, 4.0],
+        }
+    )
+
+
+def test_preprocess_texts_matches_row_wise():
+    from foreshadow.smart.intent_resolving.core.secondary_featurizers import (
+        base_text_featurizer,
+    )
+
+    meta_df = _make_meta_df()
+    cols = [f"sample{i + 1}" for i in range(5)]
+    expected = [
+        ":".join(
+            str(s).strip().lower().replace("_", " ").replace("-", " ")
+            for s in row
+        )
+        for row in meta_df[cols].values
+    ]
+
+    texts = base_text_featurizer.BaseTextFeaturizer.preprocess_texts(
+        meta_df, cols
+    )
+
+    assert list(texts) == expected
+
+
+def test_hashed_ngram_featurizer_is_stateless():
+    import numpy as np
+    from foreshadow.smart.intent_resolving.core.secondary_featurizers import (
+        HashedNGramFeaturizer,
+    )
+
+    meta_df = _make_meta_df()
+    fitted = HashedNGramFeaturizer("all", n_features=64)
+    fitted.featurize(meta_df=meta_df.iloc[:2])
+    unfitted = HashedNGramFeaturizer("all", n_features=64)
+    unfitted.featurize(test_meta_df=meta_df)
+
+    assert unfitted.sec_test_metafeatures.shape == (4, 128)
+    assert len(unfitted.sec_feature_names) == 128
+    assert unfitted.sec_feature_names[-1] == "hashed_ngrams_samples_63*"
+    np.testing.assert_array_equal(
+        fitted.sec_metafeatures.values,
+        unfitted.sec_test_metafeatures.values[:2],
+    )
+
+
+def test_hashed_ngram_featurizer_from_config(tmpdir):
+    from foreshadow.smart.intent_resolving.core import io
+    from foreshadow.smart.intent_resolving.core.secondary_featurizers import (
+        FeaturizerCurator,
+        HashedNGramFeaturizer,
+    )
+
+    meta_df = _make_meta_df()
+    featurizer = HashedNGramFeaturizer("all", ngram_range=(1, 2))
+    featurizer.featurize(meta_df=meta_df)
+    path = str(tmpdir.join("components.npz"))
+    io.to_npz({"text_featurizer_config": featurizer.serialize()}, path)
+
+    (loaded,) = FeaturizerCurator.from_config(
+        func_config=[], text_config=io.from_npz(path)["text_featurizer_config"]
+    )
+    loaded.featurize(test_meta_df=meta_df)
+
+    assert isinstance(loaded, HashedNGramFeaturizer)
+    assert loaded.sec_feature_names == featurizer.sec_feature_names
+    assert loaded.sec_test_metafeatures.equals(featurizer.sec_metafeatures)
@@ -0,0 +1,125 @@
+"""Test the persistent intent cache."""
+import os
+import time
+
+
+def test_column_fingerprint_is_stable():
+    import numpy as np
+    import pandas as pd
+    from foreshadow.smart.intent_resolving import column_fingerprint
+
+    series = pd.Series(np.arange(1000), name="a")
+
+    assert column_fingerprint(series) == column_fingerprint(series.copy())
+    assert column_fingerprint(series) == column_fingerprint(
+        series.sample(frac=1, random_state=0)
+    )
+    assert column_fingerprint(series) != column_fingerprint(series.rename("b"))
+    assert column_fingerprint(series) != column_fingerprint(
+        series.astype(float)
+    )
+    assert column_fingerprint(series) != column_fingerprint(series + 1)
+
+
+def test_intent_cache_get_put(tmpdir):
+    from foreshadow.smart.intent_resolving import IntentCache
+
+    cache = IntentCache(cache_dir=str(tmpdir))
+    assert cache.get("abc") is None
+
+    cache.put("abc", "Numeric")
+    assert cache.get("abc") == "Numeric"
+    assert IntentCache(cache_dir=str(tmpdir)).get("abc") == "Numeric"
+
+    cache.clear()
+    assert cache.get("abc") is None
+
+
+def test_intent_cache_ttl(tmpdir):
+    from foreshadow.smart.intent_resolving import IntentCache
+
+    cache = IntentCache(cache_dir=str(tmpdir), ttl=60)
+    cache.put("abc", "Numeric")
+    past = time.time() - 120
+    os.utime(str(tmpdir.join("abc.json")), (past, past))
+
+    assert cache.get("abc") is None
+    assert len(cache) == 0
+
+
+def test_intent_cache_max_entries(tmpdir):
+    from foreshadow.smart.intent_resolving import IntentCache
+
+    cache = IntentCache(cache_dir=str(tmpdir), max_entries=2)
+    for i, fingerprint in enumerate(["a", "b", "c"]):
+        cache.put(fingerprint, "Numeric")
+        mtime = time.time() - 100 + i
+        os.utime(str(tmpdir.join(fingerprint + ".json")), (mtime, mtime))
+    cache.evict()
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == "Numeric"
+
+
+def test_intent_mapper_uses_intent_cache(tmpdir, mocker):
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.smart.intent_resolving import intent_cache
+    from foreshadow.steps import mapper
+    from foreshadow.utils import ConfigKey
+
+    mocker.patch.object(
+        intent_cache, "get_cache_path", return_value=str(tmpdir)
+    )
+    resolve_intents = mocker.patch.object(
+        mapper, "resolve_intents", wraps=mapper.resolve_intents
+    )
+    data = pd.DataFrame(
+        {
+            "numbers": np.random.randn(100),
+            "categories": np.random.choice(["a", "b", "c"], 100),
+        }
+    )
+
+    intents = []
+    for _ in range(2):
+        cs = CacheManager()
+        cs["config"][ConfigKey.ENABLE_INTENT_CACHE] = True
+        mapper.IntentMapper(cache_manager=cs).fit(data)
+        intents.append({column: cs["intent", column] for column in data})
+
+    assert resolve_intents.call_count == 1
+    assert intents[0] == intents[1]
+
+
+def test_column_fingerprint_sketch_ignores_repeated_values():
+    import numpy as np
+    import pandas as pd
+    from foreshadow.smart.intent_resolving import column_fingerprint
+
+    rng = np.random.RandomState(0)
+    numbers = rng.randint(0, 10 ** 6, 700).astype(str).tolist()
+    words = ["word_{}".format(i) for i in rng.randint(0, 10 ** 6, 700)]
+    # A value repeated more often than the sketch size
+    missing = ["missing"] * 300
+
+    assert column_fingerprint(
+        pd.Series(numbers + missing, name="a")
+    ) != column_fingerprint(pd.Series(words + missing, name="a"))
+
+
+def test_intent_cache_writes_do_not_evict(tmpdir):
+    from foreshadow.smart.intent_resolving import IntentCache
+
+    cache_dir = str(tmpdir.join("intents"))
+    cache = IntentCache(cache_dir=cache_dir, max_entries=1)
+    assert len(cache) == 0
+    assert not os.path.exists(cache_dir)
+
+    cache.update({"a": "Numeric", "b": "Categorical"})
+    assert len(cache) == 2
+
+    assert cache.evict() == 1
+    assert len(cache) == 1
@@ -0,0 +1,138 @@
+"""Test the column-projected and row-limited LazyDataFrameLoader."""
+import pytest
+
+
+def _get_loader_class():
+    from foreshadow.smart.intent_resolving.core.data_set_parsers import (
+        lazy_dataframe_loader,
+    )
+
+    return lazy_dataframe_loader.LazyDataFrameLoader
+
+
+def _write_csv(tmpdir, n_rows=1000):
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "row": np.arange(n_rows),
+            "code": [f"{i:05d}" for i in range(n_rows)],
+            "text": ["a", "b"] * (n_rows // 2),
+        }
+    )
+    path = str(tmpdir.join("data.csv"))
+    df.to_csv(path, index=False)
+    return df, path
+
+
+def test_loader_column_subset_and_dtype_hints(tmpdir):
+    LazyDataFrameLoader = _get_loader_class()
+    _, path = _write_csv(tmpdir)
+
+    result = LazyDataFrameLoader(
+        csv_path=path, usecols=["row", "code"], dtype={"code": str}, nrows=10
+    )()
+
+    assert list(result.columns) == ["row", "code"]
+    assert len(result) == 10
+    assert result["code"].tolist()[:2] == ["00000", "00001"]
+
+
+@pytest.mark.parametrize("chunksize", [7, 100, 5000])
+def test_loader_reservoir_sample(tmpdir, chunksize):
+    LazyDataFrameLoader = _get_loader_class()
+    df, path = _write_csv(tmpdir)
+
+    def load(**kwargs):
+        return LazyDataFrameLoader(
+            csv_path=path,
+            dtype={"code": str},
+            sample_rows=50,
+            chunksize=chunksize,
+            **kwargs,
+        )()
+
+    sample = load()
+
+    assert len(sample) == 50
+    assert sample["row"].is_monotonic_increasing
+    assert sample["row"].is_unique
+    assert sample.equals(df.iloc[sample["row"]].reset_index(drop=True))
+    assert sample.equals(load())
+    assert not sample.equals(load(random_state=1))
+    assert load(nrows=100)["row"].max() < 100
+
+
+def test_loader_reservoir_sample_is_uniform(tmpdir):
+    import numpy as np
+
+    LazyDataFrameLoader = _get_loader_class()
+    df, _ = _write_csv(tmpdir, n_rows=100)
+
+    counts = np.zeros(len(df))
+    for random_state in range(500):
+        sample = LazyDataFrameLoader(
+            df=df, sample_rows=10, random_state=random_state
+        )()
+        counts[sample["row"]] += 1
+
+    # Each row is expected to be sampled 50 times
+    assert counts.min() > 25 and counts.max() < 80
+
+
+def test_loader_reservoir_sample_smaller_than_sample(tmpdir):
+    LazyDataFrameLoader = _get_loader_class()
+    df, path = _write_csv(tmpdir, n_rows=20)
+
+    sample = LazyDataFrameLoader(
+        csv_path=path, dtype={"code": str}, sample_rows=50, chunksize=3
+    )()
+
+    assert sample.equals(df)
+
+
+def test_loader_options_change_content_hash(tmpdir):
+    LazyDataFrameLoader = _get_loader_class()
+    _, path = _write_csv(tmpdir)
+
+    hashes = {
+        LazyDataFrameLoader(csv_path=path).content_hash(),
+        LazyDataFrameLoader(csv_path=path, usecols=["row"]).content_hash(),
+        LazyDataFrameLoader(csv_path=path, sample_rows=5).content_hash(),
+        LazyDataFrameLoader(
+            csv_path=path, sample_rows=5, random_state=1
+        ).content_hash(),
+    }
+
+    assert len(hashes) == 4
+
+
+def test_loader_parquet(tmpdir):
+    pytest.importorskip("pyarrow")
+    LazyDataFrameLoader = _get_loader_class()
+    df, _ = _write_csv(tmpdir)
+    path = str(tmpdir.join("data.parquet"))
+    df.to_parquet(path, index=False, row_group_size=64)
+
+    projected = LazyDataFrameLoader(
+        parquet_path=path, usecols=["row", "text"], nrows=100
+    )()
+    sample = LazyDataFrameLoader(parquet_path=path, sample_rows=50)()
+
+    assert projected.equals(df[["row", "text"]].iloc[:100])
+    assert len(sample) == 50
+    assert sample.equals(df.iloc[sample["row"]].reset_index(drop=True))
+
+
+def test_loader_exclusive_sources(tmpdir):
+    import pandas as pd
+
+    LazyDataFrameLoader = _get_loader_class()
+
+    with pytest.raises(ValueError):
+        LazyDataFrameLoader(
+            df=pd.DataFrame(), parquet_path=str(tmpdir.join("x.parquet"))
+        )
+    with pytest.raises(TypeError):
+        LazyDataFrameLoader(parquet_path=1)
@@ -0,0 +1,112 @@
+"""Test the base featurization of RawDataSetParser."""
+import pytest
+
+
+@pytest.mark.parametrize("chunk_size", [65536, 7])
+def test_raw_data_set_parser_base_features(monkeypatch, chunk_size):
+    import numpy as np
+    import pandas as pd
+    from foreshadow.smart.intent_resolving.core import heuristics
+    from foreshadow.smart.intent_resolving.core.data_set_parsers import (
+        raw_data_set_parser,
+    )
+
+    n_rows = 300
+    rng = np.random.RandomState(0)
+    floats = rng.randn(n_rows)
+    floats[::7] = np.nan
+    raw = pd.DataFrame(
+        {
+            "floats": floats,
+            "ints": rng.randint(0, 10, n_rows),
+            "numeric_strings": rng.randint(0, 50, n_rows).astype(str),
+            "mixed": np.array([1, "1", 2.5, None, "a"], dtype="object")[
+                rng.randint(0, 5, n_rows)
+            ],
+            "text": ["id_{}".format(i) for i in range(n_rows)],
+            "dates": pd.date_range("2019-01-01", periods=n_rows, freq="D"),
+            "nans": [np.nan] * n_rows,
+        }
+    )
+
+    monkeypatch.setattr(raw_data_set_parser, "_CHUNK_SIZE", chunk_size)
+    parser = raw_data_set_parser.RawDataSetParser
+    features = parser._extract_base_features(raw)
+
+    assert list(features["attribute_name"]) == list(raw.columns)
+    for i, column in enumerate(raw):
+        row = features.iloc[i]
+        series = raw[column]
+        distinct = set(series.dropna().astype("object").astype(str))
+
+        assert row["total_val"] == n_rows
+        assert row["num_nans"] == series.isna().sum()
+        assert row["num_distincts"] == len(distinct)
+
+        samples = [row["sample{}".format(j + 1)] for j in range(5)]
+        if distinct:
+            assert set(samples) <= distinct
+        else:
+            assert all(pd.isna(samples))
+
+        if heuristics.is_number_as_string(series):
+            numeric = heuristics.convert_to_numeric(series)
+            assert np.isclose(row["max"], max(numeric))
+            assert np.isclose(row["min"], min(numeric))
+            assert np.isclose(row["mean"], np.mean(numeric))
+            assert np.isclose(row["stddev"], np.std(numeric))
+        else:
+            assert row[["max", "min", "mean", "stddev"]].tolist() == [0.0] * 4
+
+    numeric_features = features[["max", "min", "mean", "stddev"]]
+    assert all(pd.api.types.is_float_dtype(t) for t in numeric_features.dtypes)
+
+
+def test_raw_data_set_parser_samples_are_uniform(monkeypatch):
+    import numpy as np
+    import pandas as pd
+    from foreshadow.smart.intent_resolving.core.data_set_parsers import (
+        raw_data_set_parser,
+    )
+
+    monkeypatch.setattr(raw_data_set_parser, "_CHUNK_SIZE", 40)
+    # The first values repeat, so that a sample of the rows would mostly
+    # pick them
+    series = pd.Series(["a"] * 50 + ["b"] * 50 + list("cdefghij"))
+
+    counts = {}
+    np.random.seed(0)
+    for _ in range(300):
+        stats = raw_data_set_parser.RawDataSetParser._column_statistics(
+            series, n_samples=2
+        )
+        assert len(set(stats["samples"])) == 2
+        for sample in stats["samples"]:
+            counts[sample] = counts.get(sample, 0) + 1
+
+    # Each of the 10 distinct values is expected to be sampled 60 times
+    assert sorted(counts) == list("abcdefghij")
+    assert min(counts.values()) > 35 and max(counts.values()) < 85
+
+
+def test_raw_data_set_parser_counts_distincts_across_many_chunks(monkeypatch):
+    import numpy as np
+    import pandas as pd
+    from foreshadow.smart.intent_resolving.core.data_set_parsers import (
+        raw_data_set_parser,
+    )
+
+    rng = np.random.RandomState(0)
+    # Most values are distinct and the others repeat across chunks
+    values = rng.randint(0, 20000, 30000).astype(str)
+    series = pd.Series(values, dtype="object")
+
+    monkeypatch.setattr(raw_data_set_parser, "_CHUNK_SIZE", 97)
+    stats = raw_data_set_parser.RawDataSetParser._column_statistics(
+        series, n_samples=5
+    )
+
+    distinct = set(values)
+    assert stats["num_distincts"] == len(distinct)
+    assert len(set(stats["samples"])) == 5
+    assert set(stats["samples"]) <= distinct
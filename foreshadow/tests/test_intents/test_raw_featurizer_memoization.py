@@ -0,0 +1,155 @@
+"""Test the memoized featurization of raw data sets."""
+
+
+def _make_featurizer(calls, **kwargs):
+    from foreshadow.smart.intent_resolving.core.secondary_featurizers import (
+        RawDataSetFeaturizerViaLambda,
+        RawDataSetLambdaTransformer,
+    )
+
+    def nan_rate(df):
+        calls.append(list(df.columns))
+        return df.isna().mean()
+
+    return RawDataSetFeaturizerViaLambda(
+        featurizers=[
+            RawDataSetLambdaTransformer(
+                method="nan_rate", callable_=nan_rate, normalizable=False
+            )
+        ],
+        progress=False,
+        **kwargs,
+    )
+
+
+def _make_raw_gen(paths):
+    from foreshadow.smart.intent_resolving.core.data_set_parsers import (
+        lazy_dataframe_loader,
+    )
+
+    LazyDataFrameLoader = lazy_dataframe_loader.LazyDataFrameLoader
+
+    return [
+        (dataset, LazyDataFrameLoader(csv_path=path))
+        for dataset, path in paths.items()
+    ]
+
+
+def _write_csvs(tmpdir, n):
+    import numpy as np
+    import pandas as pd
+
+    paths = {}
+    for i in range(n):
+        path = str(tmpdir.join(f"data_{i}.csv"))
+        pd.DataFrame(
+            {f"a{i}": [1.0, np.nan, 3.0], f"b{i}": ["x", "y", None]}
+        ).to_csv(path, index=False)
+        paths[f"data_{i}"] = path
+    return paths
+
+
+def _make_keys(paths):
+    import pandas as pd
+
+    return pd.DataFrame(
+        [
+            (dataset, f"{col}{i}")
+            for i, dataset in enumerate(paths)
+            for col in ("a", "b")
+        ],
+        columns=["dataset", "attribute_name"],
+    )
+
+
+def test_content_hash(tmpdir):
+    import pandas as pd
+    from foreshadow.smart.intent_resolving.core.data_set_parsers import (
+        lazy_dataframe_loader,
+    )
+
+    LazyDataFrameLoader = lazy_dataframe_loader.LazyDataFrameLoader
+
+    path = str(tmpdir.join("data.csv"))
+    pd.DataFrame({"a": [1, 2]}).to_csv(path, index=False)
+    first = LazyDataFrameLoader(csv_path=path).content_hash()
+
+    assert LazyDataFrameLoader(csv_path=path).content_hash() == first
+    assert (
+        LazyDataFrameLoader(
+            csv_path=path, remove_id_substring=True
+        ).content_hash()
+        != first
+    )
+
+    pd.DataFrame({"a": [1, 3]}).to_csv(path, index=False)
+    assert LazyDataFrameLoader(csv_path=path).content_hash() != first
+
+    df = pd.DataFrame({"a": [1, 2]})
+    renamed = df.rename(columns={"a": "b"})
+    first = LazyDataFrameLoader(df=df).content_hash()
+    assert LazyDataFrameLoader(df=df.copy()).content_hash() == first
+    assert LazyDataFrameLoader(df=renamed).content_hash() != first
+
+
+def test_memoized_featurization_only_computes_new_data_sets(tmpdir):
+    cache_dir = tmpdir.join("cache")
+    paths = _write_csvs(tmpdir, 3)
+    first_paths = dict(list(paths.items())[:2])
+
+    calls = []
+    featurizer = _make_featurizer(calls, cache_dir=str(cache_dir))
+    featurizer.featurize(
+        _make_raw_gen(first_paths), keys=_make_keys(first_paths)
+    )
+    expected = featurizer.sec_metafeatures
+    assert len(calls) == 2
+    assert len(cache_dir.listdir()) == 2
+
+    calls = []
+    featurizer = _make_featurizer(calls, cache_dir=str(cache_dir))
+    featurizer.featurize(_make_raw_gen(paths), keys=_make_keys(paths))
+
+    assert calls == [["a2", "b2"]]
+    assert len(cache_dir.listdir()) == 3
+    assert featurizer.sec_metafeatures.iloc[:4].equals(expected)
+    assert (
+        featurizer.sec_metafeatures["nan_rate"].tolist()
+        == [1 / 3] * len(paths) * 2
+    )
+
+
+def test_memoized_featurization_ignores_corrupted_files(tmpdir):
+    cache_dir = tmpdir.join("cache")
+    paths = _write_csvs(tmpdir, 1)
+
+    calls = []
+    _make_featurizer(calls, cache_dir=str(cache_dir)).featurize(
+        _make_raw_gen(paths), keys=_make_keys(paths)
+    )
+    cache_dir.listdir()[0].write("interrupted")
+
+    featurizer = _make_featurizer(calls, cache_dir=str(cache_dir))
+    featurizer.featurize(_make_raw_gen(paths), keys=_make_keys(paths))
+
+    assert len(calls) == 2
+    assert featurizer.sec_metafeatures["nan_rate"].tolist() == [1 / 3] * 2
+
+
+def test_featurization_with_executor(tmpdir):
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = _write_csvs(tmpdir, 4)
+
+    calls = []
+    serial = _make_featurizer(calls)
+    serial.featurize(_make_raw_gen(paths), keys=_make_keys(paths))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parallel = _make_featurizer(calls, executor=executor, chunksize=2)
+        parallel.featurize(
+            _make_raw_gen(paths), keys=_make_keys(paths), multiprocess=True
+        )
+
+    assert len(calls) == 8
+    assert parallel.sec_metafeatures.equals(serial.sec_metafeatures)
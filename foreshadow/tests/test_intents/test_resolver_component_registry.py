@@ -0,0 +1,108 @@
+"""Test the process-wide intent resolver component registry."""
+import os
+
+
+def _write_components(path, value):
+    from foreshadow.smart.intent_resolving.core import io
+
+    io.to_pickle({"model": value}, str(path))
+
+
+def test_registry_loads_components_once(tmpdir, mocker):
+    from foreshadow.smart.intent_resolving.core import io
+    from foreshadow.smart.intent_resolving.core.intent_resolver import (
+        ResolverComponentRegistry,
+    )
+
+    path = tmpdir.join("components.pkl")
+    _write_components(path, 1)
+    spy = mocker.spy(io, "from_pickle")
+
+    registry = ResolverComponentRegistry()
+    first = registry.get(str(path))
+    second = registry.get(str(path))
+
+    assert first is second
+    assert first["model"] == 1
+    assert spy.call_count == 1
+
+
+def test_registry_warm_up_and_invalidate(tmpdir):
+    from foreshadow.smart.intent_resolving.core.intent_resolver import (
+        ResolverComponentRegistry,
+    )
+
+    path = tmpdir.join("components.pkl")
+    _write_components(path, 1)
+
+    registry = ResolverComponentRegistry()
+    assert not registry.is_loaded(str(path))
+    registry.warm_up(str(path))
+    assert registry.is_loaded(str(path))
+    registry.invalidate(str(path))
+    assert not registry.is_loaded(str(path))
+
+
+def test_registry_reloads_changed_file(tmpdir):
+    from foreshadow.smart.intent_resolving.core.intent_resolver import (
+        ResolverComponentRegistry,
+    )
+
+    path = tmpdir.join("components.pkl")
+    _write_components(path, 1)
+
+    registry = ResolverComponentRegistry()
+    assert registry.get(str(path))["model"] == 1
+
+    _write_components(path, [1, 2, 3])
+    stat = os.stat(str(path))
+    os.utime(str(path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert not registry.is_loaded(str(path))
+    assert registry.get(str(path))["model"] == [1, 2, 3]
+
+
+def test_registry_missing_file(tmpdir):
+    import pytest
+    from foreshadow.smart.intent_resolving.core.intent_resolver import (
+        ResolverComponentRegistry,
+    )
+
+    registry = ResolverComponentRegistry()
+    with pytest.raises(FileNotFoundError):
+        registry.get(str(tmpdir.join("missing.pkl")))
+
+
+def test_registry_builds_derived_objects_once(tmpdir):
+    from foreshadow.smart.intent_resolving.core.intent_resolver import (
+        ResolverComponentRegistry,
+    )
+
+    path = tmpdir.join("components.pkl")
+    _write_components(path, 1)
+    builds = []
+
+    def build(components):
+        builds.append(components["model"])
+        return [components["model"]]
+
+    registry = ResolverComponentRegistry()
+    first = registry.get_derived("built", build, str(path))
+    second = registry.get_derived("built", build, str(path))
+    assert first is second
+    assert builds == [1]
+
+    registry.invalidate(str(path))
+    assert registry.get_derived("built", build, str(path)) == [1]
+    assert builds == [1, 1]
+
+
+def test_registry_instances_do_not_register_fork_hooks(mocker):
+    from foreshadow.smart.intent_resolving.core.intent_resolver import (
+        ResolverComponentRegistry,
+    )
+
+    register_at_fork = mocker.patch.object(os, "register_at_fork", create=True)
+    ResolverComponentRegistry()
+    ResolverComponentRegistry()
+    assert register_at_fork.call_count == 0
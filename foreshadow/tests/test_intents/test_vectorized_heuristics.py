@@ -0,0 +1,154 @@
+"""Test the vectorized heuristics against the reference implementations."""
+import pytest
+
+
+def _mixed_frame(n_rows=500):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.RandomState(0)
+
+    def choice(values):
+        return np.array(values, dtype="object")[
+            rng.randint(0, len(values), n_rows)
+        ]
+
+    return pd.DataFrame(
+        {
+            "zip": rng.randint(10000, 99999, n_rows).astype(str),
+            "zipcode_int": rng.randint(10000, 99999, n_rows),
+            "cad_zip": choice(["K1A 0B1", "M5V3L9", "h0h 0h0", "abc"]),
+            "money": [
+                "$%d.%02d" % (dollars, cents)
+                for dollars, cents in zip(
+                    rng.randint(0, 999, n_rows), rng.randint(0, 99, n_rows)
+                )
+            ],
+            "floats": rng.randn(n_rows),
+            "ints": rng.randint(0, 5, n_rows),
+            "text": choice(
+                [
+                    "hello world",
+                    "foo, bar",
+                    "(x)",
+                    "²³",
+                    "١٢",
+                    "½",
+                    None,
+                    "12:30 PM",
+                ]
+            ),
+            "json": choice(['{"a": 1}', "[1, 2]", "plain", None]),
+            "dates": pd.date_range("2019-01-01", periods=n_rows, freq="D"),
+            "bools": rng.rand(n_rows) > 0.5,
+            "nans": [np.nan] * n_rows,
+            "category": pd.Categorical(choice(["a", "b", None])),
+            "mixed": choice([1, 1.0, True, "1", None]),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "heuristic",
+    ["is_number_as_string", "numeric_extractable", "_maybe_zipcode"],
+)
+def test_vectorized_series_heuristics_parity(heuristic):
+    from foreshadow.smart.intent_resolving.core import (
+        heuristics,
+        vectorized_heuristics,
+    )
+
+    df = _mixed_frame()
+    for column in df:
+        expected = getattr(heuristics, heuristic)(df[column].copy())
+        result = getattr(vectorized_heuristics, heuristic)(df[column].copy())
+        assert result == expected, column
+
+
+@pytest.mark.parametrize(
+    "heuristic",
+    ["avg_val_len", "stddev_val_len", "maybe_zipcode", "contains_structure"],
+)
+def test_vectorized_frame_heuristics_parity(heuristic):
+    import pandas as pd
+    from foreshadow.smart.intent_resolving.core import (
+        heuristics,
+        vectorized_heuristics,
+    )
+
+    df = _mixed_frame()
+    expected = getattr(heuristics, heuristic)(df)
+    result = getattr(vectorized_heuristics, heuristic)(df)
+    pd.testing.assert_series_equal(result, expected, check_dtype=False)
+
+
+def test_vectorized_maybe_datetime_parity():
+    import numpy as np
+    import pandas as pd
+    from foreshadow.smart.intent_resolving.core import (
+        heuristics,
+        vectorized_heuristics,
+    )
+
+    df = _mixed_frame()
+    rng = np.random.RandomState(1)
+    metafeatures = pd.DataFrame({"attribute_name": list(df.columns)})
+    for i in range(1, 6):
+        metafeatures["sample{}".format(i)] = [
+            str(df[column].iloc[rng.randint(len(df))]) for column in df
+        ]
+    metafeatures["samples_set"] = "2019-01-01"
+    metafeatures.loc[0, "sample2"] = np.nan
+    metafeatures.loc[1, "sample3"] = "Jan 5, 2019"
+    metafeatures.loc[2, "sample4"] = "5pm"
+
+    expected = heuristics.maybe_datetime(metafeatures)
+    result = vectorized_heuristics.maybe_datetime(metafeatures)
+    pd.testing.assert_series_equal(result, expected, check_dtype=False)
+    assert result.any()
+
+
+@pytest.mark.parametrize(
+    "callable_",
+    [
+        "lambda df: hr.avg_val_len(df)",
+        "lambda df: hr.stddev_val_len(df)",
+        "lambda df: hr.maybe_zipcode(df)",
+        "lambda df: hr.contains_structure(df)",
+        "lambda df: df.apply(hr.is_number_as_string)",
+        "lambda df: df.apply(hr.numeric_extractable)",
+        "lambda df: hr.is_float_dtype(df)",
+        "lambda df: hr.has_zero_in_leading_decimals(df)",
+    ],
+)
+def test_config_callables_parity(callable_):
+    import pandas as pd
+    from foreshadow.smart.intent_resolving.core import heuristics
+    from foreshadow.smart.intent_resolving.core.secondary_featurizers import (
+        FeaturizerCurator,
+    )
+
+    # Built like the featurizers of the shipped configs, whose callables
+    # resolve `hr` in the secondary featurizers module.
+    (featurizer,) = FeaturizerCurator.from_config(
+        [
+            {
+                "callable_": callable_,
+                "method": "feature",
+                "on_raw": True,
+                "normalizable": True,
+            }
+        ]
+    )
+    (transformer,) = featurizer.featurizers
+    reference = eval(callable_, {"hr": heuristics})
+
+    df = _mixed_frame()
+    for column in df:
+        raw = df[[column]]
+        pd.testing.assert_series_equal(
+            transformer.featurize(raw.copy()),
+            reference(raw.copy()),
+            check_dtype=False,
+            check_names=False,
+        )
@@ -126,4 +126,58 @@ def test_metric_invert(retval):
     assert (1 - retval) == metric_wrapper.calculate([1, 2, 3])
 
 
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["$1", "$2", "$1", None, "abc", "$2", ""],
+        [1.5, float("nan"), None, 1.5, 3],
+        [[1], [2], [1]],
+    ],
+)
+def test_weighted_cleaner_metrics_cleans_each_value_once(mocker, values):
+    """Test the metrics computed from distinct values are unchanged."""
+    import pandas as pd
+    from foreshadow.concrete import DollarFinancialCleaner
+    from foreshadow.metrics import weighted_cleaner_metrics
+
+    X = pd.DataFrame({"col": values})
+    cleaner = DollarFinancialCleaner()
+    expected = [
+        metric_wrapper.fn(X, cleaner=cleaner.transform_row) * weight
+        for metric_wrapper, weight in cleaner.confidence_computation.items()
+    ]
+    spy = mocker.spy(cleaner, "transform_row")
+
+    scores = weighted_cleaner_metrics(
+        X, cleaner.transform_row, cleaner.confidence_computation
+    )
+
+    assert scores == pytest.approx(expected)
+    assert spy.call_count == len(X["col"].astype(str).unique())
+
+
+def test_weighted_cleaner_metrics_default_return():
+    """Test a failing cleaner falls back to the metric default return."""
+    import pandas as pd
+    from foreshadow.metrics import (
+        MetricWrapper,
+        avg_col_regex,
+        weighted_cleaner_metrics,
+    )
+
+    def cleaner(row):
+        raise ValueError
+
+    def n_rows(feature, cleaner):
+        return len(feature)
+
+    scores = weighted_cleaner_metrics(
+        pd.DataFrame({"col": ["a", "b"]}),
+        cleaner,
+        {MetricWrapper(avg_col_regex): 0.5, MetricWrapper(n_rows): 0.5},
+    )
+
+    assert scores == [0, 1]
+
+
 # TODO: write tests for intents used in internals
@@ -160,9 +160,10 @@ def test_drop_entire_data_frame():
     assert error_msg in str(excinfo.value)
 
 
-def test_drop_empty_columns():
+def test_drop_empty_columns(mocker):
     """Test drop empty columns called when expected to."""
     import pandas as pd
+    from foreshadow.concrete import DropCleaner
     from foreshadow.preparer import CleanerMapper
     from foreshadow.cachemanager import CacheManager
 
@@ -177,6 +178,11 @@ def test_drop_empty_columns():
     assert len(transformed_data.columns) == 1
     assert list(transformed_data.columns)[0] == "nums"
 
+    # The columns to drop are not cleaned again
+    drop_transform = mocker.spy(DropCleaner, "transform")
+    assert dc.transform(data).equals(transformed_data)
+    drop_transform.assert_not_called()
+
 
 def test_numerical_input():
     """Test numerical input."""
@@ -210,3 +216,518 @@ def test_numerical_input_fittransform():
 
 
 # TODO test graph, could be implemented very wrong.
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["2019-01-%02d" % (i % 28 + 1) for i in range(50)] + ["foo"],
+        ["$%d.50" % i for i in range(40)] + [None] * 10,
+        ['{"a": %d}' % i for i in range(30)],
+        [None] * 46 + ["a"] * 4,
+        list(range(50)),
+        ["", "abc", "hello world", "$", "2019/1/1"] * 10,
+    ],
+)
+def test_fused_metric_scores_pick_the_same_cleaner(values):
+    import pandas as pd
+    from foreshadow.concrete import (
+        DollarFinancialCleaner,
+        DropCleaner,
+        StandardJsonFlattener,
+        YYYYMMDDDateCleaner,
+    )
+    from foreshadow.concrete.internals.cleaners.scoring import (
+        fused_metric_scores,
+    )
+
+    def pick(cleaners, scores):
+        best_score, best_cleaner = 0, None
+        for cleaner, score in zip(cleaners, scores):
+            if score is not None and score > best_score:
+                best_score, best_cleaner = score, cleaner
+        return best_cleaner
+
+    X = pd.DataFrame({"col": values})
+    cleaners = [
+        StandardJsonFlattener(),
+        YYYYMMDDDateCleaner(),
+        DropCleaner(),
+        DollarFinancialCleaner(),
+    ]
+    expected = [cleaner.metric_score(X) for cleaner in cleaners]
+    scores = fused_metric_scores(X, cleaners)
+
+    assert pick(cleaners, scores) is pick(cleaners, expected)
+    if pick(cleaners, expected) is None:
+        assert [score for score in scores if score is not None] == [
+            expected[i] for i, score in enumerate(scores) if score is not None
+        ]
+
+
+def test_fused_metric_scores_short_circuit(mocker):
+    import pandas as pd
+    from foreshadow.concrete import DollarFinancialCleaner, DropCleaner
+    from foreshadow.concrete.internals.cleaners.scoring import (
+        fused_metric_scores,
+    )
+
+    X = pd.DataFrame({"col": ["$%d" % i for i in range(100)]})
+    drop, financial = DropCleaner(), DollarFinancialCleaner()
+    drop_spy = mocker.spy(drop, "transform_row")
+    financial_spy = mocker.spy(financial, "transform_row")
+
+    scores = fused_metric_scores(X, [drop, financial])
+
+    # The drop cleaner is scored without cleaning the rows, and the scan
+    # stops since the financial cleaner is the only one left.
+    assert scores[0] == 0 and scores[1] > 0
+    assert drop_spy.call_count == 0
+    assert financial_spy.call_count == 1
+
+
+def test_fused_metric_scores_custom_metric_score():
+    import pandas as pd
+    from foreshadow.concrete import DropCleaner
+    from foreshadow.concrete.internals.cleaners.base import BaseCleaner
+    from foreshadow.concrete.internals.cleaners.scoring import (
+        fused_metric_scores,
+    )
+
+    class CustomCleaner(BaseCleaner):
+        def __init__(self):
+            super().__init__([lambda x: (x, 1)])
+
+        def metric_score(self, X):
+            return 0.5
+
+    X = pd.DataFrame({"col": [None] * 10})
+    scores = fused_metric_scores(X, [CustomCleaner(), DropCleaner()])
+
+    # The scan stops as soon as the drop cleaner is known to score higher
+    assert scores[0] == 0.5
+    assert scores[1] >= 0.9
+
+
+@pytest.mark.parametrize(
+    "cleaner_class",
+    ["YYYYMMDDDateCleaner", "DollarFinancialCleaner", "DropCleaner"],
+)
+def test_transform_series_matches_transform_row(cleaner_class):
+    import numpy as np
+    import pandas as pd
+    from foreshadow import concrete
+    from foreshadow.concrete.internals.cleaners.base import BaseCleaner
+
+    series = pd.Series(
+        [
+            "$5",
+            "-$3.0abc",
+            "$12.\n",
+            "$1\nx",
+            "2019-01-02",
+            "x2019/12/31y",
+            "2019-01-02\n",
+            "1999-1-1",
+            "",
+            None,
+            np.nan,
+            3,
+            4.5,
+        ],
+        index=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 11],
+        name="col",
+    )
+    cleaner = getattr(concrete, cleaner_class)()
+
+    values, match_lens = cleaner.transform_series(series)
+    row_values, row_match_lens = BaseCleaner.transform_series(cleaner, series)
+
+    if isinstance(values, pd.DataFrame):
+        row_values = pd.DataFrame([*row_values], index=series.index)
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(values).astype(object).fillna("nan"),
+        pd.DataFrame(row_values).astype(object).fillna("nan"),
+    )
+    pd.testing.assert_series_equal(match_lens, row_match_lens)
+
+
+def test_transform_falls_back_to_rows():
+    import pandas as pd
+    from foreshadow.concrete.internals.cleaners.customizable_base import (
+        CustomizableBaseCleaner,
+    )
+
+    class UpperCleaner(CustomizableBaseCleaner):
+        def __init__(self):
+            super().__init__(transformation=lambda text: text.upper())
+
+        def metric_score(self, X):
+            return 1
+
+    series = pd.Series(["a", "B"])
+    values, match_lens = UpperCleaner().transform_series(series)
+
+    assert values.tolist() == ["A", "B"]
+    assert match_lens.tolist() == [1, 0]
+    assert UpperCleaner().transform(pd.DataFrame({"col": series}))[
+        "col"
+    ].tolist() == ["A", "B"]
+
+
+def test_transform_series_cleans_distinct_values_once():
+    import numpy as np
+    import pandas as pd
+    from foreshadow.concrete.internals.cleaners.customizable_base import (
+        CustomizableBaseCleaner,
+    )
+
+    calls = []
+
+    class ListCleaner(CustomizableBaseCleaner):
+        def __init__(self):
+            super().__init__(transformation=self.split)
+
+        @staticmethod
+        def split(text):
+            calls.append(text)
+            return str(text).split("-")
+
+        def metric_score(self, X):
+            return 1
+
+    series = pd.Series(
+        ["a-b", "c-d", None, "a-b", np.nan, "a-b"] * 4,
+        index=[0, 1] * 12,
+        name="col",
+    )
+    values, match_lens = ListCleaner().transform_series(series)
+
+    assert len(calls) == 2 + 8
+    expected = [
+        ["a", "b"],
+        ["c", "d"],
+        ["None"],
+        ["a", "b"],
+        ["nan"],
+        ["a", "b"],
+    ]
+    assert values.tolist() == expected * 4
+    assert values.index.equals(series.index)
+    assert values.name == match_lens.name == "col"
+
+    rows = ListCleaner()
+    rows.unique_ratio_threshold = None
+    expected_values, expected_match_lens = rows.transform_series(series)
+    assert values.equals(expected_values)
+    assert match_lens.equals(expected_match_lens)
+    assert len(calls) == 10 + 24
+
+    X = pd.DataFrame({"col": series.dropna().reset_index(drop=True)})
+    assert ListCleaner().transform(X).equals(rows.transform(X))
+
+
+@pytest.mark.parametrize(
+    "series,factorized",
+    [
+        (["a", "b"] * 5, True),
+        (list(range(10)), False),
+        ([1, 2] * 5, True),
+        ([1.0, 2.0] * 5, False),
+        ([0.0, -0.0] * 5, False),
+    ],
+)
+def test_transform_series_factorizes_few_distinct_values(series, factorized):
+    import pandas as pd
+    from foreshadow.concrete.internals.cleaners.base import BaseCleaner
+
+    cleaner = BaseCleaner([lambda row: (str(row), 1)])
+
+    assert (cleaner._factorize(pd.Series(series)) is not None) == factorized
+
+
+@pytest.mark.parametrize(
+    "output_schema,output_columns,rows,expected",
+    [
+        (None, None, ["a", "b"], {"col": ["a", "b"]}),
+        (
+            "list",
+            None,
+            [["a", 1], ["b", 2]],
+            {"col0": ["a", "b"], "col1": [1, 2]},
+        ),
+        (
+            "list",
+            ["x", "y"],
+            [("a", 1), ("b", 2)],
+            {"x": ["a", "b"], "y": [1, 2]},
+        ),
+        (
+            None,
+            None,
+            [{"a": 1}, {"b": 2.0}],
+            {"col_a": [1, None], "col_b": [None, 2.0]},
+        ),
+        ("dict", ["b"], [{"a": 1}, {"b": 2.0}], {"col_b": [None, 2.0]}),
+        ("dict", None, [{"a": 1}, None], {"col_a": [1.0, None]}),
+    ],
+)
+def test_transform_output_schema(
+    output_schema, output_columns, rows, expected
+):
+    import pandas as pd
+    from foreshadow.concrete.internals.cleaners.base import BaseCleaner
+
+    class SchemaCleaner(BaseCleaner):
+        def transform_series(self, series):
+            return pd.Series(rows, index=series.index), None
+
+    SchemaCleaner.output_schema = output_schema
+    cleaner = SchemaCleaner([], output_columns=output_columns)
+    X = pd.DataFrame({"col": ["r0", "r1"]}, index=[3, 1])
+
+    assert cleaner.transform(X).equals(pd.DataFrame(expected, index=X.index))
+
+
+def test_transform_declared_output_schema_skips_probing(mocker):
+    import pandas as pd
+    from foreshadow.concrete import DollarFinancialCleaner
+    from foreshadow.concrete.internals.cleaners import base
+
+    find = mocker.patch.object(base, "_find_output_schema")
+    X = pd.DataFrame({"col": ["$1.00", "$2.50"]})
+
+    assert DollarFinancialCleaner().transform(X)["col"].tolist() == [
+        "1.00",
+        "2.50",
+    ]
+    find.assert_not_called()
+
+
+def test_transform_list_output_of_different_lengths():
+    import pandas as pd
+    from foreshadow.concrete.internals.cleaners.base import BaseCleaner
+    from foreshadow.exceptions import InvalidDataFrame
+
+    cleaner = BaseCleaner([lambda row: (row.split("-"), 1)])
+    cleaner.unique_ratio_threshold = None
+    X = pd.DataFrame({"col": ["a-b", "c-d", "e", "f-g"]})
+
+    with pytest.raises(InvalidDataFrame):
+        cleaner.transform(X)
+
+
+def test_json_flattener_parses_each_text_once(mocker):
+    import pandas as pd
+    from foreshadow.concrete import StandardJsonFlattener
+    from foreshadow.concrete.internals.cleaners import json_flattener
+
+    loads = mocker.spy(json_flattener.json, "loads")
+    X = pd.DataFrame({"col": ['{"a": 1}', '{"a": 2, "b": 3}']})
+    flattener = StandardJsonFlattener()
+
+    flattener.metric_score(X)
+    out = flattener.fit(X).transform(X)
+
+    assert loads.call_count == 2
+    assert out["col_b"].tolist()[1] == 3
+    assert flattener._parsed == {}
+
+    flattener.transform(X)
+    assert loads.call_count == 4
+
+
+@pytest.mark.parametrize(
+    "params,expected",
+    [
+        (
+            {},
+            {
+                "col_a": [1, 2, None, None],
+                "col_b_c": [2, None, None, None],
+                "col_b_d_e": [3, None, None, None],
+                "col_f": [None, [1, 2], None, None],
+                "col": [None, None, [1, 2], None],
+            },
+        ),
+        (
+            {"max_depth": 1},
+            {
+                "col_a": [1, 2, None, None],
+                "col_b": [{"c": 2, "d": {"e": 3}}, None, None, None],
+                "col_f": [None, [1, 2], None, None],
+                "col": [None, None, [1, 2], None],
+            },
+        ),
+        (
+            {"max_depth": 2, "max_keys": 3},
+            {
+                "col_a": [1, 2, None, None],
+                "col_b_c": [2, None, None, None],
+                "col_b_d": [{"e": 3}, None, None, None],
+            },
+        ),
+    ],
+)
+def test_columnar_json_flattener(params, expected):
+    import numpy as np
+    import pandas as pd
+    from foreshadow.concrete import ColumnarJsonFlattener
+
+    X = pd.DataFrame(
+        {
+            "col": [
+                '{"a": 1, "b": {"c": 2, "d": {"e": 3}}}',
+                '{"a": 2, "f": [1, 2]}',
+                "[1, 2]",
+                None,
+            ]
+        },
+        index=[3, 2, 1, 0],
+    )
+    flattener = ColumnarJsonFlattener(**params)
+
+    flattener.metric_score(X)
+    out = flattener.fit(X).transform(X)
+
+    assert list(out.columns) == list(expected)
+    assert out.index.equals(X.index)
+    for column, values in expected.items():
+        assert [
+            None if isinstance(value, float) and np.isnan(value) else value
+            for value in out[column]
+        ] == values
+
+    # The columns found in fit are kept for other data
+    other = flattener.transform(pd.DataFrame({"col": ['{"g": 1}']}))
+    assert list(other.columns) == list(expected)
+    assert other.isna().all(axis=None)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [None] * 9 + ["a"],
+        [float("nan")] * 8 + [""] + ["a"],
+        [None] * 8 + ["a", "b"],
+        ["", "a"] * 5,
+        [],
+    ],
+)
+def test_drop_cleaner_metric_score(values):
+    import pandas as pd
+    from foreshadow.concrete import DropCleaner
+    from foreshadow.metrics import weighted_cleaner_metrics
+
+    cleaner = DropCleaner()
+    X = pd.DataFrame({"col": values}, dtype=object)
+
+    expected = 0
+    if values:
+        expected = sum(
+            weighted_cleaner_metrics(
+                X, cleaner.transform_row, cleaner.confidence_computation
+            )
+        )
+    assert cleaner.metric_score(X) == (expected if expected >= 0.9 else 0)
+
+
+def test_cleaner_picks_drop_cleaner_first(mocker):
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.concrete import DropCleaner
+    from foreshadow.smart import Cleaner
+    from foreshadow.smart import cleaner as smart_cleaner
+
+    fused = mocker.spy(smart_cleaner, "fused_metric_scores")
+    cleaner = Cleaner(cache_manager=CacheManager())
+
+    picked = cleaner.pick_transformer(pd.DataFrame({"col": [None] * 10}))
+    assert isinstance(picked, DropCleaner)
+    fused.assert_not_called()
+
+    cleaner.pick_transformer(pd.DataFrame({"col": ["$1", None]}))
+    assert fused.call_count == 1
+    assert not any(isinstance(c, DropCleaner) for c in fused.call_args[0][1])
+
+
+def _make_vectorized_cleaner(input_type, calls):
+    import numpy as np
+    from foreshadow.concrete.internals.cleaners.customizable_base import (
+        VectorizedCustomizableBaseCleaner,
+    )
+
+    def strip_hashes(column):
+        calls.append(type(column))
+        text = np.asarray(column, dtype=str)
+        matched = np.char.startswith(text, "#")
+        values = np.where(matched, np.char.lstrip(text, "#"), column)
+        return values, matched.astype(int)
+
+    class HashStripper(VectorizedCustomizableBaseCleaner):
+        def __init__(self):
+            super().__init__(strip_hashes, input_type=input_type)
+
+    return HashStripper()
+
+
+@pytest.mark.parametrize("input_type", ["series", "object", "str"])
+def test_vectorized_customizable_cleaner(input_type):
+    import numpy as np
+    import pandas as pd
+    from foreshadow.metrics import weighted_cleaner_metrics
+
+    calls = []
+    cleaner = _make_vectorized_cleaner(input_type, calls)
+    X = pd.DataFrame({"col": ["#1", "2", "#3", "#4"]}, index=[3, 2, 1, 0])
+
+    assert cleaner.metric_score(X) == sum(
+        weighted_cleaner_metrics(
+            X, cleaner.transform_row, cleaner.confidence_computation
+        )
+    )
+    out = cleaner.transform(X)
+    assert out["col"].tolist() == ["1", "2", "3", "4"]
+    assert out.index.equals(X.index)
+    assert cleaner.transform_row("#5") == ("5", [1])
+    assert calls[0] is {"series": pd.Series, "object": np.ndarray}.get(
+        input_type, np.ndarray
+    )
+
+
+def test_vectorized_customizable_cleaner_invalid_output():
+    import pandas as pd
+    from foreshadow.concrete.internals.cleaners.customizable_base import (
+        VectorizedCustomizableBaseCleaner,
+    )
+
+    with pytest.raises(ValueError):
+        VectorizedCustomizableBaseCleaner(lambda column: column, "list")
+
+    cleaner = VectorizedCustomizableBaseCleaner(
+        lambda column: (column[:1], [1] * len(column))
+    )
+    with pytest.raises(ValueError):
+        cleaner.transform(pd.DataFrame({"col": ["a", "b"]}))
+
+
+def test_cleaner_scores_vectorized_customized_cleaner_at_once():
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.smart import Cleaner
+    from foreshadow.utils import AcceptedKey, ConfigKey
+
+    calls = []
+    cleaner = _make_vectorized_cleaner("series", calls)
+    cache_manager = CacheManager()
+    cache_manager[AcceptedKey.CUSTOMIZED_TRANSFORMERS][
+        ConfigKey.CUSTOMIZED_CLEANERS
+    ] = [type(cleaner)]
+    X = pd.DataFrame({"col": ["#%d" % i for i in range(100)]})
+
+    smart_cleaner = Cleaner(cache_manager=cache_manager).fit(X)
+
+    assert isinstance(smart_cleaner.transformer, type(cleaner))
+    assert len(calls) == 1
+    assert smart_cleaner.transform(X)["col"].tolist()[:2] == ["0", "1"]
+    assert len(calls) == 2
@@ -514,3 +514,23 @@ def test_smart_text_wrong_intent():
     with pytest.raises(ValueError) as e:
         encoder1.fit(X1)
         assert "empty vocabulary" in str(e)
+
+
+@pytest.mark.parametrize("enable_sparse_output", [True, False])
+def test_smart_keep_sparse_outputs(smart_child, enable_sparse_output):
+    import pandas as pd
+
+    from foreshadow.utils import ConfigKey
+
+    manager = CacheManager()
+    manager[AcceptedKey.CONFIG][
+        ConfigKey.ENABLE_SPARSE_OUTPUT
+    ] = enable_sparse_output
+
+    smart = smart_child(cache_manager=manager)
+    smart.fit(pd.DataFrame({"a": [1.0, 2.0, 3.0]}))
+
+    assert (
+        getattr(smart.transformer, "keep_sparse", False)
+        == enable_sparse_output
+    )
@@ -224,3 +224,142 @@ def test_data_sampling():
         len(df_large)
         * cache_manager[AcceptedKey.CONFIG][ConfigKey.SAMPLING_FRACTION]
     )
+
+
+def test_data_sampling_uses_shared_row_sample():
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.utils import ConfigKey, DataSamplingMixin, RowSampler
+
+    class DummyTransformer(DataSamplingMixin):
+        def __init__(self, cache_manager):
+            self.cache_manager = cache_manager
+
+    cache_manager = CacheManager()
+    cache_manager[AcceptedKey.CONFIG][ConfigKey.SAMPLING_RANDOM_STATE] = 0
+    df = pd.DataFrame({"a": np.arange(50000), "b": np.arange(50000)})
+    positions = RowSampler(cache_manager).draw(df)
+
+    transformer = DummyTransformer(cache_manager=cache_manager)
+    sampled_a = transformer.sample_data_frame(df[["a"]])
+    sampled_b = transformer.sample_data_frame(df[["b"]])
+
+    assert len(positions) == 10000
+    np.testing.assert_array_equal(sampled_a.index, sampled_b.index)
+    np.testing.assert_array_equal(sampled_a["a"].values, positions)
+    # A frame of another size is sampled independently
+    assert len(transformer.sample_data_frame(df.iloc[:20000])) == 10000
+    assert RowSampler.shared_positions(cache_manager, 20000) is None
+
+    RowSampler(cache_manager).clear()
+    assert RowSampler.shared_positions(cache_manager, len(df)) is None
+
+
+def test_row_sampler_keeps_positions_out_of_cache_manager():
+    import copy
+    import pickle
+
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.utils import ConfigKey, RowSampler
+
+    cache_manager = CacheManager()
+    cache_manager[AcceptedKey.CONFIG][ConfigKey.SAMPLING_RANDOM_STATE] = 0
+    df = pd.DataFrame({"a": np.arange(50000)})
+    positions = RowSampler(cache_manager).draw(df)
+
+    copied = copy.deepcopy(cache_manager)
+    assert len(pickle.dumps(copied)) < positions.nbytes
+    assert RowSampler.shared_positions(copied, len(df)) is positions
+
+    RowSampler(cache_manager).clear()
+    # The copies do not keep the positions alive once the sample is cleared
+    assert RowSampler.shared_positions(copied, len(df)) is None
+
+
+def test_row_sampler_draws_sample_again_in_other_process(mocker):
+    import copy
+    import os
+
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.utils import ConfigKey, RowSampler
+
+    cache_manager = CacheManager()
+    cache_manager[AcceptedKey.CONFIG][ConfigKey.SAMPLING_RANDOM_STATE] = 0
+    df = pd.DataFrame({"a": np.arange(50000)})
+    sampler = RowSampler(cache_manager)
+    positions = sampler.draw(df)
+    # What a step sent to a worker process gets
+    copied = copy.deepcopy(cache_manager)
+    sampler.clear()
+
+    mocker.patch("os.getpid", return_value=os.getpid() + 1)
+    np.testing.assert_array_equal(
+        RowSampler.shared_positions(copied, len(df)), positions
+    )
+
+
+@pytest.mark.parametrize("strategy", ["uniform", "stratified", "reservoir"])
+def test_row_sampler_strategies(strategy):
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.utils import ConfigKey, RowSampler
+
+    cache_manager = CacheManager()
+    cache_manager[AcceptedKey.CONFIG][ConfigKey.SAMPLING_STRATEGY] = strategy
+    cache_manager[AcceptedKey.CONFIG][ConfigKey.SAMPLING_RANDOM_STATE] = 0
+    df = pd.DataFrame({"a": np.arange(40000)})
+    y = pd.Series(np.where(np.arange(40000) % 10 == 0, "rare", "common"))
+
+    positions = RowSampler(cache_manager).draw(df, y)
+    same_positions = RowSampler(cache_manager).draw(df, y)
+
+    np.testing.assert_array_equal(positions, same_positions)
+    assert len(np.unique(positions)) == len(positions)
+    assert abs(len(positions) - 10000) <= 1
+    if strategy == "stratified":
+        assert (y.values[positions] == "rare").sum() == 1000
+
+
+def test_reservoir_sample_positions_is_uniform():
+    import numpy as np
+    from foreshadow.utils.sampling import reservoir_sample_positions
+
+    counts = np.zeros(100)
+    for seed in range(2000):
+        counts[reservoir_sample_positions([30, 30, 40], 10, seed)] += 1
+
+    # Each row is kept with probability 10 / 100
+    assert np.all(np.abs(counts / 2000 - 0.1) < 0.04)
+
+
+def test_data_preparer_clears_row_sample(mocker):
+    import numpy as np
+    import pandas as pd
+    from foreshadow.cachemanager import CacheManager
+    from foreshadow.preparer import DataPreparer
+    from foreshadow.utils import ConfigKey, ProblemType, RowSampler
+
+    cache_manager = CacheManager()
+    cache_manager[AcceptedKey.CONFIG][
+        ConfigKey.SAMPLING_DATASET_SIZE_THRESHOLD
+    ] = 100
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame({"a": rng.randn(300), "b": rng.randn(300)})
+    y = pd.DataFrame({"y": rng.randn(300)})
+    clear = mocker.spy(RowSampler, "clear")
+
+    preparer = DataPreparer(
+        cache_manager=cache_manager, problem_type=ProblemType.REGRESSION
+    )
+    preparer.fit_transform(X, y)
+
+    # Once before drawing the sample and once at the end of the fit
+    assert clear.call_count == 2
+    assert cache_manager[AcceptedKey.SAMPLE] == {}
+    assert RowSampler.shared_positions(cache_manager, len(X)) is None
@@ -17,6 +17,7 @@ from foreshadow.utils.constants import (
     DefaultConfig,
     EstimatorFamily,
     ProblemType,
+    SamplingStrategy,
 )
 from foreshadow.utils.data_summary import (
     get_outliers,
@@ -25,6 +26,7 @@ from foreshadow.utils.data_summary import (
 )
 from foreshadow.utils.default_estimator_factory import EstimatorFactory
 from foreshadow.utils.override_substitute import Override
+from foreshadow.utils.sampling import RowSampler
 from foreshadow.utils.sklearn_wrappers import TruncatedSVDWrapper
 from foreshadow.utils.testing import dynamic_import
 from foreshadow.utils.validation import (
@@ -33,6 +35,7 @@ from foreshadow.utils.validation import (
     check_module_installed,
     check_series,
     check_transformer_imports,
+    is_sparse_frame,
     is_transformer,
     is_wrapped,
 )
@@ -43,11 +46,14 @@ __all__ = [
     "get_config_path",
     "get_transformer",
     "DataSamplingMixin",
+    "RowSampler",
+    "SamplingStrategy",
     "PipelineStep",
     "check_df",
     "check_series",
     "check_module_installed",
     "check_transformer_imports",
+    "is_sparse_frame",
     "is_transformer",
     "is_wrapped",
     "dynamic_import",
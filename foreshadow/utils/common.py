@@ -10,6 +10,7 @@ from sklearn.base import BaseEstimator, TransformerMixin
 from foreshadow.exceptions import TransformerNotFound
 from foreshadow.utils.constants import AcceptedKey, ConfigKey
 from foreshadow.utils.override_substitute import Override
+from foreshadow.utils.sampling import RowSampler, number_of_rows_to_sample
 
 
 CONFIG_DIR = "~/.foreshadow"
@@ -110,6 +111,9 @@ class DataSamplingMixin:
         Otherwise, choose between the maximum of 10000 and 20% of the number
         of rows in the dataset.
 
+        The row sample drawn by the DataPreparer for the current fit is used
+        when it exists, so that every smart step looks at the same rows.
+
         Args:
             df: the data frame
 
@@ -117,30 +121,15 @@ class DataSamplingMixin:
             a sampled data frame.
 
         """
-        if (
-            not self.cache_manager[AcceptedKey.CONFIG][
-                ConfigKey.ENABLE_SAMPLING
-            ]
-            or len(df)
-            < self.cache_manager[AcceptedKey.CONFIG][
-                ConfigKey.SAMPLING_DATASET_SIZE_THRESHOLD
-            ]
-        ):
-            return df
+        positions = RowSampler.shared_positions(self.cache_manager, len(df))
+        if positions is not None:
+            return df.iloc[positions]
 
-        number_of_rows_to_sample = max(
-            self.cache_manager[AcceptedKey.CONFIG][
-                ConfigKey.SAMPLING_DATASET_SIZE_THRESHOLD
-            ],
-            int(
-                len(df)
-                * self.cache_manager[AcceptedKey.CONFIG][
-                    ConfigKey.SAMPLING_FRACTION
-                ]
-            ),
-        )
+        number_of_rows = number_of_rows_to_sample(self.cache_manager, len(df))
+        if number_of_rows is None:
+            return df
         return df.sample(
-            n=number_of_rows_to_sample,
+            n=number_of_rows,
             replace=self.cache_manager[AcceptedKey.CONFIG][
                 ConfigKey.SAMPLING_WITH_REPLACEMENT
             ],
@@ -10,7 +10,15 @@ class DefaultConfig:
     SAMPLING_DATASET_SIZE_THRESHOLD = 10000
     SAMPLING_WITH_REPLACEMENT = False
     SAMPLING_FRACTION = 0.2
+    SAMPLING_STRATEGY = "uniform"
+    SAMPLING_RANDOM_STATE = None
     N_JOBS = 1
+    ENABLE_INTENT_CACHE = False
+    INTENT_CACHE_TTL = 7 * 24 * 60 * 60  # One week, in seconds
+    INTENT_CACHE_MAX_ENTRIES = 10000
+    ENABLE_INCREMENTAL_INTENT_RESOLUTION = False
+    INTENT_DRIFT_TOLERANCE = 0.1
+    ENABLE_SPARSE_OUTPUT = False
     # It is unclear what is the best value. The default value in Sklearn is 2,
     # which may not be enough.
     N_COMPONENTS_SVD = 20
@@ -23,6 +31,14 @@ class ProblemType:
     REGRESSION = "regression"
 
 
+class SamplingStrategy:
+    """Constants for the strategies of the shared row sample."""
+
+    UNIFORM = "uniform"
+    STRATIFIED = "stratified"
+    RESERVOIR = "reservoir"
+
+
 class EstimatorFamily:
     """Constants for estimator families."""
 
@@ -39,10 +55,20 @@ class ConfigKey:
     ENABLE_SAMPLING = "enable_sampling"
     SAMPLING_WITH_REPLACEMENT = "with_replacement"
     SAMPLING_FRACTION = "sampling_fraction"
+    SAMPLING_STRATEGY = "sampling_strategy"
+    SAMPLING_RANDOM_STATE = "sampling_random_state"
     N_JOBS = "n_jobs"
     PROCESSED_TRAINING_DATA_EXPORT_PATH = "processed_training_data_export_path"
     PROCESSED_TEST_DATA_EXPORT_PATH = "processed_test_data_export_path"
     CUSTOMIZED_CLEANERS = "customized_cleaners"
+    ENABLE_INTENT_CACHE = "enable_intent_cache"
+    INTENT_CACHE_TTL = "intent_cache_ttl"
+    INTENT_CACHE_MAX_ENTRIES = "intent_cache_max_entries"
+    ENABLE_INCREMENTAL_INTENT_RESOLUTION = (
+        "enable_incremental_intent_resolution"
+    )
+    INTENT_DRIFT_TOLERANCE = "intent_drift_tolerance"
+    ENABLE_SPARSE_OUTPUT = "enable_sparse_output"
 
 
 class AcceptedKey:
@@ -56,6 +82,7 @@ class AcceptedKey:
     OVERRIDE = "override"
     CONFIG = "config"
     CUSTOMIZED_TRANSFORMERS = "customized_transformers"
+    SAMPLE = "sample"
 
 
 class Constant:
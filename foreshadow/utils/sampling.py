@@ -0,0 +1,270 @@
+"""Row sample shared by the smart decision steps of a DataPreparer."""
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+from sklearn.utils import check_random_state
+
+from foreshadow.utils.constants import AcceptedKey, ConfigKey, SamplingStrategy
+
+
+# Keys of the shared row sample in CacheManager[AcceptedKey.SAMPLE]
+_TOKEN = "token"
+_PID = "pid"
+_SEED = "seed"
+_N_ROWS = "n_rows"
+_SIZE = "size"
+# Positions of the row samples drawn in this process, keyed by token. They
+# are kept out of the cache manager, which is deep copied into every
+# transformer and pickled with the fitted model.
+_drawn_positions = {}
+# Last row sample drawn again in another process than the one of the fit
+_redrawn_positions = {}
+# Number of rows processed at once by the reservoir strategy
+_RESERVOIR_CHUNK_SIZE = 100000
+
+
+def number_of_rows_to_sample(cache_manager, n_rows):
+    """Get the size of the row sample configured in a cache manager.
+
+    If sampling is disabled or the dataset has less rows than the sampling
+    threshold, the whole dataset is used. Otherwise, the maximum of the
+    threshold and of the sampling fraction of the rows is sampled.
+
+    Args:
+        cache_manager: the cache manager holding the configuration.
+        n_rows: the number of rows of the dataset.
+
+    Returns:
+        int: the number of rows to sample, or None to use every row.
+
+    """
+    config = cache_manager[AcceptedKey.CONFIG]
+    threshold = config[ConfigKey.SAMPLING_DATASET_SIZE_THRESHOLD]
+    if not config[ConfigKey.ENABLE_SAMPLING] or n_rows < threshold:
+        return None
+    return max(threshold, int(n_rows * config[ConfigKey.SAMPLING_FRACTION]))
+
+
+def reservoir_sample_positions(chunk_lengths, k, random_state=None):
+    """Sample `k` row positions uniformly from a stream of chunks.
+
+    Implements the reservoir sampling algorithm R, vectorized over each
+    chunk, so that the number of rows does not need to be known in advance
+    and only the reservoir is kept in memory.
+
+    Args:
+        chunk_lengths: an iterable of the number of rows of each chunk.
+        k: the size of the reservoir.
+        random_state: a seed or a numpy RandomState.
+
+    Returns:
+        np.ndarray: the sorted sampled positions, fewer than `k` if the
+            stream has less than `k` rows.
+
+    """
+    rng = check_random_state(random_state)
+    reservoir = np.empty(k, dtype=np.int64)
+    n_seen = 0
+    for length in chunk_lengths:
+        positions = np.arange(n_seen, n_seen + length, dtype=np.int64)
+        n_fill = max(0, min(k - n_seen, length))
+        stop = n_seen + n_fill
+        reservoir[n_seen:stop] = positions[:n_fill]
+        candidates = positions[n_fill:]
+        if len(candidates):
+            slots = rng.random_sample(len(candidates)) * (candidates + 1)
+            slots = slots.astype(np.int64)
+            replace = slots < k
+            # With repeated slots the last assignment wins, which is what
+            # the sequential algorithm does.
+            reservoir[slots[replace]] = candidates[replace]
+        n_seen += length
+    return np.sort(reservoir[: min(k, n_seen)])
+
+
+def stratified_sample_positions(y, k, random_state=None):
+    """Sample `k` row positions preserving the proportions of `y`.
+
+    Each class gets a share of the sample proportional to its frequency,
+    and at least one row.
+
+    Args:
+        y: the labels to stratify the sample on. If there are several
+            label columns, the first one is used.
+        k: the size of the sample.
+        random_state: a seed or a numpy RandomState.
+
+    Returns:
+        np.ndarray: the sorted sampled positions.
+
+    """
+    rng = check_random_state(random_state)
+    y = np.asarray(y)
+    codes, _ = pd.factorize(y[:, 0] if y.ndim > 1 else y)
+    counts = np.bincount(codes + 1)[1:]
+    shares = np.maximum(
+        1, np.round(counts * (k / max(len(codes), 1))).astype(np.int64)
+    )
+    shares = np.minimum(shares, counts)
+
+    # Shuffle the rows then group them by class, keeping the shuffled
+    # order within each class, and take the first rows of each class.
+    permutation = rng.permutation(len(codes))
+    order = permutation[np.argsort(codes[permutation], kind="mergesort")]
+    order = order[codes[order] >= 0]  # NaN labels are not sampled
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank = np.arange(len(order)) - np.repeat(starts, counts)
+    return np.sort(order[rank < np.repeat(shares, counts)])
+
+
+def _sample_positions(config, n_rows, k, seed, y=None):
+    """Sample `k` row positions with the strategy configured.
+
+    Args:
+        config: the configuration of a cache manager.
+        n_rows: the number of rows of the dataset.
+        k: the size of the sample.
+        seed: the seed of the sample.
+        y: the labels, used by the stratified strategy.
+
+    Returns:
+        np.ndarray: the sorted sampled positions.
+
+    Raises:
+        ValueError: if the configured sampling strategy is unknown.
+
+    """
+    strategy = config[ConfigKey.SAMPLING_STRATEGY]
+    random_state = check_random_state(seed)
+    if config[ConfigKey.SAMPLING_WITH_REPLACEMENT]:
+        # Only the uniform strategy can sample with replacement
+        return np.sort(random_state.randint(0, n_rows, k))
+    elif strategy == SamplingStrategy.UNIFORM or (
+        strategy == SamplingStrategy.STRATIFIED and y is None
+    ):
+        return np.sort(random_state.choice(n_rows, k, replace=False))
+    elif strategy == SamplingStrategy.STRATIFIED:
+        return stratified_sample_positions(y, k, random_state)
+    elif strategy == SamplingStrategy.RESERVOIR:
+        chunk_lengths = [_RESERVOIR_CHUNK_SIZE] * (
+            n_rows // _RESERVOIR_CHUNK_SIZE
+        ) + [n_rows % _RESERVOIR_CHUNK_SIZE]
+        return reservoir_sample_positions(chunk_lengths, k, random_state)
+    raise ValueError(
+        "Unknown sampling strategy {}. Valid strategies are {}, {} "
+        "and {}.".format(
+            strategy,
+            SamplingStrategy.UNIFORM,
+            SamplingStrategy.STRATIFIED,
+            SamplingStrategy.RESERVOIR,
+        )
+    )
+
+
+class RowSampler:
+    """Draw one row sample per fit and share it through the cache manager.
+
+    The smart decision steps only need a sample of the rows to pick their
+    transformers. Drawing the sample once per fit, instead of once per
+    column and per step, is faster and makes every step look at the same
+    rows. The sample is used by `DataSamplingMixin.sample_data_frame`.
+
+    The cache manager is copied into every transformer, so it only holds
+    the seed and the size of the sample, in
+    `cache_manager[AcceptedKey.SAMPLE]`. The sampled positions are kept in
+    the process that drew them until `clear` is called, and are drawn again
+    from the seed in the other processes.
+
+    Params:
+        cache_manager: the cache manager holding the sampling configuration
+            and the shared sample.
+
+    """
+
+    def __init__(self, cache_manager):
+        self.cache_manager = cache_manager
+
+    def draw(self, X, y=None):
+        """Draw the row sample of a data frame and share it.
+
+        Args:
+            X: the data frame to sample.
+            y: the labels, used by the stratified strategy.
+
+        Returns:
+            np.ndarray: the sampled positions, or None if every row is used.
+
+        """
+        self.clear()
+        n_rows = len(X)
+        k = number_of_rows_to_sample(self.cache_manager, n_rows)
+        if k is None:
+            return None
+
+        config = self.cache_manager[AcceptedKey.CONFIG]
+        seed = check_random_state(
+            config[ConfigKey.SAMPLING_RANDOM_STATE]
+        ).randint(np.iinfo(np.int32).max)
+        positions = _sample_positions(config, n_rows, k, seed, y)
+
+        token = uuid.uuid4().hex
+        _drawn_positions[token] = positions
+        self.cache_manager[AcceptedKey.SAMPLE].update(
+            {
+                _TOKEN: token,
+                _PID: os.getpid(),
+                _SEED: seed,
+                _N_ROWS: n_rows,
+                _SIZE: k,
+            }
+        )
+        return positions
+
+    def clear(self):
+        """Remove the shared row sample."""
+        sample = self.cache_manager[AcceptedKey.SAMPLE]
+        _drawn_positions.pop(sample.get(_TOKEN), None)
+        for key in (_TOKEN, _PID, _SEED, _N_ROWS, _SIZE):
+            sample.pop(key, None)
+
+    @staticmethod
+    def shared_positions(cache_manager, n_rows):
+        """Get the shared row sample of a data frame.
+
+        The sample is shared with the data frames of the current fit, which
+        have as many rows as the sampled one.
+
+        Args:
+            cache_manager: the cache manager holding the shared sample.
+            n_rows: the number of rows of the data frame to sample.
+
+        Returns:
+            np.ndarray: the sampled positions, or None if no sample was
+                drawn for a data frame of this size.
+
+        """
+        sample = cache_manager[AcceptedKey.SAMPLE]
+        if sample.get(_N_ROWS) != n_rows:
+            return None
+
+        token = sample[_TOKEN]
+        positions = _drawn_positions.get(token)
+        if positions is None and sample[_PID] != os.getpid():
+            # A step running in another process, e.g. with n_jobs. The
+            # labels are not available there, so the stratified strategy
+            # falls back to the uniform one.
+            positions = _redrawn_positions.get(token)
+            if positions is None:
+                positions = _sample_positions(
+                    cache_manager[AcceptedKey.CONFIG],
+                    n_rows,
+                    sample[_SIZE],
+                    sample[_SEED],
+                )
+                _redrawn_positions.clear()
+                _redrawn_positions[token] = positions
+        # None if the sample was cleared, e.g. at the end of the fit in a
+        # copy of the cache manager held by a fitted transformer
+        return positions
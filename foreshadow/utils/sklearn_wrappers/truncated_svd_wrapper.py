@@ -2,10 +2,31 @@
 from sklearn.decomposition import TruncatedSVD
 
 from foreshadow.logging import logging
+from foreshadow.utils.validation import is_sparse_frame
+
+
+def _to_sparse_matrix(X):
+    """Convert a DataFrame of sparse columns to a CSR matrix.
+
+    Args:
+        X: input data
+
+    Returns:
+        X as a CSR matrix if it only has sparse columns, otherwise X.
+
+    """
+    if is_sparse_frame(X):
+        return X.sparse.to_coo().tocsr()
+    return X
 
 
 class TruncatedSVDWrapper(TruncatedSVD):
-    """A wrapper of the Sklearn TruncatedSVD class."""
+    """A wrapper of the Sklearn TruncatedSVD class.
+
+    DataFrames of sparse columns are reduced as CSR matrices, instead of
+    being converted to dense arrays by the input validation of Sklearn.
+
+    """
 
     def fit_transform(self, X, y=None):
         """Fit LSI model to X and perform dimensionality reduction on X.
@@ -24,6 +45,7 @@ class TruncatedSVDWrapper(TruncatedSVD):
                 Reduced version of X. This will always be a dense array.
 
         """
+        X = _to_sparse_matrix(X)
         n_features = X.shape[1]
         if self.n_components > n_features:
             logging.warning(
@@ -36,3 +58,17 @@ class TruncatedSVDWrapper(TruncatedSVD):
             self.n_components = n_features - 1
         res = super().fit_transform(X=X, y=y)
         return res
+
+    def transform(self, X):
+        """Perform dimensionality reduction on X.
+
+        Args:
+            X: {array-like, sparse matrix}, shape (n_samples, n_features)
+            New data  # noqa
+
+        Returns:
+            X_new : array, shape (n_samples, n_components)
+                Reduced version of X. This will always be a dense array.
+
+        """
+        return super().transform(_to_sparse_matrix(X))
@@ -203,3 +203,21 @@ def is_wrapped(transformer):
 
     """
     return hasattr(transformer, "is_wrapped")
+
+
+def is_sparse_frame(X):
+    """Check if X is a DataFrame made only of sparse columns.
+
+    Args:
+        X: input data
+
+    Returns:
+        bool: True if X is a DataFrame whose columns all have a SparseDtype,
+            otherwise False.
+
+    """
+    return (
+        isinstance(X, pd.DataFrame)
+        and len(X.columns) > 0
+        and all(isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes)
+    )
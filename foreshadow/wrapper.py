@@ -3,9 +3,11 @@
 import numpy as np
 import pandas as pd
 import scipy
+from sklearn.base import TransformerMixin
+from sklearn.pipeline import Pipeline
 
 from foreshadow.logging import logging
-from foreshadow.utils import check_df, is_transformer
+from foreshadow.utils import check_df, is_sparse_frame, is_transformer
 
 
 def pandas_wrap(transformer):  # noqa
@@ -122,7 +124,7 @@ def pandas_wrap(transformer):  # noqa
             df = check_df(X)
 
             func = super(DFTransformer, self).fit
-            out = func(df, *args, **kwargs)
+            out = _call_with_sparse_input(self, func, df, *args, **kwargs)
             return out
 
         def transform(self, X, y=None, *args, **kwargs):
@@ -148,7 +150,7 @@ def pandas_wrap(transformer):  # noqa
             init_cols = [str(col) for col in df]
             func = super(DFTransformer, self).transform
 
-            out = func(df, *args, **kwargs)
+            out = _call_with_sparse_input(self, func, df, *args, **kwargs)
             # determine name of new columns
             name = getattr(self, "name", type(self).__name__)
             out_is_transformer = hasattr(out, "__class__") and is_transformer(
@@ -170,9 +172,12 @@ def pandas_wrap(transformer):  # noqa
                         out, df, init_cols, name
                     )
                 elif scipy.sparse.issparse(out):
-                    out = out.toarray()
-                    out, graph = _ndarray_post_process(
-                        out, df, init_cols, name
+                    out, graph = _sparse_post_process(
+                        out,
+                        df,
+                        init_cols,
+                        name,
+                        keep_sparse=getattr(self, "keep_sparse", False),
                     )
                 elif isinstance(out, pd.Series):
                     graph = []  # just return the series
@@ -236,9 +241,12 @@ def pandas_wrap(transformer):  # noqa
                         out, df, init_cols, name
                     )
                 elif scipy.sparse.issparse(out):
-                    out = out.toarray()
-                    out, graph = _ndarray_post_process(
-                        out, df, init_cols, name
+                    out, graph = _sparse_post_process(
+                        out,
+                        df,
+                        init_cols,
+                        name,
+                        keep_sparse=getattr(self, "keep_sparse", False),
                     )
                 elif isinstance(out, pd.Series):
                     graph = []  # just return the series
@@ -263,7 +271,12 @@ def pandas_wrap(transformer):  # noqa
             kwargs.pop("full_df", None)
             init_cols = [str(col) for col in df]
             func = super(DFTransformer, self).fit_transform
-            out = func(df, *args, **kwargs)
+            if transformer.fit_transform is TransformerMixin.fit_transform:
+                # calls the fit and transform above, which handle the
+                # sparse inputs
+                out = func(df, *args, **kwargs)
+            else:
+                out = _call_with_sparse_input(self, func, df, *args, **kwargs)
 
             # determine name of new columns
             name = getattr(self, "name", type(self).__name__)
@@ -286,9 +299,12 @@ def pandas_wrap(transformer):  # noqa
                         out, df, init_cols, name
                     )
                 elif scipy.sparse.issparse(out):
-                    out = out.toarray()
-                    out, graph = _ndarray_post_process(
-                        out, df, init_cols, name
+                    out, graph = _sparse_post_process(
+                        out,
+                        df,
+                        init_cols,
+                        name,
+                        keep_sparse=getattr(self, "keep_sparse", False),
                     )
                 elif isinstance(out, pd.Series):
                     graph = []  # just return the series
@@ -345,6 +361,105 @@ def _keep_columns_process(out, dataframe, prefix, graph):
     return pd.concat([dataframe, out], axis=1)
 
 
+def _call_with_sparse_input(transformer, func, df, *args, **kwargs):
+    """Call a method of a transformer on the sparse matrix of a DataFrame.
+
+    The DataFrames made only of sparse columns are given to the transformers
+    keeping their sparse outputs as CSR matrices, as the input validation of
+    Sklearn would otherwise convert them to dense arrays.
+
+    Args:
+        transformer: the DataFrame wrapped transformer
+        func: the method of the wrapped transformer
+        df: the input DataFrame
+        *args: arguments to func
+        **kwargs: keyword arguments to func
+
+    Returns:
+        the output of func.
+
+    """
+    if getattr(transformer, "keep_sparse", False) and is_sparse_frame(df):
+        try:
+            return func(df.sparse.to_coo().tocsr(), *args, **kwargs)
+        except (TypeError, ValueError) as e:
+            # Sklearn raises these errors for the transformers that need
+            # dense data, such as the scalers centering their inputs.
+            logging.debug(
+                "{} does not accept sparse inputs: {}".format(transformer, e)
+            )
+    return func(df, *args, **kwargs)
+
+
+def keep_sparse_outputs(transformer):
+    """Keep the sparse outputs of the DataFrame wrapped transformers.
+
+    Recurses into the steps of Pipelines. The sparse outputs of the
+    transformers are then returned as sparse DataFrame columns instead of
+    being converted to dense arrays.
+
+    Args:
+        transformer: a transformer or a Pipeline
+
+    """
+    if isinstance(transformer, Pipeline):
+        for _, step in transformer.steps:
+            keep_sparse_outputs(step)
+    elif getattr(transformer, "is_wrapped", False):
+        transformer.keep_sparse = True
+
+
+def _output_columns(df, n_columns):
+    """Name the columns of a sklearn public function output.
+
+    Args:
+        df: the input DataFrame of the public function
+        n_columns: the number of columns of the output
+
+    Returns:
+        the names of the output columns.
+
+    """
+    # try to intelligently name the columns, based off initial df columns
+    if len(df.columns) == n_columns:  # the number of columns
+        # match, so we don't have to do anything
+        return df.columns
+    elif len(df.columns) == 1:  # all new columns came from 1 column
+        return [str(df.columns[0]) + "_{}".format(i) for i in range(n_columns)]
+    # all new columns came from a mix of columns
+    df_columns = "_".join(df.columns)
+    return [df_columns + "|{}".format(i) for i in range(n_columns)]
+
+
+def _sparse_post_process(matrix, df, init_cols, prefix, keep_sparse=False):
+    """Create dataframe from sklearn public function sparse matrix.
+
+    Args:
+        matrix: the output sparse matrix from the sklearn public function
+        df: pandas.DataFrame
+        init_cols: the initial columns before public function call
+        prefix: prefix for each column (unique name)
+        keep_sparse: whether to keep the output as sparse columns instead of
+            converting it to a dense array
+
+    Returns:
+        mimicked DataFrame for the sparse matrix, with column names, list of
+            info to graph in ColumnSharer
+
+    """
+    if not keep_sparse or matrix.shape[1] == 0:
+        return _ndarray_post_process(matrix.toarray(), df, init_cols, prefix)
+    columns = _output_columns(df, matrix.shape[1])
+    graph = [
+        "{}_{}_{}".format("_".join(init_cols), prefix, i)
+        for i in range(matrix.shape[1])
+    ]
+    out = pd.DataFrame.sparse.from_spmatrix(
+        matrix, index=df.index, columns=columns
+    )
+    return out, graph
+
+
 def _ndarray_post_process(ndarray, df, init_cols, prefix):
     """Create dataframe from sklearn public function ndarray.
 
@@ -364,20 +479,7 @@ def _ndarray_post_process(ndarray, df, init_cols, prefix):
 
     if ndarray.size == 0:
         return pd.DataFrame([]), ["{}_{}".format("_".join(init_cols), prefix)]
-    # try to intelligently name ndarray columns, based off initial df columns
-    if len(df.columns) == ndarray.shape[1]:  # the number of columns
-        # match, so we don't have to do anything
-        columns = df.columns
-    elif len(df.columns) == 1:  # all new columns came from 1 column
-        columns = [
-            str(df.columns[0]) + "_{}".format(i)
-            for i in range(ndarray.shape[1])
-        ]
-    else:  # all new columns came from a mix of columns
-        df_columns = "_".join(df.columns)
-        columns = [
-            df_columns + "|{}".format(i) for i in range(ndarray.shape[1])
-        ]
+    columns = _output_columns(df, ndarray.shape[1])
     # Append new columns to data frame
     kw = {}
     for i, col in enumerate(ndarray.transpose().tolist()):
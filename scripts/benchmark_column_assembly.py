@@ -0,0 +1,99 @@
+"""Benchmark the assembly of the outputs of a ColumnTransformerWrapper.
+
+Stacks one single-column DataFrame per column, as a PreparerStep does, with
+pd.concat and with the preallocated assembly of ColumnTransformerWrapper,
+then computes the mean of the numeric columns of the result, as a proxy for
+the next step, which runs once per block of the frame.
+
+Usage:
+    python scripts/benchmark_column_assembly.py [--rows N] [--repeat R]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from foreshadow.ColumnTransformerWrapper import _assemble_frames
+
+
+def make_outputs(n_columns, n_rows, mixed, random_state=0):
+    """Return one single-column DataFrame per column.
+
+    Args:
+        n_columns: the number of DataFrames.
+        n_rows: the number of rows of each DataFrame.
+        mixed: whether to mix float, integer and object columns instead of
+            only float columns.
+        random_state: the seed of the values.
+
+    Returns:
+        list: the single-column DataFrames.
+
+    """
+    rng = np.random.RandomState(random_state)
+    outputs = []
+    for i in range(n_columns):
+        values = rng.randn(n_rows)
+        if mixed and i % 3 == 1:
+            values = rng.randint(0, 10, n_rows)
+        elif mixed and i % 3 == 2:
+            values = values.astype(str).astype(object)
+        outputs.append(pd.DataFrame({"column_{}".format(i): values}))
+    return outputs
+
+
+def best_seconds(assemble, outputs_args, repeat):
+    """Return the best time to assemble the outputs and use the result.
+
+    Args:
+        assemble: the function stacking a list of DataFrames.
+        outputs_args: the arguments of make_outputs.
+        repeat: the number of times to time the assembly.
+
+    Returns:
+        float: the shortest time, in seconds.
+
+    """
+    times = []
+    for _ in range(repeat):
+        # Fresh outputs, as the frames cache the columns read before
+        outputs = make_outputs(*outputs_args)
+        start = time.perf_counter()
+        assemble(outputs).mean(numeric_only=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Print the time of both assemblies for 1k and 10k columns."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        "{:<10}{:<8}{:>12}{:>14}".format(
+            "columns", "dtypes", "concat (s)", "assembly (s)"
+        )
+    )
+    for n_columns in (1000, 10000):
+        for mixed in (False, True):
+            outputs_args = (n_columns, args.rows, mixed)
+            concat = best_seconds(
+                lambda outputs: pd.concat(outputs, axis=1),
+                outputs_args,
+                args.repeat,
+            )
+            assembly = best_seconds(
+                _assemble_frames, outputs_args, args.repeat
+            )
+            print(
+                "{:<10}{:<8}{:>12.3f}{:>14.3f}".format(
+                    n_columns, "mixed" if mixed else "float", concat, assembly
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
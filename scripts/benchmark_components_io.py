@@ -0,0 +1,80 @@
+"""Benchmark the cold start of the intent resolver components.
+
+Converts a pickle of resolver components into the compact `.npz` archive and
+reports the time needed to load each format in a fresh interpreter, so that
+module imports and the page cache of a previous run do not skew the results.
+
+Usage:
+    python scripts/benchmark_components_io.py [--components PATH] [--repeat R]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+from foreshadow.smart.intent_resolving.core import io
+
+
+LOAD_SNIPPET = """
+import time
+import sklearn.ensemble, sklearn.linear_model, sklearn.preprocessing
+from foreshadow.smart.intent_resolving.core import io
+start = time.perf_counter()
+io.load_components({path!r})
+print(time.perf_counter() - start)
+"""
+
+
+def cold_load_seconds(path, repeat):
+    """Return the best time to load `path` in a fresh interpreter.
+
+    Args:
+        path: the path of the components to load.
+        repeat: the number of fresh interpreters to time.
+
+    Returns:
+        float: the shortest load time, in seconds.
+
+    """
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", LOAD_SNIPPET.format(path=path)],
+            check=True,
+            stdout=subprocess.PIPE,
+        ).stdout
+        times.append(float(output.decode().strip().splitlines()[-1]))
+    return min(times)
+
+
+def main():
+    """Print the size and cold load time of both formats."""
+    default_path = os.path.join(
+        os.path.dirname(io.__file__),
+        "intent_resolver",
+        "resolver_components.pkl",
+    )
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", default=default_path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        npz_path = os.path.join(tmpdir, "resolver_components.npz")
+        io.export_components(args.components, npz_path)
+
+        print("{:<8}{:>14}{:>14}".format("format", "size (MB)", "load (s)"))
+        results = []
+        for name, path in (("pickle", args.components), ("npz", npz_path)):
+            results.append(cold_load_seconds(path, args.repeat))
+            print(
+                "{:<8}{:>14.2f}{:>14.3f}".format(
+                    name, os.path.getsize(path) / 2 ** 20, results[-1]
+                )
+            )
+        print("speedup: {:.1f}x".format(results[0] / results[1]))
+
+
+if __name__ == "__main__":
+    main()
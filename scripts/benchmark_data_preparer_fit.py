@@ -0,0 +1,138 @@
+"""Benchmark the fit of a DataPreparer.
+
+Compares DataPreparer.fit, where each step transforms the training data in
+the same pass as its fit, with fitting then transforming each step, which
+transforms the training data a second time, as the steps did before having
+their own fit_transform.
+
+The intents of the columns are overridden, so that the benchmark does not
+depend on the intent resolution model.
+
+Usage:
+    python scripts/benchmark_data_preparer_fit.py [--rows N] [--repeat R]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from foreshadow.cachemanager import CacheManager
+from foreshadow.intents import IntentType
+from foreshadow.preparer import DataPreparer
+from foreshadow.utils import AcceptedKey, ConfigKey, Override
+
+
+def make_data(n_rows, random_state=0):
+    """Return a DataFrame with numeric, financial and categorical columns.
+
+    Args:
+        n_rows: the number of rows.
+        random_state: the seed of the values.
+
+    Returns:
+        pd.DataFrame: four columns of each kind.
+
+    """
+    rng = np.random.RandomState(random_state)
+    data = {}
+    for i in range(4):
+        data["numeric_{}".format(i)] = rng.randn(n_rows)
+        data["financial_{}".format(i)] = [
+            "${:,.2f}".format(value) for value in rng.rand(n_rows) * 1e4
+        ]
+        data["categorical_{}".format(i)] = rng.choice(
+            ["a", "b", "c", "d"], n_rows
+        )
+    return pd.DataFrame(data)
+
+
+def make_preparer(X, export_dir):
+    """Return a DataPreparer with the intents of X overridden.
+
+    Args:
+        X: the DataFrame to prepare.
+        export_dir: the directory of the exported training data.
+
+    Returns:
+        DataPreparer: the unfitted DataPreparer.
+
+    """
+    cache_manager = CacheManager()
+    for column in X.columns:
+        intent = (
+            IntentType.CATEGORICAL
+            if column.startswith("categorical")
+            else IntentType.NUMERIC
+        )
+        cache_manager[AcceptedKey.OVERRIDE][
+            "_".join([Override.INTENT, column])
+        ] = intent
+        cache_manager[AcceptedKey.INTENT][column] = intent
+    cache_manager[AcceptedKey.CONFIG][
+        ConfigKey.PROCESSED_TRAINING_DATA_EXPORT_PATH
+    ] = os.path.join(export_dir, "processed_training_data.csv")
+    return DataPreparer(cache_manager=cache_manager)
+
+
+def fit_in_two_passes(preparer, X):
+    """Fit then transform each step, as a Pipeline did before.
+
+    Args:
+        preparer: the DataPreparer to fit.
+        X: the training data.
+
+    """
+    preparer._draw_row_sample(X, None)
+    Xt = X
+    for _, step in preparer.steps[:-1]:
+        Xt = step.fit(Xt).transform(Xt)
+    preparer.steps[-1][1].fit(Xt)
+
+
+def best_seconds(fit, X, export_dir, repeat):
+    """Return the best time to fit a new DataPreparer on X.
+
+    Args:
+        fit: the function fitting a DataPreparer on X.
+        X: the training data.
+        export_dir: the directory of the exported training data.
+        repeat: the number of DataPreparers to fit.
+
+    Returns:
+        float: the shortest fit time, in seconds.
+
+    """
+    times = []
+    for _ in range(repeat):
+        preparer = make_preparer(X, export_dir)
+        start = time.perf_counter()
+        fit(preparer, X)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Print the time of both fits for several numbers of rows."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("{:<10}{:>16}{:>14}".format("rows", "two passes (s)", "fused (s)"))
+    with tempfile.TemporaryDirectory() as export_dir:
+        for n_rows in (args.rows // 10, args.rows):
+            X = make_data(n_rows)
+            two_passes = best_seconds(
+                fit_in_two_passes, X, export_dir, args.repeat
+            )
+            fused = best_seconds(
+                lambda preparer, X: preparer.fit(X), X, export_dir, args.repeat
+            )
+            print("{:<10}{:>16.3f}{:>14.3f}".format(n_rows, two_passes, fused))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Micro-benchmark the intent resolution heuristics.
+
+Reports the throughput (rows / second) of every heuristic implemented in both
+`heuristics` (reference) and `vectorized_heuristics` on a synthetic frame of
+mixed columns.
+
+Usage:
+    python scripts/benchmark_heuristics.py [--rows N] [--repeat R]
+"""
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from foreshadow.smart.intent_resolving.core import (
+    heuristics,
+    vectorized_heuristics,
+)
+
+
+SERIES_HEURISTICS = [
+    "is_number_as_string",
+    "numeric_extractable",
+    "_maybe_zipcode",
+]
+FRAME_HEURISTICS = [
+    "avg_val_len",
+    "stddev_val_len",
+    "maybe_zipcode",
+    "contains_structure",
+]
+# Heuristics applied to the metafeatures (samples) of the columns
+METAFEATURE_HEURISTICS = ["maybe_datetime"]
+
+
+def make_frame(n_rows, seed=0):
+    """Build a frame of mixed columns similar to raw user data.
+
+    Args:
+        n_rows: the number of rows
+        seed: the seed of the random values
+
+    Returns:
+        the DataFrame of mixed columns.
+
+    """
+    rng = np.random.RandomState(seed)
+
+    def choice(values):
+        return np.array(values, dtype="object")[
+            rng.randint(0, len(values), n_rows)
+        ]
+
+    return pd.DataFrame(
+        {
+            "zip": rng.randint(10000, 99999, n_rows).astype(str),
+            "money": choice(["$1.00", "$12.50", "$1,000", "$0.99"]),
+            "floats": rng.randn(n_rows),
+            "ints": rng.randint(0, 100, n_rows),
+            "text": choice(["hello world", "foo, bar", "(x)", None]),
+            "dates": choice(["2019-01-01", "12/31/2019", "12:30 PM"]),
+        }
+    )
+
+
+def make_metafeatures(df, n_rows, n_samples=5, seed=0):
+    """Build sample metafeatures of the columns of a frame.
+
+    Args:
+        df: the DataFrame to sample
+        n_rows: the number of rows, each describing a column of df
+        n_samples: the number of sampled values per row
+        seed: the seed of the sampling
+
+    Returns:
+        the DataFrame of metafeatures.
+
+    """
+    rng = np.random.RandomState(seed)
+    columns = np.array(df.columns)[np.arange(n_rows) % df.shape[1]]
+    samples = []
+    for _ in range(n_samples):
+        positions = rng.randint(0, len(df), n_rows)
+        samples.append(
+            [
+                str(df[column].iat[position])
+                for column, position in zip(columns, positions)
+            ]
+        )
+    metafeatures = pd.DataFrame({"attribute_name": columns})
+    for i, values in enumerate(samples, 1):
+        metafeatures["sample{}".format(i)] = values
+    metafeatures["samples_set"] = [str(set(row)) for row in zip(*samples)]
+    return metafeatures
+
+
+def rows_per_second(func, n_rows, repeat):
+    """Run `func` `repeat` times and return the best rows / second.
+
+    Args:
+        func: the function to time, without arguments
+        n_rows: the number of rows processed by func
+        repeat: the number of times to run func
+
+    Returns:
+        the number of rows per second of the fastest run.
+
+    """
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    return n_rows / best
+
+
+def main():
+    """Print a table of rows / second for every heuristic and backend."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    metafeatures = make_metafeatures(df, args.rows)
+    # Exclude the one-off construction of the unicode digit pattern
+    vectorized_heuristics._any_digit_pattern()
+
+    print(
+        "{:<22}{:>16}{:>16}{:>10}".format(
+            "heuristic", "reference", "vectorized", "speedup"
+        )
+    )
+    for name in SERIES_HEURISTICS + FRAME_HEURISTICS + METAFEATURE_HEURISTICS:
+        results = []
+        for module in (heuristics, vectorized_heuristics):
+            heuristic = getattr(module, name)
+            if name in SERIES_HEURISTICS:
+
+                def func():
+                    for column in df:
+                        heuristic(df[column])
+
+            elif name in METAFEATURE_HEURISTICS:
+
+                def func():
+                    heuristic(metafeatures)
+
+            else:
+
+                def func():
+                    heuristic(df)
+
+            results.append(rows_per_second(func, args.rows, args.repeat))
+        print(
+            "{:<22}{:>16,.0f}{:>16,.0f}{:>9.1f}x".format(
+                name, results[0], results[1], results[1] / results[0]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()